@@ -0,0 +1,248 @@
+"""
+Reproducible Benchmarks of the data load, tick streaming, and indicator fan-out paths.
+
+Runs against a headless Window so no display is needed. Results are written as JSON so they can
+be compared between commits:
+
+    python examples/98_benchmarks/benchmarks.py -o before.json
+    python examples/98_benchmarks/benchmarks.py -o after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+from statistics import mean, median
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+import lightweight_pycharts as lwc
+from lightweight_pycharts import indicators
+from lightweight_pycharts.js_cmd import dump
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    OhlcData,
+    Series_DF,
+    SingleValueData,
+    Whitespace_DF,
+    update_dataframe,
+)
+
+RESULTS: dict[str, dict] = {}
+
+
+def ohlcv(n_bars: int, end: str = "2023-01-05 15:00") -> pd.DataFrame:
+    "Random walk of 1 minute OHLCV bars. The last bar opens at a valid NASDAQ bar time"
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, n_bars))
+    spread = np.abs(rng.normal(0, 0.05, n_bars))
+    return pd.DataFrame(
+        {
+            "time": pd.date_range(end=end, periods=n_bars, freq="1min", tz="UTC"),
+            "open": np.roll(close, 1),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(100, 10_000, n_bars),
+        }
+    )
+
+
+def bench(name: str, func: Callable[[], object], repeat: int = 5, ops: int = 1, **extra):
+    "Time func() 'repeat' times. 'ops' is the number of operations a single call performs"
+    times = []
+    for _ in range(repeat):
+        t0 = perf_counter()
+        func()
+        times.append(perf_counter() - t0)
+
+    RESULTS[name] = {
+        "mean_s": mean(times),
+        "median_s": median(times),
+        "min_s": min(times),
+        "per_op_us": min(times) / ops * 1e6,
+        "repeat": repeat,
+        "ops": ops,
+        **extra,
+    }
+    print(f"{name:<45} {min(times) / ops * 1e6:>12.2f} us/op  (min of {repeat})")
+
+
+# region --------------------------------- Benchmarks --------------------------------- #
+
+
+def bench_set_data(frame: lwc.ChartingFrame, sizes: list[int]):
+    for n in sizes:
+        df = ohlcv(n)
+        bench(
+            f"series.set_data[{n}]",
+            lambda: frame.main_series.set_data(df.copy()),
+            repeat=3,
+        )
+
+
+def bench_tick_updates(frame: lwc.ChartingFrame, n_ticks: int):
+    frame.main_series.set_data(ohlcv(10_000))
+    start = frame.main_series.main_data.curr_bar_open_time  # type: ignore
+    # 60 ticks per bar, so both the tick and new bar paths are exercised
+    ticks = [
+        SingleValueData(start + pd.Timedelta(seconds=i), 100 + (i % 13) * 0.01)
+        for i in range(n_ticks)
+    ]
+
+    def run():
+        for tick in ticks:
+            frame.main_series.update_data(tick)
+
+    bench("series.update_data[ticks]", run, repeat=1, ops=n_ticks)
+
+
+def bench_fan_out(frame: lwc.ChartingFrame, n_indicators: list[int], n_ticks: int):
+    for n in n_indicators:
+        frame.main_series.set_data(ohlcv(10_000))
+        smas = [
+            indicators.SMA(frame, indicators.sma.SMAOptions(period=5 + i))
+            for i in range(n)
+        ]
+        start = frame.main_series.main_data.curr_bar_open_time  # type: ignore
+        ticks = [
+            SingleValueData(start + pd.Timedelta(seconds=i), 100 + (i % 13) * 0.01)
+            for i in range(n_ticks)
+        ]
+
+        def run():
+            for tick in ticks:
+                frame.main_series.update_data(tick)
+
+        bench(f"watcher.fan_out[{n} SMA]", run, repeat=1, ops=n_ticks)
+        for sma in smas:
+            sma.delete()
+
+
+def bench_update_dataframe(n_appends: int):
+    base = ohlcv(10_000).set_index("time")
+    start = base.index[-1]
+    bars = [
+        OhlcData(start + pd.Timedelta(minutes=i + 1), 1, 2, 0, 1, volume=1)
+        for i in range(n_appends)
+    ]
+
+    def run_df():
+        df = base.copy()
+        for bar in bars:
+            df = update_dataframe(df, bar)
+
+    def run_store():
+        store = BarStore(base)
+        for bar in bars:
+            update_dataframe(store, bar)
+
+    bench("update_dataframe[pd.DataFrame]", run_df, repeat=1, ops=n_appends)
+    bench("update_dataframe[BarStore]", run_store, repeat=3, ops=n_appends)
+
+
+def bench_whitespace(n_extends: int):
+    for exchange in ["NASDAQ", None]:
+        name = exchange if exchange is not None else "24/7"
+        base = Series_DF(ohlcv(1_000), exchange)
+        bench(f"whitespace.init[{name}]", lambda: Whitespace_DF(base), repeat=3)
+
+        ws = Whitespace_DF(base)
+        bench(
+            f"whitespace.extend[{name}]",
+            lambda: [ws.extend() for _ in range(n_extends)],
+            repeat=1,
+            ops=n_extends,
+        )
+
+
+def bench_json_encoder(sizes: list[int]):
+    for n in sizes:
+        df = ohlcv(n)
+        bench(
+            f"ORM_JSONEncoder.dump[{n}]",
+            lambda: dump(df),
+            repeat=3,
+            bytes=len(dump(df)),
+        )
+
+
+# endregion
+
+
+def compare(old_file: str):
+    "Print the ratio of each per-op time against a previous results file"
+    with open(old_file, encoding="UTF-8") as f:
+        old = json.load(f)["results"]
+
+    print(f"\n{'benchmark':<45} {'old us/op':>12} {'new us/op':>12} {'ratio':>8}")
+    for name, res in RESULTS.items():
+        if name in old:
+            prev, curr = old[name]["per_op_us"], res["per_op_us"]
+            print(f"{name:<45} {prev:>12.2f} {curr:>12.2f} {curr / prev:>8.2f}")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main(args: argparse.Namespace):
+    window = lwc.Window(headless=True)
+    frame = window.new_tab().frames[0]
+    assert isinstance(frame, lwc.ChartingFrame)
+
+    bench_set_data(frame, args.sizes)
+    bench_tick_updates(frame, args.ticks)
+    bench_fan_out(frame, args.indicators, args.ticks)
+    bench_update_dataframe(args.appends)
+    bench_whitespace(args.appends)
+    bench_json_encoder(args.sizes)
+
+    window.close()
+    await window.await_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("-o", "--output", default="benchmarks.json")
+    parser.add_argument("--compare", default=None, help="Previous results JSON file")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--ticks", type=int, default=5_000)
+    parser.add_argument("--appends", type=int, default=1_000)
+    parser.add_argument("--indicators", type=int, nargs="+", default=[1, 10, 50])
+    cli_args = parser.parse_args()
+
+    asyncio.run(main(cli_args))
+
+    with open(cli_args.output, "w", encoding="UTF-8") as file:
+        json.dump(
+            {
+                "meta": {
+                    "commit": git_commit(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "timestamp": pd.Timestamp.now(tz="UTC").isoformat(),
+                },
+                "results": RESULTS,
+            },
+            file,
+            indent=2,
+        )
+    print(f"\nResults written to {cli_args.output}")
+
+    if cli_args.compare is not None:
+        compare(cli_args.compare)
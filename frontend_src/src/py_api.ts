@@ -47,6 +47,9 @@ export class py_api {
     data_request = (container_id: string, frame_id: string, symbol: symbol_item, tf: string) => {
         console.log(`Data Request: ${container_id},${frame_id},${symbol},${tf}`)
     };
+    range_change = (container_id: string, frame_id: string, from: number, to: number) => {
+        console.log(`Range Change: ${container_id},${frame_id},${from},${to}`)
+    };
     symbol_search = (symbol: string, types: string[], brokers: string[], exchanges: string[], confirmed: boolean) => {
         console.log(`Search Request: ${symbol},${types},${brokers},${exchanges},${confirmed}`)
     };
@@ -18,6 +18,8 @@ from lightweight_pycharts import indicators
 
 from .window import Window, Container, Frame
 from .charting_frame import ChartingFrame
+from .data_cache import DataCache
+from .data_hub import DataHub
 from .orm.types import TF, Color, Symbol
 from .orm.enum import layouts, ColorLiteral
 from .orm.series import SeriesType
@@ -27,6 +29,8 @@ __all__ = (
     "Container",
     "Frame",
     "ChartingFrame",
+    "DataCache",
+    "DataHub",
     #
     # Types
     "TF",
@@ -3,11 +3,10 @@
 from __future__ import annotations
 import logging
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
-from lightweight_pycharts import TF, Symbol
-
 from . import util
 from . import indicators
 from . import window as win
@@ -31,6 +30,7 @@ class ChartingFrame(win.Frame):
     """
 
     Frame_Type = win.FrameTypes.CHART
+    BACKFILL_MARGIN = 50  # Min number of bars left of the visible range before back-filling
 
     def __init__(self, parent: win.Container, _js_id: Optional[str] = None) -> None:
         super().__init__(parent, _js_id)
@@ -39,14 +39,30 @@ class ChartingFrame(win.Frame):
         # See Indicator DocString for reasoning.
         self.panes = util.ID_Dict[Pane](f"{self._js_id}_p")
         self.indicators = util.ID_Dict[ind.Indicator]("i")
+        self.indicator_graph = ind.IndicatorGraph(self.indicators)
+
+        # Infinite History State. See set_bars_back()
+        self.bars_back: Optional[int] = None
+        self.display_start: Optional[pd.Timestamp] = None
 
         # Add main pane and Series, neither should ever be deleted
-        self.add_pane(Pane.__special_id__)
+        main_pane = self.add_pane(Pane.__special_id__)
+        # The Main Pane's visible range drives the back-filling of history
+        self._fwd_queue.put(
+            (
+                JS_CMD.WATCH_VISIBLE_RANGE,
+                parent._js_id,
+                self._js_id,
+                main_pane.js_id,
+                self.BACKFILL_MARGIN,
+            )
+        )
         indicators.Series(self, js_id=indicators.Series.__special_id__)
 
     def __del__(self):
         for indicator in self.indicators.copy().values():
             indicator.delete()
+        self.set_recalc_workers(None)
         logger.debug("Deleteing Frame: %s", self._js_id)
 
     # region ------------- Dunder Control Functions ------------- #
@@ -60,6 +76,38 @@ class ChartingFrame(win.Frame):
     def __update_whitespace__(self, data: AnyBasicData, p_data: SingleValueData):
         self._fwd_queue.put((JS_CMD.UPDATE_WHITESPACE_DATA, self._js_id, data, p_data))
 
+    def __set_display_start__(self, index: Optional[pd.DatetimeIndex]):
+        "Reset the first displayed bar time given the time index of the Frame's main dataset"
+        if self.bars_back is None or index is None or len(index) <= self.bars_back:
+            self.display_start = None
+        else:
+            self.display_start = index[-self.bars_back]
+
+    def __range_change__(self, logical_from: float, logical_to: float):
+        """
+        Back-fill the next chunk of history, one 'bars_back' long, to every series in the Frame.
+        Called when the left edge of the visible logical range nears the first displayed bar.
+        """
+        if self.bars_back is None or self.display_start is None:
+            return
+        if logical_from > max(logical_to - logical_from, self.BACKFILL_MARGIN):
+            return  # More than a screen's width of bars remain to the left.
+
+        main_data = self.main_series.main_data
+        if main_data is None:
+            return
+        index = main_data.df.index
+        start = int(index.searchsorted(self.display_start))
+        if start == 0:
+            return
+        new_start = max(start - self.bars_back, 0)
+        # None == Display Everything, No more to back-fill after this
+        self.display_start = index[new_start] if new_start > 0 else None
+
+        for indicator in self.indicators.values():
+            for series in indicator._series.values():
+                series.__backfill__(self.display_start)
+
     # endregion
 
     def add_pane(self, js_id: Optional[str] = None) -> Pane:
@@ -89,6 +137,48 @@ class ChartingFrame(win.Frame):
             return main_series
         raise AttributeError(f"Cannot find Main Series for Frame {self._js_id}")
 
+    def set_render_rate(self, max_rate: Optional[float]):
+        "Limit the rate, in Hz, that tick updates are displayed. See Series.set_render_rate()"
+        self.main_series.set_render_rate(max_rate)
+
+    def set_bars_back(self, bars_back: Optional[int]):
+        """
+        Limit the data sent to the screen to the most recent 'bars_back' bars of the main series.
+        Older bars are back-filled, in chunks of 'bars_back', to every series in the Frame as
+        they are scrolled into view. None displays the entire dataset.
+
+        Each back-filled chunk re-sets the displayed data of every series on screen, so a
+        'bars_back' that is too small for how far the chart is scrolled costs more than it saves.
+
+        Takes effect the next time the Frame's main series data is set.
+        """
+        if bars_back is not None and bars_back < 1:
+            raise ValueError("bars_back must be >= 1")
+        self.bars_back = bars_back
+
+    def set_recalc_workers(self, workers: Optional[int]):
+        """
+        Opt-in parallel historical recalculation. When given a number of workers the set_data
+        calls of independent Indicator branches, e.g. on a symbol change, run concurrently in a
+        thread pool of that size. Vectorized numpy/pandas calculations release the GIL for much
+        of their work. Dependent Indicators still run after all of their sources, and results
+        are displayed from the event loop in dependency order. None or 0 recalculates serially
+        on the event loop.
+
+        This shortens a recalculation, it does not move it off of the event loop. The loop waits
+        on each level of the recalculation, so the UI is still unresponsive until it completes.
+
+        Indicators that run concurrently must not mutate state shared with one another.
+        """
+        executor = self.indicator_graph.executor
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.indicator_graph.executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lwpc_recalc")
+            if workers
+            else None
+        )
+
     # region ------------- Indicator Functions ------------- #
 
     def get_indicators_of_type[T: ind.Indicator](self, _type: type[T]) -> dict[str, T]:
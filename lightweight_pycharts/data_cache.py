@@ -0,0 +1,267 @@
+"""
+On-Disk Cache of normalized data_request results, keyed by Symbol & Timeframe.
+
+Each entry is a directory of Arrow IPC (Feather V2) or Parquet segments alongside a small json
+file of the Series_DF attributes. Segments are memory-mapped when read and new bars are written
+as additional segments, so a cached dataset is never rewritten just to append to it.
+
+Pyarrow is an optional dependency. It is imported on first use rather than with the module.
+"""
+
+from __future__ import annotations
+import os
+import json
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from threading import Lock
+from typing import Literal, Optional
+
+import pandas as pd
+
+from .orm.types import TF, Symbol
+from .orm.series import Series_DF
+
+logger = logging.getLogger("lightweight-pycharts")
+
+
+def _pa():
+    "Lazily import pyarrow"
+    # pylint: disable=import-outside-toplevel
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("DataCache requires pyarrow: 'pip install pyarrow'") from e
+    return pa
+
+
+class DataCache:
+    """
+    Opt-in on-disk cache of the Series_DF a Frame's main series creates from a data_request.
+    Give an instance to the Window to enable it, i.e. Window(data_cache=DataCache(path)).
+
+    A cached (Symbol, TF) is loaded directly into a Series_DF, skipping both the data_request
+    handler and the normalization of the data. Bars received by the Series after it was loaded
+    are appended to the entry when the Frame switches away from the Symbol or the Window closes.
+
+    Args:
+        Param: directory
+            Root directory of the cache. Created if it does not exist.
+        Param: max_bytes
+            Size limit of the cache. Least Recently Used entries are deleted once exceeded.
+        Param: fmt
+            'arrow' (Arrow IPC / Feather V2) or 'parquet'. Arrow is larger on disk but is faster
+            to read since it is memory-mapped without decompression.
+        Param: max_age
+            Optional age after which an entry is ignored and re-requested.
+    """
+
+    MAX_SEGMENTS = 16  # Segments are compacted into one once an entry has this many
+    META_FILE = "meta.json"
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 2**30,
+        fmt: Literal["arrow", "parquet"] = "arrow",
+        max_age: Optional[pd.Timedelta] = None,
+    ):
+        _pa()  # Fail early if pyarrow isn't installed
+        if fmt not in ("arrow", "parquet"):
+            raise ValueError(f"Unknown DataCache format '{fmt}'")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.fmt = fmt
+        self.max_age = max_age
+        self._lock = Lock()
+
+    @staticmethod
+    def key(symbol: Symbol, timeframe: TF) -> str:
+        "Directory name of an entry. Human readable prefix followed by a hash of the full key"
+        parts = (symbol.broker, symbol.exchange, symbol.sec_type, symbol.ticker)
+        full_key = "|".join(str(p) for p in parts) + "|" + timeframe.toString
+        digest = hashlib.sha1(full_key.encode()).hexdigest()[:12]
+        prefix = "".join(c if c.isalnum() else "_" for c in symbol.ticker)
+        return f"{prefix}_{timeframe.toString}_{digest}"
+
+    def _entry(self, symbol: Symbol, timeframe: TF) -> Path:
+        return self.directory / self.key(symbol, timeframe)
+
+    # region ---------------- Public Methods ----------------
+
+    def get(self, symbol: Symbol, timeframe: TF) -> Optional[Series_DF]:
+        "Load a cached Series_DF. None if the entry doesn't exist, has expired, or is unreadable"
+        entry = self._entry(symbol, timeframe)
+        with self._lock:
+            meta = self._read_meta(entry)
+            if meta is None:
+                return None
+            if self.max_age is not None and (
+                pd.Timestamp.now(tz="UTC") - pd.Timestamp(meta["created"])
+                > self.max_age
+            ):
+                return None
+
+            try:
+                df = self._read_segments(entry)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning("Could not read cached data %s: %s", entry, e)
+                shutil.rmtree(entry, ignore_errors=True)
+                return None
+            os.utime(entry)  # Mark as Recently Used
+
+        return Series_DF.from_normalized(
+            df,
+            symbol.exchange,
+            TF.fromString(meta["tf"]),
+            pd.Timedelta(meta["timedelta"]),
+            meta["only_days"],
+            meta["ext"],
+        )
+
+    def put(self, symbol: Symbol, timeframe: TF, data: Series_DF):
+        "Replace the entry of a Symbol & Timeframe with the given data"
+        if len(data) == 0:
+            return
+        entry = self._entry(symbol, timeframe)
+        with self._lock:
+            shutil.rmtree(entry, ignore_errors=True)
+            entry.mkdir(parents=True)
+            self._write_segment(entry, data.df, 0)
+            self._write_meta(entry, data, created=pd.Timestamp.now(tz="UTC"))
+            self._evict(keep=entry)
+
+    def append(self, symbol: Symbol, timeframe: TF, data: Series_DF):
+        """
+        Append the bars of data that are newer than those cached. Ignored if there is no entry.
+        The last cached bar is re-written too since it may have still been forming when cached.
+        """
+        entry = self._entry(symbol, timeframe)
+        with self._lock:
+            meta = self._read_meta(entry)
+            if meta is None or len(data) == 0:
+                return
+
+            df, last_time = data.df, pd.Timestamp(meta["last_time"])
+            new_bars = df.iloc[df.index.searchsorted(last_time, "left") :]
+            if len(new_bars) == 0 or new_bars.index[-1] <= last_time:
+                return
+
+            segments = sorted(entry.glob(f"seg_*.{self.fmt}"))
+            if len(segments) + 1 >= self.MAX_SEGMENTS:
+                # Compact the entry into a single segment
+                try:
+                    new_bars = pd.concat([self._read_segments(entry), new_bars])
+                    new_bars = new_bars[~new_bars.index.duplicated(keep="last")]
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.warning("Could not compact cached data %s: %s", entry, e)
+                    return
+                for segment in segments:
+                    segment.unlink()
+                self._write_segment(entry, new_bars, 0)
+            else:
+                next_num = int(segments[-1].stem.split("_")[1]) + 1 if segments else 0
+                self._write_segment(entry, new_bars, next_num)
+
+            self._write_meta(entry, data, created=pd.Timestamp(meta["created"]))
+            self._evict(keep=entry)
+
+    def remove(self, symbol: Symbol, timeframe: TF):
+        "Delete the entry of a Symbol & Timeframe"
+        with self._lock:
+            shutil.rmtree(self._entry(symbol, timeframe), ignore_errors=True)
+
+    def clear(self):
+        "Delete every entry in the cache"
+        with self._lock:
+            for entry in self._entries():
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @property
+    def size(self) -> int:
+        "Total size of the cache, in bytes"
+        return sum(self._entry_size(entry) for entry in self._entries())
+
+    # endregion
+
+    # region ---------------- Private Methods ----------------
+
+    def _entries(self) -> list[Path]:
+        return [p for p in self.directory.iterdir() if (p / self.META_FILE).exists()]
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        return sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+
+    def _evict(self, keep: Path):
+        "Delete the Least Recently Used entries until the cache is within max_bytes"
+        entries = [(e.stat().st_mtime, self._entry_size(e), e) for e in self._entries()]
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            logger.debug("Evicted cached data %s", entry.name)
+
+    def _read_meta(self, entry: Path) -> Optional[dict]:
+        try:
+            with open(entry / self.META_FILE, encoding="UTF-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, entry: Path, data: Series_DF, created: pd.Timestamp):
+        meta = {
+            "tf": data.timeframe.toString,
+            "timedelta": data.timedelta.isoformat(),
+            "only_days": bool(data.only_days),
+            "ext": bool(data.ext),
+            "last_time": data.curr_bar_open_time.isoformat(),
+            "created": created.isoformat(),
+        }
+        tmp_file = entry / (self.META_FILE + ".tmp")
+        with open(tmp_file, "w", encoding="UTF-8") as file:
+            json.dump(meta, file)
+        os.replace(tmp_file, entry / self.META_FILE)
+
+    def _write_segment(self, entry: Path, df: pd.DataFrame, num: int):
+        pa = _pa()
+        table = pa.Table.from_pandas(
+            df.rename_axis("time").reset_index(), preserve_index=False
+        )
+        file = entry / f"seg_{num:05d}.{self.fmt}"
+        tmp_file = file.with_suffix(".tmp")
+        if self.fmt == "arrow":
+            with pa.OSFile(str(tmp_file), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            pa.parquet.write_table(table, tmp_file)
+        os.replace(tmp_file, file)
+
+    def _read_segments(self, entry: Path) -> pd.DataFrame:
+        pa = _pa()
+        tables = []
+        for file in sorted(entry.glob(f"seg_*.{self.fmt}")):
+            if self.fmt == "arrow":
+                with pa.memory_map(str(file), "r") as source:
+                    tables.append(pa.ipc.open_file(source).read_all())
+            else:
+                tables.append(pa.parquet.read_table(file, memory_map=True))
+
+        table = pa.concat_tables(tables, promote_options="default")
+        df = table.to_pandas().set_index("time")
+        # Appended segments overlap by one bar, keep the later of the two
+        df = df[~df.index.duplicated(keep="last")]
+        df.index.name = None  # Matches the index of a freshly normalized Series_DF
+        return df
+
+    # endregion
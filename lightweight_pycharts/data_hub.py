@@ -0,0 +1,159 @@
+"""
+Window level Hub of the Series_DF & Whitespace_DF datasets displayed by Frames, keyed by Symbol
+and Timeframe, so Frames that display the same dataset share a single copy of it.
+"""
+
+from __future__ import annotations
+import logging
+from time import monotonic
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, TYPE_CHECKING
+
+from .orm.types import TF, Symbol
+from .orm.series import Series_DF, Whitespace_DF
+
+# prevent circular import
+if TYPE_CHECKING:
+    from .indicators import Series
+
+logger = logging.getLogger("lightweight-pycharts")
+
+DataKey = tuple[str, Optional[str], Optional[str], Optional[str], str]
+
+
+def data_key(symbol: Symbol, timeframe: TF) -> DataKey:
+    "Hashable key of a Symbol & Timeframe. (Symbol is a mutable, unhashable, dataclass)"
+    return (
+        symbol.ticker,
+        symbol.broker,
+        symbol.sec_type,
+        symbol.exchange,
+        timeframe.toString,
+    )
+
+
+@dataclass(slots=True)
+class SharedData:
+    """
+    A dataset shared by every Series subscribed to it. subscribers[0] is the 'feeder', the
+    Series whose socket supplies the dataset's updates.
+    """
+
+    symbol: Symbol
+    data: Series_DF
+    whitespace: Optional[Whitespace_DF] = None
+    subscribers: list[Series] = field(default_factory=list)
+    released_at: float = 0
+    nbytes: int = 0
+
+    @property
+    def feeder(self) -> Optional[Series]:
+        return self.subscribers[0] if len(self.subscribers) > 0 else None
+
+
+class DataHub:
+    """
+    Reference counted store of the datasets that Frames' main Series display.
+
+    A Frame that requests a Symbol & Timeframe another Frame is already displaying is given the
+    same Series_DF & Whitespace_DF rather than emitting a data_request. Only one Series per
+    dataset, the feeder, has a socket opened for it. An update given to any subscribed Series is
+    applied to the shared data once then displayed by every subscribed Frame.
+
+    Datasets no longer displayed by any Frame are kept, up to max_bytes, and evicted Least Recently
+    Used first. They do not receive updates while unreferenced, so max_idle can be given to have
+    them re-requested instead of reused after a given number of seconds.
+    """
+
+    def __init__(self, max_bytes: int = 2**28, max_idle: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.max_idle = max_idle
+        # Referenced & Unreferenced Datasets. Unreferenced are in Least Recently Used order.
+        self._active: dict[DataKey, SharedData] = {}
+        self._released: OrderedDict[DataKey, SharedData] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._released)
+
+    @property
+    def nbytes(self) -> int:
+        "Approximate size of the unreferenced datasets, in bytes"
+        return sum(shared.nbytes for shared in self._released.values())
+
+    def get(self, symbol: Symbol, timeframe: TF) -> Optional[Series_DF]:
+        "The Series_DF of a Symbol & Timeframe if it's in the hub, else None"
+        key = data_key(symbol, timeframe)
+        if (shared := self._active.get(key)) is not None:
+            return shared.data
+        if (shared := self._released.get(key)) is None:
+            return None
+        if (
+            self.max_idle is not None
+            and monotonic() - shared.released_at > self.max_idle
+        ):
+            del self._released[key]
+            return None
+        return shared.data
+
+    def subscribe(self, series: Series, symbol: Symbol, data: Series_DF) -> SharedData:
+        """
+        Subscribe a Series to the dataset of a Symbol & Timeframe. The given data is added to the
+        hub if the key is new. If another dataset is already held under that key it is replaced
+        and the Series already subscribed are set to the given data.
+        """
+        key = data_key(symbol, data.timeframe)
+        if (shared := self._active.get(key)) is None:
+            shared = self._released.pop(key, None)
+            if shared is None or shared.data is not data:
+                shared = SharedData(symbol, data)
+            self._active[key] = shared
+        elif shared.data is not data:
+            # A new dataset for the key, e.g. a reload, Every Frame should display it
+            stale, shared.data, shared.whitespace = list(shared.subscribers), data, None
+            for other in stale:
+                if other is not series:
+                    other.set_data(data, symbol=other.symbol)
+
+        if series not in shared.subscribers:
+            shared.subscribers.append(series)
+        return shared
+
+    def unsubscribe(self, series: Series, shared: SharedData):
+        """
+        Remove a Series from a dataset. If it was the dataset's feeder a socket is opened for the
+        next subscriber. Once unreferenced the dataset is held until evicted.
+        """
+        if series not in shared.subscribers:
+            return
+        was_feeder = shared.feeder is series
+        shared.subscribers.remove(series)
+
+        key = data_key(shared.symbol, shared.data.timeframe)
+        if (feeder := shared.feeder) is not None:
+            if was_feeder and not feeder.socket_open:
+                feeder.events.socket_switch(
+                    state="open", symbol=shared.symbol, series=feeder
+                )
+            return
+
+        if self._active.get(key) is shared:
+            del self._active[key]
+        shared.released_at = monotonic()
+        shared.nbytes = int(shared.data.df.memory_usage(index=True).sum())
+        if shared.whitespace is not None:
+            shared.nbytes += int(shared.whitespace.df.memory_usage(index=True).sum())
+        self._released[key] = shared
+        self._evict()
+
+    def clear(self):
+        "Drop every unreferenced dataset"
+        self._released.clear()
+
+    def _evict(self):
+        "Drop Least Recently Used unreferenced datasets until they fit within max_bytes"
+        total = self.nbytes
+        while total > self.max_bytes and len(self._released) > 0:
+            key, shared = self._released.popitem(last=False)
+            total -= shared.nbytes
+            logger.debug("Evicted %s from the DataHub", key)
@@ -1,7 +1,11 @@
 """ Utility functions and objects that are used across the library """
 
-from asyncio import iscoroutinefunction, create_task
+import logging
+from functools import partial
+from concurrent.futures import Executor, ThreadPoolExecutor
+from asyncio import CancelledError, Task, gather, iscoroutinefunction, get_running_loop
 from typing import (
+    Hashable,
     Literal,
     Protocol,
     Self,
@@ -20,15 +24,36 @@ from .orm import types
 if TYPE_CHECKING:
     from .indicators import Series
 
+logger = logging.getLogger("lightweight-pycharts")
+
 
 class Events:
-    "A Super Object that is a Collection of Emitters"
+    """
+    A Super Object that is a Collection of Emitters
+
+    When given a number of workers, synchronous symbol_search and data_request handlers are run
+    in a thread pool of that size rather than on the event loop. A blocking fetch then only
+    delays its own response rather than every other frame's updates.
+    """
 
-    def __init__(self):
-        self.symbol_search = Emitter[Symbol_Search_Protocol]()
-        self.data_request = Emitter[Data_Request_Protocol]()
+    def __init__(self, workers: Optional[int] = None):
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lwpc_events")
+            if workers
+            else None
+        )
+        self.symbol_search = Emitter[Symbol_Search_Protocol](executor=self._executor)
+        self.data_request = Emitter[Data_Request_Protocol](executor=self._executor)
         self.socket_switch = Emitter[Socket_Switch_Protocol]()
 
+    async def shutdown(self, cancel: bool = True):
+        "Cancel, or wait for, the async tasks launched by every Emitter"
+        for emitter in vars(self).values():
+            if isinstance(emitter, Emitter):
+                await emitter.shutdown(cancel)
+        if self._executor is not None:
+            self._executor.shutdown(wait=not cancel, cancel_futures=cancel)
+
 
 # region -------------------------- Python Event Protocol Definitions -------------------------- #
 # pylint: disable=invalid-name disable=missing-class-docstring
@@ -124,15 +149,26 @@ class Emitter[T: Emitter_Protocols](list[T]):
 
     This class can be instantiated with a callable function. This function will be
     called with the appended functions's return args as parameters if there are any.
-    """
 
-    # TODO : Make this class track async tasks that it has created so they can be closed
-    # This will likely entail making the class definitively only handle one response function
+    When given an executor, synchronous functions are run in it, as if they were async, and the
+    response function is called back on the event loop.
+
+    Async tasks are tracked until they complete. When emitted with a 'task_key', e.g. the
+    requesting Frame, any task still running for that key is cancelled and a generation token
+    is advanced. A response whose generation has been superseded is dropped rather than passed
+    to the response function, so the most recent request always wins.
+    """
 
-    def __init__(self, response: Optional[Callable] = None):
+    def __init__(
+        self, response: Optional[Callable] = None, executor: Optional[Executor] = None
+    ):
         super().__init__()
         self.response = response
+        self.executor = executor
         self.__single_responder__ = True
+        self._tasks: set[Task] = set()
+        self._keyed_tasks: dict[Hashable, Task] = {}
+        self._generations: dict[Hashable, int] = {}
 
     def __iadd__(self, func: T) -> Self:
         if func not in self:
@@ -148,14 +184,55 @@ class Emitter[T: Emitter_Protocols](list[T]):
 
     # rsp_kwargs are set when the event it emitted, They are arguments
     # passed directly to the response function of the emitter.
-    def __call__(self, *args, rsp_kwargs: Optional[dict[str, Any]] = None, **kwargs):
+    def __call__(
+        self,
+        *args,
+        rsp_kwargs: Optional[dict[str, Any]] = None,
+        task_key: Optional[Hashable] = None,
+        **kwargs,
+    ):
         if len(self) == 0:
             return
-        if iscoroutinefunction(call := self[0]):
+
+        generation = 0
+        if task_key is not None:
+            # Supersede any request that is still in flight for this key
+            generation = self._generations.get(task_key, 0) + 1
+            self._generations[task_key] = generation
+            if (prev_task := self._keyed_tasks.pop(task_key, None)) is not None:
+                prev_task.cancel()
+
+        try:
+            loop = get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        call, is_async = self[0], iscoroutinefunction(self[0])
+        if not is_async and self.executor is not None and loop is not None:
+            # Run the synchronous function in the executor, wrapped as a coroutine
+            call, is_async = partial(self._executor_call_, call), True
+
+        if is_async:
             # Run Self, Asynchronously
-            create_task(
-                self._async_response_wrap_(call, *args, **kwargs, rsp_kwargs=rsp_kwargs)
+            if loop is None:
+                logger.debug("No running event loop, dropped call to %s", call)
+                return
+
+            task = loop.create_task(
+                self._async_response_wrap_(
+                    call,
+                    *args,
+                    **kwargs,
+                    rsp_kwargs=rsp_kwargs,
+                    task_key=task_key,
+                    generation=generation,
+                )
             )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            if task_key is not None:
+                self._keyed_tasks[task_key] = task
+                task.add_done_callback(partial(self._forget_task_, task_key))
         else:
             # Run Self, Synchronously
             rsp = call(*args, **kwargs)
@@ -168,14 +245,58 @@ class Emitter[T: Emitter_Protocols](list[T]):
             )
 
     async def _async_response_wrap_(
-        self, call, *args, rsp_kwargs: Optional[dict[str, Any]] = None, **kwargs
+        self,
+        call,
+        *args,
+        rsp_kwargs: Optional[dict[str, Any]] = None,
+        task_key: Optional[Hashable] = None,
+        generation: int = 0,
+        **kwargs,
     ):
-        "Simple Wrapper to 'await' the initial 'call' function."
-        rsp = await call(*args, **kwargs)
+        "Wrapper to 'await' the initial 'call' function and drop superseded responses."
+        try:
+            rsp = await call(*args, **kwargs)
+        except CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Exception raised by %s", call)
+            return
+
+        if task_key is not None and self._generations.get(task_key) != generation:
+            logger.debug("Dropped superseded response for '%s'", task_key)
+            return
         if self.response is None:
             return
 
         self.response(
-            *rsp if isinstance(rsp, tuple) else rsp,  # only unpack tuples, not lists
+            *rsp if isinstance(rsp, tuple) else (rsp,),  # only unpack tuples, not lists
             **rsp_kwargs if rsp_kwargs is not None else {},
         )
+
+    async def _executor_call_(self, call: Callable, *args, **kwargs):
+        return await get_running_loop().run_in_executor(
+            self.executor, partial(call, *args, **kwargs)
+        )
+
+    def _forget_task_(self, task_key: Hashable, task: Task):
+        if self._keyed_tasks.get(task_key) is task:
+            del self._keyed_tasks[task_key]
+
+    def cancel(self, task_key: Hashable):
+        "Supersede the request still in flight for a key, if any, without emitting a new one"
+        self._generations[task_key] = self._generations.get(task_key, 0) + 1
+        if (task := self._keyed_tasks.pop(task_key, None)) is not None:
+            task.cancel()
+
+    @property
+    def pending(self) -> int:
+        "Number of async tasks that have yet to complete"
+        return len(self._tasks)
+
+    async def shutdown(self, cancel: bool = True):
+        "Cancel, or wait for, all of the async tasks this Emitter has launched"
+        tasks = list(self._tasks)
+        if cancel:
+            for task in tasks:
+                task.cancel()
+        await gather(*tasks, return_exceptions=True)
@@ -2,6 +2,9 @@
 
 from logging import getLogger
 from abc import abstractmethod
+from itertools import count
+from collections import deque
+from concurrent.futures import Executor
 from inspect import signature, _empty, currentframe
 from typing import (
     ClassVar,
@@ -9,6 +12,7 @@ from typing import (
     Optional,
     Any,
     Callable,
+    Container,
     Protocol,
     TypeAlias,
 )
@@ -17,6 +21,7 @@ import pandas as pd
 
 from lightweight_pycharts.indicator_meta import IndicatorMeta, OptionsMeta
 from lightweight_pycharts.orm.types import Color
+from lightweight_pycharts.orm.series import BarStore, WindowedSeries
 
 from . import window as win
 from . import primative as pr
@@ -29,6 +34,10 @@ logger = getLogger("lightweight-pycharts")
 SeriesData: TypeAlias = Callable[[], pd.Series]
 DataframeData: TypeAlias = Callable[[], pd.DataFrame]
 
+# Generation numbers of set/update passes. Shared by every Frame's IndicatorGraph since a pass
+# may reach the Indicators of another Frame when they are linked across Frames.
+_GENERATIONS = count(1)
+
 
 # region --------------------------- Attribute Application Functions --------------------------- #
 
@@ -101,6 +110,41 @@ def param[
     return default
 
 
+def windowed_source(func: Callable[[], Any]) -> Callable[[], WindowedSeries]:
+    """
+    Wrap an output property so it yields a WindowedSeries. The Indicator that owns the output
+    supplies a zero-copy view of it when able, otherwise the returned pd.Series is copied into
+    a store once and, as the series grows, only its last value or new bar is applied to it.
+    """
+    owner, name = getattr(func, "__self__", None), getattr(func, "__name__", "")
+    store, view = BarStore(), WindowedSeries()
+
+    def _windowed() -> WindowedSeries:
+        nonlocal store, view
+        if owner is not None and (owned := owner.__windowed_output__(name)) is not None:
+            return owned
+        if isinstance(data := func(), WindowedSeries):
+            return data
+
+        last = len(store)
+        if (
+            last == 0
+            or len(data) not in (last, last + 1)
+            or pd.Timestamp(data.index[last - 1]).value != store.times[-1]
+        ):
+            # First call, or the series was rewritten rather than updated or extended
+            store = BarStore(data.to_frame("value"))
+            view = WindowedSeries(store, "value")
+            return view
+
+        store.update_last({"value": data.iat[last - 1]})
+        if len(data) > last:
+            store.append(data.index[-1], {"value": data.iat[-1]})
+        return view
+
+    return _windowed
+
+
 # endregion
 
 # region --------------------------- Indicator Options Classes --------------------------- #
@@ -144,22 +188,21 @@ class Watcher:
 
     Watchers hold permanent references to it's parent Indicators set, clear, and update methods.
     They also hold mutable References to other indicator's output_property functions to fetch data.
+    The order in which Watchers are notified is determined by the Frame's IndicatorGraph.
     """
 
     def __init__(self, parent: "Indicator"):
+        self.indicator = parent
         self._set_data = parent.set_data
         self._clear_data = parent.clear_data
         self._update_data = parent.update_data
-        self._notify_observers_set = parent._notify_observers_set
-        self._notify_observers_clear = parent._notify_observers_clear
-        self._notify_observers_update = parent._notify_observers_update
-
-        # set & updated ensure all indicators only set/update once they are ready to. Set, being
-        # more of a latch, is likely bug free. However, doing this for updated **may** lead to an
-        # edge case bug where an indicator may never (or only intermittently) update if it depends
-        # on two or more Series Indicators that receive data updates at different rates.
+
+        # 'set' is a latch, True once set_data has run on the current sources. The generations
+        # are those of the last set/update pass this Watcher ran in. An Indicator only runs in a
+        # pass once all of its sources that are part of that pass have run in the same pass.
         self.set = False
-        self.updated = False
+        self.set_generation = 0
+        self.update_generation = 0
 
         self.observables: dict[str, Callable] = {}
         self.set_args: dict[str, Callable] = {}
@@ -167,39 +210,239 @@ class Watcher:
         self.update_args: dict[str, Callable] = {}
         self.update_notifiers: list[Indicator] = []
 
-    def reset_updated_state(self):
-        "Reset the Updated state and tell all observers to reset as well, an update is coming"
-        self.updated = False
+    def notify_set(self, generation: int, members: Container["Watcher"] = ()) -> bool:
+        """
+        Preform the historical set_data calc if every source is set. Sources that are members of
+        the current pass must have been set in this generation. Returns True if set_data ran.
+        """
+        for ind in self.set_notifiers:
+            src = ind._watcher
+            if not src.set or (src in members and src.set_generation != generation):
+                return False
+
+        self._set_data(**{name: func() for name, func in self.set_args.items()})
+        self.set = True
+        self.set_generation = generation
+        return True
+
+    def notify_update(
+        self, generation: int, members: Container["Watcher"] = ()
+    ) -> bool:
+        """
+        Preform the update_data calc if every source that is a member of the current pass has
+        been updated in this generation. Returns True if update_data ran.
+        """
         for ind in self.update_notifiers:
-            ind._watcher.reset_updated_state()
-
-    def notify_set(self):
-        "Notify the Watcher that an update occured in the given Indicator"
-        if all([ind._watcher.set for ind in self.set_notifiers]):
-            # All indicator srcs Ready, Preform historical set_data calc.
-            # Will Fire on Notifier = None, intentional so Watcher can self-fire on init
-            self._set_data(
-                **dict([(name, func()) for name, func in self.set_args.items()])
-            )
-            self.set = True
-            self._notify_observers_set()
-
-    def notify_update(self):
-        "Notify the Watcher that an update occured in the given Indicator"
-        if all([ind._watcher.updated for ind in self.update_notifiers]):
-            # Ready to Update, Fire Update then set updated Readiness State
-            self._update_data(
-                **dict([(name, func()) for name, func in self.update_args.items()])
-            )
-            self.updated = True
-            self._notify_observers_update()
+            src = ind._watcher
+            if src in members and src.update_generation != generation:
+                return False
+
+        self._update_data(**{name: func() for name, func in self.update_args.items()})
+        self.update_generation = generation
+        return True
 
     def notify_clear(self):
         "Notify the Watcher that the source it calculated from is no longer valid and should clear"
         self._clear_data()
         self.set = False
-        self.updated = False
-        self._notify_observers_clear()
+
+
+class IndicatorGraph:
+    """
+    Dependency DAG of a Frame's Indicators, defined by the links made through link_args().
+
+    The Watchers downstream of a source are topologically sorted once, the first time the source
+    notifies its observers after a (re)link. Every set, update, & clear is then a single linear
+    pass over that order. Each pass is given a new generation number rather than resetting
+    boolean states, so an Indicator that depends on a source through several paths, e.g. a diamond
+    A -> (B, C) -> D, runs once, after all of its inputs are current.
+
+    When given an executor the set_data calls of a pass are run in it one level at a time. A
+    level holds the Watchers whose sources are all in prior levels, so independent branches
+    recalculate concurrently while every Indicator still runs after all of its sources. Only
+    the calculations run in the executor, the display calls of each Indicator's Series are
+    deferred and made on the calling thread once the level completes.
+    """
+
+    # Schedules follow observers into other Frames, so a link made or removed anywhere can make
+    # any Frame's cached schedules stale. Every graph drops its cache once this version changes.
+    _version: ClassVar[int] = 0
+
+    def __init__(
+        self, indicators: ID_Dict["Indicator"], executor: Optional[Executor] = None
+    ):
+        self._indicators = indicators
+        self.executor = executor
+        self._cache_version = IndicatorGraph._version
+        # Source Watcher -> (Topologically sorted downstream Watchers, Members of the pass)
+        self._schedules: dict[Watcher, tuple[list[Watcher], set[Watcher]]] = {}
+        # Source Watcher -> Downstream Watchers grouped by their depth from the source
+        self._levels: dict[Watcher, list[list[Watcher]]] = {}
+
+    @classmethod
+    def invalidate(cls):
+        "Drop the cached pass orders of every Frame. Called whenever any Indicator is (re)linked"
+        cls._version += 1
+
+    def _drop_stale(self):
+        if self._cache_version != IndicatorGraph._version:
+            self._schedules.clear()
+            self._levels.clear()
+            self._cache_version = IndicatorGraph._version
+
+    def _schedule(self, source: Watcher) -> tuple[list[Watcher], set[Watcher]]:
+        "Topologically sorted Watchers downstream of the source along with the source itself"
+        self._drop_stale()
+        if (schedule := self._schedules.get(source)) is not None:
+            return schedule
+
+        # Dict rather than a set so the order observers were linked in is kept among equals
+        reachable, queue = {}, deque([source])
+        while len(queue) > 0:
+            for observer in queue.popleft().indicator._observers:
+                if observer not in reachable:
+                    reachable[observer] = None
+                    queue.append(observer)
+        reachable.pop(source, None)
+
+        # Kahn's Algorithm over the downstream sub-graph. Edges from the source are satisfied.
+        in_degree = dict.fromkeys(reachable, 0)
+        for watcher in reachable:
+            for observer in watcher.indicator._observers:
+                if observer in in_degree:
+                    in_degree[observer] += 1
+
+        order, ready = [], deque(w for w, deg in in_degree.items() if deg == 0)
+        while len(ready) > 0:
+            watcher = ready.popleft()
+            order.append(watcher)
+            for observer in watcher.indicator._observers:
+                if observer in in_degree:
+                    in_degree[observer] -= 1
+                    if in_degree[observer] == 0:
+                        ready.append(observer)
+
+        if len(order) != len(reachable):
+            cyclic = [w.indicator.cls_name for w in reachable if w not in order]
+            logger.critical("Circular Indicator dependency between %s", cyclic)
+
+        schedule = self._schedules[source] = (order, set(order) | {source})
+        return schedule
+
+    def _schedule_levels(self, source: Watcher) -> list[list[Watcher]]:
+        "The downstream Watchers of the source grouped into levels that can run concurrently"
+        self._drop_stale()
+        if (levels := self._levels.get(source)) is not None:
+            return levels
+
+        order, members = self._schedule(source)
+        depth: dict[Watcher, int] = {source: 0}
+        levels = []
+        for watcher in order:
+            sources = watcher.set_notifiers + watcher.update_notifiers
+            level = max(
+                (depth[w] for ind in sources if (w := ind._watcher) in members),
+                default=0,
+            )
+            depth[watcher] = level + 1
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(watcher)
+
+        self._levels[source] = levels
+        return levels
+
+    def run_set(self, source: Watcher, include_source: bool = False):
+        """
+        Preform the historical set_data calc of every Indicator downstream of the source.
+        When include_source is set the source is recalculated first, otherwise it's assumed set.
+        """
+        generation = next(_GENERATIONS)
+        if include_source:
+            if not source.notify_set(generation):
+                return
+        else:
+            source.set_generation = generation
+
+        order, members = self._schedule(source)
+        if self.executor is None:
+            for watcher in order:
+                watcher.notify_set(generation, members)
+            return
+
+        for level in self._schedule_levels(source):
+            if len(level) == 1:
+                level[0].notify_set(generation, members)
+                continue
+            futures = [
+                self.executor.submit(self._deferred_set, watcher, generation, members)
+                for watcher in level
+            ]
+            # Wait on the level, raising the first exception. The results are then displayed
+            # from this thread in topological order rather than in the order they completed.
+            for future in futures:
+                for display_call in future.result():
+                    display_call()
+
+    @staticmethod
+    def _deferred_set(
+        watcher: Watcher, generation: int, members: Container[Watcher]
+    ) -> list[Callable[[], None]]:
+        "notify_set() that returns the display calls of the Indicator rather than making them"
+        with sc.defer_display() as display_calls:
+            watcher.notify_set(generation, members)
+        return display_calls
+
+    def run_update(self, source: Watcher):
+        "Preform the update_data calc of every Indicator downstream of the updated source"
+        generation = source.update_generation = next(_GENERATIONS)
+        order, members = self._schedule(source)
+        for watcher in order:
+            watcher.notify_update(generation, members)
+
+    def run_clear(self, source: Watcher, include_source: bool = False):
+        "Clear every Indicator downstream of the source, and optionally the source itself"
+        if include_source:
+            source.notify_clear()
+        for watcher in self._schedule(source)[0]:
+            watcher.notify_clear()
+
+    # region ---- Inspection ----
+
+    @property
+    def edges(self) -> list[tuple["Indicator", "Indicator", str]]:
+        "(Source, Dependent, Argument Name) of every link made by the Frame's Indicators"
+        return [
+            (func.__self__, ind, name)
+            for ind in self._indicators.values()
+            for name, func in ind._watcher.observables.items()
+            if getattr(func, "__self__", None) is not None
+        ]
+
+    def downstream(self, indicator: "Indicator") -> list["Indicator"]:
+        "The Indicators that depend on the given Indicator, in the order they are notified"
+        return [w.indicator for w in self._schedule(indicator._watcher)[0]]
+
+    def topological_order(self) -> list["Indicator"]:
+        "Every Indicator of the Frame, ordered such that each follows all of its sources"
+        in_degree = {ind: 0 for ind in self._indicators.values()}
+        for ind in in_degree:
+            for observer in ind._observers:
+                if observer.indicator in in_degree:
+                    in_degree[observer.indicator] += 1
+
+        order, ready = [], deque(i for i, deg in in_degree.items() if deg == 0)
+        while len(ready) > 0:
+            ind = ready.popleft()
+            order.append(ind)
+            for observer in ind._observers:
+                if observer.indicator in in_degree:
+                    in_degree[observer.indicator] -= 1
+                    if in_degree[observer.indicator] == 0:
+                        ready.append(observer.indicator)
+        return order
+
+    # endregion
 
 
 class Indicator(metaclass=IndicatorMeta):
@@ -330,22 +573,19 @@ class Indicator(metaclass=IndicatorMeta):
 
     def _notify_observers_set(self):
         "Notify All observers to preform a bulk historical calculation"
-        for watcher in self._observers:
-            watcher.notify_set()
+        self.parent_frame.indicator_graph.run_set(self._watcher)
 
     def _notify_observers_update(self):
         "Notify All observers there is an update to be made"
-        for watcher in self._observers:
-            watcher.notify_update()
+        self.parent_frame.indicator_graph.run_update(self._watcher)
 
     def _notify_observers_clear(self):
         "Notify All observers they should clear their state"
-        for watcher in self._observers:
-            watcher.notify_clear()
+        self.parent_frame.indicator_graph.run_clear(self._watcher)
 
     def recalculate(self):
         "Manually force a full recalculation of this indicator and all dependent indicators"
-        self._watcher.notify_set()
+        self.parent_frame.indicator_graph.run_set(self._watcher, include_source=True)
 
     def __parse_options_obj__(self, obj: IndicatorOptions) -> dict:
         "Parse an IndicatorOptions instance into a picklable dict"
@@ -465,6 +705,14 @@ class Indicator(metaclass=IndicatorMeta):
         for primative in self._primitives.values():
             primative.clear()
 
+    def __windowed_output__(self, _name: str) -> Optional[WindowedSeries]:
+        """
+        Optional Method. Return a zero-copy WindowedSeries view of the named output property so
+        it can be handed to update_data() methods that take a WindowedSeries. None, the default,
+        wraps a copy of the output's pd.Series instead.
+        """
+        return None
+
     def update_options(self, _: IndicatorOptions) -> bool:
         """
         Optional Abstract Method. If the user adjusts this indicator's Options on the screen,
@@ -508,10 +756,13 @@ class Indicator(metaclass=IndicatorMeta):
             rtn_type = signature(args[name]).return_annotation
             rtn_type = object if rtn_type is _empty else rtn_type
 
-            if not issubclass(arg_type, rtn_type):
-                raise TypeError(
-                    f"{self.cls_name} Given {rtn_type} for parameter {name}. Expected {arg_type}"
-                )
+            for expected in (cls.__set_args__.get(name), cls.__update_args__.get(name)):
+                if expected is not None and not IndicatorMeta.accepts(
+                    expected[0], rtn_type
+                ):
+                    raise TypeError(
+                        f"{self.cls_name} Given {rtn_type} for parameter {name}. Expected {expected[0]}"
+                    )
 
             # Give this Indicator's watcher to the function's bound indicator
             bound_cls_inst = args[name].__self__
@@ -537,19 +788,28 @@ class Indicator(metaclass=IndicatorMeta):
                 self._watcher.set_args[name] = args[name]
                 self._watcher.set_notifiers.append(bound_cls_inst)
             if name in cls.__update_args__:
-                self._watcher.update_args[name] = args[name]
+                update_type = cls.__update_args__[name][0]
+                if issubclass(update_type, WindowedSeries) and not (
+                    isinstance(rtn_type, type) and issubclass(rtn_type, WindowedSeries)
+                ):
+                    self._watcher.update_args[name] = windowed_source(args[name])
+                else:
+                    self._watcher.update_args[name] = args[name]
                 self._watcher.update_notifiers.append(bound_cls_inst)
 
+        IndicatorGraph.invalidate()
+
     def _unlink_all_args(self):
         "Unsubscribe from all of the Indicator's linked input args."
         # Clear this indicator and all dependant indicators
-        self._watcher.notify_clear()
+        self.parent_frame.indicator_graph.run_clear(self._watcher, include_source=True)
 
         # Remove self from all of the '_observers' lists that it's appended to
         bound_arg_funcs = self._watcher.observables.values()
         for bound_func_cls in set([func.__self__ for func in bound_arg_funcs]):
             if bound_func_cls is not None:
                 bound_func_cls._observers.remove(self._watcher)
+        IndicatorGraph.invalidate()
 
         # Clear Watcher
         self._watcher.set_args = {}
@@ -645,6 +905,45 @@ class Indicator(metaclass=IndicatorMeta):
         return self.parent_frame.main_series.bar_time(index)
 
 
+class StoredOutputs:
+    """
+    Mixin of the Indicators that hold their outputs as the columns of a BarStore, self._data.
+    Listed ahead of Indicator, e.g. class RSI(StoredOutputs, Indicator).
+
+    Provides clear_data(), zero-copy __windowed_output__() views of each column, and the
+    bookkeeping of update_data(): _is_new_bar() & _store_bar() append a bar or revise the last.
+    """
+
+    _data: BarStore
+
+    def clear_data(self):
+        super().clear_data()  # type: ignore
+        self._data = BarStore()
+
+    def __windowed_output__(self, name: str) -> Optional[WindowedSeries]:
+        if name in self._data.columns:
+            return WindowedSeries(self._data, name)
+        return None
+
+    def _column(self, name: str) -> pd.Series:
+        "The named column of the store as a pd.Series, empty if not yet calculated"
+        return self._data.df[name] if name in self._data.columns else pd.Series()
+
+    def _is_new_bar(self, time: pd.Timestamp) -> bool:
+        """
+        True if an update at the given time begins a new bar. Tick updates share the last bar's
+        time so they revise it. Comparing times also makes repeated updates idempotent
+        """
+        return len(self._data) == 0 or self._data.last_time != time
+
+    def _store_bar(self, time: pd.Timestamp, values: dict[str, Any], is_new: bool):
+        "Append the values as a new bar or revise the last bar with them"
+        if is_new:
+            self._data.append(time, values)
+        else:
+            self._data.update_last(values)
+
+
 IndParent_T: TypeAlias = win.ChartingFrame | Indicator
 
 # endregion
@@ -17,6 +17,7 @@ from typing import (
 import pandas as pd
 
 from lightweight_pycharts.orm.types import Color
+from lightweight_pycharts.orm.series import WindowedSeries
 
 from .util import is_dunder
 
@@ -49,7 +50,11 @@ class IndicatorMeta(ABCMeta):
         setattr(cls, "__update_args__", update_args)
 
         for _param in set(set_args.keys()).intersection(update_args.keys()):
-            if set_args[_param][0] != update_args[_param][0]:
+            if set_args[_param][0] != update_args[_param][0] and not (
+                # A pd.Series source may be given to update_data() as a WindowedSeries
+                set_args[_param][0] == pd.Series
+                and update_args[_param][0] == WindowedSeries
+            ):
                 raise TypeError(
                     f"{cls} reused input argument name '{_param}' but changed the argument type."
                 )
@@ -67,6 +72,16 @@ class IndicatorMeta(ABCMeta):
 
         return cls
 
+    @staticmethod
+    def accepts(arg_type: type, rtn_type: type) -> bool:
+        """
+        True if an input argument of arg_type can be linked to an output returning rtn_type.
+        WindowedSeries arguments accept pd.Series outputs, they're wrapped when linked.
+        """
+        if issubclass(arg_type, rtn_type):
+            return True
+        return issubclass(arg_type, WindowedSeries) and issubclass(rtn_type, pd.Series)
+
     @staticmethod
     def parse_input_args(sig: Signature) -> dict[str, tuple[type, Any]]:
         "Parse Set_Data & Update_Data Function Signatures into {param name: [type , default value]}"
@@ -1,6 +1,23 @@
 """Sub-Module to make accessing a potentially large Suite of Indicators a bit more manageable"""
 
 from .sma import SMA
+from .rsi import RSI
+from .macd import MACD
+from .atr import ATR
+from .bollinger import BollingerBands
+from .stochastic import Stochastic
+from .vwap import VWAP
 from .series import Series, Volume, BarState
 
-__all__ = ("SMA", "Series", "Volume", "BarState")
+__all__ = (
+    "SMA",
+    "RSI",
+    "MACD",
+    "ATR",
+    "BollingerBands",
+    "Stochastic",
+    "VWAP",
+    "Series",
+    "Volume",
+    "BarState",
+)
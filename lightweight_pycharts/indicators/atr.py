@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    default_output_property,
+    param,
+)
+from lightweight_pycharts.orm.options import PriceScaleMargins, PriceScaleOptions
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import Color
+
+from .kernels import ATRKernel
+from .series import Series
+
+
+@dataclass
+class ATROptions(Options):
+    "Dataclass of Options for the ATR Indicator"
+
+    period: int = param(14, "Period", min_val=1)
+    color: ... = param(Color.from_rgb(183, 28, 28), "Line Color", inline="line_style")
+    size: ... = param(1, "Line Size", inline="line_style", min_val=0, max_val=5)
+
+
+# pylint: disable=arguments-differ
+class ATR(StoredOutputs, Indicator):
+    """
+    Average True Range of a Series. Calculated incrementally with an ATRKernel.
+    Uses the parent Series, or the Frame's main Series when the parent isn't a Series.
+    """
+
+    __options__ = ATROptions
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[ATROptions] = None,
+        display_name: str = "",
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = ATROptions()
+
+        self.period = 0
+        self._kernel = ATRKernel()
+        self._data = BarStore()
+        self.line_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="atr"), name="ATR"
+        )
+        self.line_series.apply_scale_options(
+            PriceScaleOptions(scaleMargins=PriceScaleMargins(0.75, 0))
+        )
+
+        src = self.parent_indicator
+        if not isinstance(src, Series):
+            src = self.parent_frame.main_series
+        self.link_args({"high": src.high, "low": src.low, "close": src.close})
+
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: ATROptions) -> bool:
+        recalc = False
+        self.line_series.apply_options(
+            LineStyleOptions(color=opts.color, lineWidth=opts.size)
+        )
+
+        if self.period != opts.period:
+            self.period = opts.period
+            self._kernel = ATRKernel(self.period)
+            recalc = True
+
+        return recalc
+
+    def set_data(self, high: pd.Series, low: pd.Series, close: pd.Series, *_, **__):
+        values = self._kernel.set(
+            *(
+                s.to_numpy(dtype=float, na_value=float("nan"))
+                for s in (high, low, close)
+            )
+        )
+        self._data = BarStore(pd.DataFrame({"atr": values}, index=close.index))
+        self.line_series.set_data(self.atr())
+
+    def update_data(
+        self,
+        time: pd.Timestamp,
+        high: WindowedSeries,
+        low: WindowedSeries,
+        close: WindowedSeries,
+        *_,
+        **__,
+    ):
+        is_new = self._is_new_bar(time)
+        value = self._kernel.update(
+            float(high[-1]), float(low[-1]), float(close[-1]), is_new
+        )
+
+        self._store_bar(time, {"atr": value}, is_new)
+        self.line_series.update_data(SingleValueData(time, value))
+
+    @default_output_property
+    def atr(self) -> pd.Series:
+        "The Average True Range"
+        return self._column("atr")
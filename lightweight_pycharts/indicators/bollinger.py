@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    SeriesData,
+    default_output_property,
+    output_property,
+    param,
+)
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import Color
+
+from .kernels import BollingerKernel
+
+
+@dataclass
+class BollingerOptions(Options):
+    "Dataclass of Options for the Bollinger Bands Indicator"
+    src: Optional[SeriesData] = None
+    period: int = param(20, "Period", min_val=1)
+    mult: float = param(2.0, "StdDev Multiplier", min_val=0.0, step=0.1)
+    basis_color: ... = param(Color.from_rgb(255, 109, 0), "Basis Color")
+    band_color: ... = param(Color.from_rgb(41, 98, 255), "Band Color")
+
+
+# pylint: disable=arguments-differ
+class BollingerBands(StoredOutputs, Indicator):
+    "Bollinger Bands. Calculated incrementally with a BollingerKernel"
+
+    __options__ = BollingerOptions
+    COLUMNS = ("basis", "upper", "lower")
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[BollingerOptions] = None,
+        display_name: str = "",
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = BollingerOptions()
+
+        self.src = None
+        self.period, self.mult = 0, 0.0
+        self._kernel = BollingerKernel()
+        self._data = BarStore()
+        self.basis_series = sc.LineSeries(self, name="Basis")
+        self.upper_series = sc.LineSeries(self, name="Upper")
+        self.lower_series = sc.LineSeries(self, name="Lower")
+
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: BollingerOptions) -> bool:
+        recalc = False
+        self.basis_series.apply_options(LineStyleOptions(color=opts.basis_color))
+        self.upper_series.apply_options(LineStyleOptions(color=opts.band_color))
+        self.lower_series.apply_options(LineStyleOptions(color=opts.band_color))
+
+        if self.period != opts.period or self.mult != opts.mult:
+            self.period, self.mult = opts.period, opts.mult
+            self._kernel = BollingerKernel(self.period, self.mult)
+            recalc = True
+
+        if opts.src is None:
+            opts.src = self.default_parent_src
+
+        if self.src != opts.src:
+            self.src = opts.src
+            self.link_args({"data": self.src})
+            recalc = True
+
+        return recalc
+
+    def set_data(self, data: pd.Series, *_, **__):
+        values = self._kernel.set(data.to_numpy(dtype=float, na_value=float("nan")))
+        self._data = BarStore(
+            pd.DataFrame(dict(zip(self.COLUMNS, values)), index=data.index)
+        )
+        self.basis_series.set_data(self.basis())
+        self.upper_series.set_data(self.upper())
+        self.lower_series.set_data(self.lower())
+
+    def update_data(self, time: pd.Timestamp, data: WindowedSeries, *_, **__):
+        is_new = self._is_new_bar(time)
+        basis, upper, lower = self._kernel.update(float(data[-1]), is_new)
+
+        values = {"basis": basis, "upper": upper, "lower": lower}
+        self._store_bar(time, values, is_new)
+        self.basis_series.update_data(SingleValueData(time, basis))
+        self.upper_series.update_data(SingleValueData(time, upper))
+        self.lower_series.update_data(SingleValueData(time, lower))
+
+    @default_output_property
+    def basis(self) -> pd.Series:
+        "The Moving Average the bands are centered on"
+        return self._column("basis")
+
+    @output_property
+    def upper(self) -> pd.Series:
+        "The Upper Band"
+        return self._column("upper")
+
+    @output_property
+    def lower(self) -> pd.Series:
+        "The Lower Band"
+        return self._column("lower")
@@ -0,0 +1,27 @@
+"""
+Incremental calculation kernels. Each holds the minimal state needed to update an indicator's
+output in O(1) as bars are appended or revised, and a vectorized set() for the history.
+"""
+
+from .kernel import Kernel
+from .moving_average import SMAKernel, EMAKernel, RMAKernel
+from .rolling import RollingMaxKernel, RollingMinKernel, StdDevKernel
+from .momentum import RSIKernel, MACDKernel, StochKernel
+from .volatility import ATRKernel, BollingerKernel
+from .volume import VWAPKernel
+
+__all__ = (
+    "Kernel",
+    "SMAKernel",
+    "EMAKernel",
+    "RMAKernel",
+    "RollingMaxKernel",
+    "RollingMinKernel",
+    "StdDevKernel",
+    "RSIKernel",
+    "MACDKernel",
+    "StochKernel",
+    "ATRKernel",
+    "BollingerKernel",
+    "VWAPKernel",
+)
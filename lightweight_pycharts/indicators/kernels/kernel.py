@@ -0,0 +1,32 @@
+""" Base Class of the Incremental Calculation Kernels """
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class Kernel(ABC):
+    """
+    Stateful calculation that can be initialized from a full history then updated in O(1).
+
+    set() is the vectorized historical calculation, analogous to an Indicator's set_data().
+    update() is the incremental calculation, analogous to an Indicator's update_data().
+    update(value, is_new=False) revises the most recent bar, e.g. an intra-bar tick,
+    while is_new=True appends a new bar after the most recent one.
+
+    Kernels of several inputs, e.g. high, low, & close, take one array or value per input ahead
+    of is_new. Kernels of several outputs return a tuple of arrays or values.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"{self.__class__.__name__} period must be >= 1")
+        self.period = period
+
+    @abstractmethod
+    def set(self, values: np.ndarray) -> np.ndarray:
+        "Reset the Kernel's state from a full history of values, returning the full output"
+
+    @abstractmethod
+    def update(self, value: float, is_new: bool) -> float:
+        "Apply a single value, returning the output for the most recent bar"
@@ -0,0 +1,118 @@
+""" Incremental Momentum Oscillator Kernels """
+
+from math import isnan, nan
+
+import numpy as np
+
+from .kernel import Kernel
+from .moving_average import SMAKernel, EMAKernel, RMAKernel
+from .rolling import RollingMaxKernel, RollingMinKernel
+
+
+def _rsi(gain: np.ndarray | float, loss: np.ndarray | float) -> np.ndarray:
+    "Relative Strength Index of the average gain & loss. 100 without losses, 50 if flat"
+    gain, loss = np.asarray(gain), np.asarray(loss)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, np.where(gain == 0, 50.0, 100.0), rsi)
+
+
+class RSIKernel(Kernel):
+    """
+    Relative Strength Index. The gains & losses of each bar's change are averaged with an RMA.
+    When the average gain & loss are both zero, i.e. a flat market, the RSI is 50.
+
+    The close of the previous bar is held so a revision of the current bar's close recomputes
+    its change from the same base.
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self._gain = RMAKernel(period)
+        self._loss = RMAKernel(period)
+        self._prev, self._curr = nan, nan
+
+    def set(self, values: np.ndarray) -> np.ndarray:
+        change = np.diff(values, prepend=nan)
+        # np.maximum, unlike np.fmax, keeps the missing change of the first bar missing
+        gain = self._gain.set(np.maximum(change, 0))
+        loss = self._loss.set(np.maximum(-change, 0))
+        self._prev = values[-2] if len(values) > 1 else nan
+        self._curr = values[-1] if len(values) > 0 else nan
+        return _rsi(gain, loss)
+
+    def update(self, value: float, is_new: bool) -> float:
+        if is_new:
+            self._prev = self._curr
+        self._curr = value
+
+        change = value - self._prev
+        if isnan(change):
+            gain = self._gain.update(nan, is_new)
+            loss = self._loss.update(nan, is_new)
+        else:
+            gain = self._gain.update(max(change, 0.0), is_new)
+            loss = self._loss.update(max(-change, 0.0), is_new)
+        return float(_rsi(gain, loss))
+
+
+class MACDKernel(Kernel):
+    """
+    Moving Average Convergence Divergence. The difference of a fast & slow EMA, a signal EMA of
+    that difference, and the histogram of the two. set() & update() return (macd, signal, hist).
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__(slow)
+        self._fast = EMAKernel(fast)
+        self._slow = EMAKernel(slow)
+        self._signal = EMAKernel(signal)
+
+    def set(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        macd = self._fast.set(values) - self._slow.set(values)
+        signal = self._signal.set(macd)
+        return macd, signal, macd - signal
+
+    def update(self, value: float, is_new: bool) -> tuple[float, float, float]:
+        macd = self._fast.update(value, is_new) - self._slow.update(value, is_new)
+        signal = self._signal.update(macd, is_new)
+        return macd, signal, macd - signal
+
+
+class StochKernel(Kernel):
+    """
+    Stochastic Oscillator. %K is the close's position within the highest high & lowest low of the
+    last 'period' bars, smoothed with an SMA of k_smooth. %D is an SMA of %K. %K is NaN when the
+    high & low of the range are equal.
+
+    Takes the high, low, & close of each bar. set() & update() return (%K, %D).
+    """
+
+    def __init__(self, period: int = 14, k_smooth: int = 1, d_period: int = 3):
+        super().__init__(period)
+        self._high = RollingMaxKernel(period)
+        self._low = RollingMinKernel(period)
+        self._k = SMAKernel(k_smooth)
+        self._d = SMAKernel(d_period)
+
+    def set(  # pylint: disable=arguments-differ
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        highest, lowest = self._high.set(high), self._low.set(low)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            raw = np.where(
+                highest == lowest, nan, 100 * (close - lowest) / (highest - lowest)
+            )
+        k = self._k.set(raw)
+        return k, self._d.set(k)
+
+    def update(  # pylint: disable=arguments-differ
+        self, high: float, low: float, close: float, is_new: bool
+    ) -> tuple[float, float]:
+        highest, lowest = self._high.update(high, is_new), self._low.update(low, is_new)
+        if highest == lowest or isnan(highest) or isnan(lowest):
+            raw = nan
+        else:
+            raw = 100 * (close - lowest) / (highest - lowest)
+        k = self._k.update(raw, is_new)
+        return k, self._d.update(k, is_new)
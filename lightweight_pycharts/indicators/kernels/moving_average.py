@@ -0,0 +1,114 @@
+""" Incremental Moving Average Kernels """
+
+from math import isnan, nan
+
+import numpy as np
+import pandas as pd
+
+from .kernel import Kernel
+
+
+class SMAKernel(Kernel):
+    """
+    Simple Moving Average. Equivalent to pd.Series.rolling(period).mean()
+
+    The last 'period' values are kept in a ring buffer alongside their running sum. Missing
+    values are counted rather than summed, the average is NaN while any are in the window.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._ring = np.full(period, nan)
+        self._last = period - 1  # Slot of the most recent value
+        self._sum = 0.0
+        self._nans = period
+
+    def set(self, values: np.ndarray) -> np.ndarray:
+        window = values[-self.period :]
+        self._ring = np.full(self.period, nan)
+        self._ring[self.period - len(window) :] = window
+        self._last = self.period - 1
+        self._resum()
+        return pd.Series(values).rolling(window=self.period).mean().to_numpy()
+
+    def update(self, value: float, is_new: bool) -> float:
+        if is_new:  # Overwrite the oldest value, otherwise revise the most recent
+            self._last = (self._last + 1) % self.period
+
+        old = self._ring[self._last]
+        if isnan(old):
+            self._nans -= 1
+        else:
+            self._sum -= old
+        if isnan(value):
+            self._nans += 1
+        else:
+            self._sum += value
+        self._ring[self._last] = value
+
+        if is_new and self._last == self.period - 1:
+            self._resum()  # Once per window, drop any accumulated floating point error
+        return nan if self._nans > 0 else self._sum / self.period
+
+    def _resum(self):
+        nan_mask = np.isnan(self._ring)
+        self._nans = int(nan_mask.sum())
+        self._sum = float(self._ring[~nan_mask].sum())
+
+
+class EMAKernel(Kernel):
+    """
+    Exponential Moving Average, alpha = 2 / (period + 1).
+    Equivalent to pd.Series.ewm(alpha, adjust=False, ignore_na=True, min_periods=period).mean()
+
+    The recursion is seeded with the first value. Missing values leave the average unchanged.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self.alpha = self._alpha(period)
+        # State as of the close of the previous bar, and as of the most recent value
+        self._prev, self._prev_count = nan, 0
+        self._curr, self._curr_count = nan, 0
+
+    @staticmethod
+    def _alpha(period: int) -> float:
+        return 2 / (period + 1)
+
+    def set(self, values: np.ndarray) -> np.ndarray:
+        ewm = pd.Series(values).ewm(alpha=self.alpha, adjust=False, ignore_na=True)
+        avg = ewm.mean().to_numpy()
+        counts = np.cumsum(~np.isnan(values))
+
+        self._curr = avg[-1] if len(avg) > 0 else nan
+        self._curr_count = int(counts[-1]) if len(counts) > 0 else 0
+        self._prev = avg[-2] if len(avg) > 1 else nan
+        self._prev_count = int(counts[-2]) if len(counts) > 1 else 0
+
+        avg[counts < self.period] = nan
+        return avg
+
+    def update(self, value: float, is_new: bool) -> float:
+        if is_new:  # Commit the previous bar's state, otherwise revise from it
+            self._prev, self._prev_count = self._curr, self._curr_count
+
+        if isnan(value):
+            self._curr, self._curr_count = self._prev, self._prev_count
+        elif self._prev_count == 0:
+            self._curr, self._curr_count = value, 1
+        else:
+            self._curr = self._prev + self.alpha * (value - self._prev)
+            self._curr_count = self._prev_count + 1
+
+        return self._curr if self._curr_count >= self.period else nan
+
+
+class RMAKernel(EMAKernel):
+    """
+    Running (Wilder's) Moving Average, alpha = 1 / period.
+    Equivalent to pd.Series.ewm(alpha, adjust=False, ignore_na=True, min_periods=period).mean()
+    """
+
+    @staticmethod
+    def _alpha(period: int) -> float:
+        return 1 / period
@@ -0,0 +1,183 @@
+""" Incremental Rolling Window Kernels """
+
+from math import isnan, nan, sqrt
+from collections import deque
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from .kernel import Kernel
+
+
+class _WindowKernel(Kernel):
+    """
+    Base of the Kernels that need every value within the last 'period' bars. The values are kept
+    in a ring buffer, indexed by bar number, alongside a count of the missing values within it.
+    Like pd.Series.rolling(period), the output is NaN while any value in the window is missing.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._ring = np.full(period, nan)
+        self._index = -1  # Bar number of the most recent value
+        self._nans = period
+
+    def _load(self, values: np.ndarray):
+        "Reset the ring buffer to the last 'period' values of a history"
+        self._ring = np.full(self.period, nan)
+        self._index = len(values) - 1
+        for i in range(max(len(values) - self.period, 0), len(values)):
+            self._ring[i % self.period] = values[i]
+        self._nans = int(np.isnan(self._ring).sum())
+
+    def _write(self, value: float, is_new: bool) -> float:
+        "Write a value into the ring, returning the value it replaced"
+        if is_new or self._index < 0:
+            self._index += 1
+        slot = self._index % self.period
+        old = self._ring[slot]
+        self._nans += int(isnan(value)) - int(isnan(old))
+        self._ring[slot] = value
+        return old
+
+
+class _RollingExtremumKernel(_WindowKernel):
+    """
+    Rolling Max or Min via a monotonic deque of the (bar number, value) pairs that can still
+    become the extreme of the window. The deque only holds completed bars. The most recent bar is
+    compared separately so a revision can never discard a value it doesn't dominate.
+    """
+
+    def __init__(self, period: int):
+        super().__init__(period)
+        self._deque: deque[tuple[int, float]] = deque()
+        self._curr = nan
+
+    @staticmethod
+    @abstractmethod
+    def _dominates(a: float, b: float) -> bool:
+        "True if a is at least as extreme as b"
+
+    @abstractmethod
+    def _rolling(self, values: pd.Series) -> pd.Series:
+        "The vectorized rolling extreme of a full history of values"
+
+    def set(self, values: np.ndarray) -> np.ndarray:
+        self._load(values)
+        self._deque.clear()
+        self._curr = values[-1] if len(values) > 0 else nan
+        for i in range(max(len(values) - self.period, 0), len(values) - 1):
+            self._push(i, values[i])
+        return self._rolling(pd.Series(values)).to_numpy()
+
+    def update(self, value: float, is_new: bool) -> float:
+        if is_new and self._index >= 0:
+            self._push(self._index, self._curr)  # Commit the previous bar
+        self._write(value, is_new)
+        self._curr = value
+
+        while len(self._deque) > 0 and self._deque[0][0] <= self._index - self.period:
+            self._deque.popleft()
+        if self._nans > 0:
+            return nan
+        if len(self._deque) > 0 and self._dominates(self._deque[0][1], value):
+            return self._deque[0][1]
+        return value
+
+    def _push(self, index: int, value: float):
+        if isnan(value):
+            return
+        while len(self._deque) > 0 and self._dominates(value, self._deque[-1][1]):
+            self._deque.pop()
+        self._deque.append((index, value))
+
+
+class RollingMaxKernel(_RollingExtremumKernel):
+    "Rolling Maximum. Equivalent to pd.Series.rolling(period).max()"
+
+    @staticmethod
+    def _dominates(a: float, b: float) -> bool:
+        return a >= b
+
+    def _rolling(self, values: pd.Series) -> pd.Series:
+        return values.rolling(window=self.period).max()
+
+
+class RollingMinKernel(_RollingExtremumKernel):
+    "Rolling Minimum. Equivalent to pd.Series.rolling(period).min()"
+
+    @staticmethod
+    def _dominates(a: float, b: float) -> bool:
+        return a <= b
+
+    def _rolling(self, values: pd.Series) -> pd.Series:
+        return values.rolling(window=self.period).min()
+
+
+class StdDevKernel(_WindowKernel):
+    """
+    Rolling Standard Deviation. Equivalent to pd.Series.rolling(period).std(ddof)
+    ddof defaults to 0, the population standard deviation, as is used by Bollinger Bands.
+
+    Welford's algorithm keeps the mean & sum of squared deviations of the window, adding the
+    newest value and removing the one that leaves the window in O(1). Both are recomputed from
+    the ring buffer once per window to drop any accumulated floating point error.
+    """
+
+    def __init__(self, period: int, ddof: int = 0):
+        super().__init__(period)
+        if ddof >= period:
+            raise ValueError("StdDevKernel ddof must be less than the period")
+        self.ddof = ddof
+        self._count, self._mean, self._m2 = 0, 0.0, 0.0
+
+    def set(self, values: np.ndarray) -> np.ndarray:
+        self._load(values)
+        self._recompute()
+        std = pd.Series(values).rolling(window=self.period).std(ddof=self.ddof)
+        return std.to_numpy()
+
+    def update(self, value: float, is_new: bool) -> float:
+        old = self._write(value, is_new)
+        if not isnan(old):
+            self._remove(old)
+        if not isnan(value):
+            self._add(value)
+
+        if is_new and self._index % self.period == self.period - 1:
+            self._recompute()
+        return self.std
+
+    @property
+    def mean(self) -> float:
+        "Mean of the current window. NaN while any value in the window is missing"
+        return nan if self._nans > 0 else self._mean
+
+    @property
+    def std(self) -> float:
+        "Standard Deviation of the current window. NaN while any value is missing"
+        if self._nans > 0:
+            return nan
+        return sqrt(max(self._m2, 0.0) / (self._count - self.ddof))
+
+    def _add(self, value: float):
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(self, value: float):
+        self._count -= 1
+        if self._count == 0:
+            self._mean, self._m2 = 0.0, 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    def _recompute(self):
+        valid = self._ring[~np.isnan(self._ring)]
+        self._count = len(valid)
+        self._mean = float(valid.mean()) if self._count > 0 else 0.0
+        self._m2 = float(((valid - self._mean) ** 2).sum())
@@ -0,0 +1,72 @@
+""" Incremental Volatility Kernels """
+
+from math import nan
+
+import numpy as np
+
+from .kernel import Kernel
+from .moving_average import SMAKernel, RMAKernel
+from .rolling import StdDevKernel
+
+
+class ATRKernel(Kernel):
+    """
+    Average True Range, an RMA of each bar's True Range. The True Range of the first bar, or of a
+    bar following a missing close, is its high - low.
+
+    Takes the high, low, & close of each bar. The previous bar's close is held so a revision of
+    the current bar recomputes its True Range from the same base.
+    """
+
+    def __init__(self, period: int = 14):
+        super().__init__(period)
+        self._rma = RMAKernel(period)
+        self._prev, self._curr = nan, nan
+
+    def set(  # pylint: disable=arguments-differ
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> np.ndarray:
+        prev_close = np.concatenate(([nan], close[:-1]))
+        true_range = np.fmax(
+            high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+        )
+        self._prev = close[-2] if len(close) > 1 else nan
+        self._curr = close[-1] if len(close) > 0 else nan
+        return self._rma.set(true_range)
+
+    def update(  # pylint: disable=arguments-differ
+        self, high: float, low: float, close: float, is_new: bool
+    ) -> float:
+        if is_new:
+            self._prev = self._curr
+        self._curr = close
+
+        # np.fmax, as in set(), so a single missing input doesn't discard the whole range
+        true_range = float(
+            np.fmax(high - low, np.fmax(abs(high - self._prev), abs(low - self._prev)))
+        )
+        return self._rma.update(true_range, is_new)
+
+
+class BollingerKernel(Kernel):
+    """
+    Bollinger Bands. An SMA basis with bands 'mult' standard deviations above & below it.
+    The population standard deviation is used unless given a ddof.
+    set() & update() return (basis, upper, lower).
+    """
+
+    def __init__(self, period: int = 20, mult: float = 2.0, ddof: int = 0):
+        super().__init__(period)
+        self.mult = mult
+        self._basis = SMAKernel(period)
+        self._std = StdDevKernel(period, ddof)
+
+    def set(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        basis = self._basis.set(values)
+        dev = self.mult * self._std.set(values)
+        return basis, basis + dev, basis - dev
+
+    def update(self, value: float, is_new: bool) -> tuple[float, float, float]:
+        basis = self._basis.update(value, is_new)
+        dev = self.mult * self._std.update(value, is_new)
+        return basis, basis + dev, basis - dev
@@ -0,0 +1,69 @@
+""" Incremental Volume Weighted Kernels """
+
+from math import nan, sqrt
+
+import numpy as np
+import pandas as pd
+
+from .kernel import Kernel
+
+
+class VWAPKernel(Kernel):
+    """
+    Anchored Volume Weighted Average Price, and the volume weighted standard deviation of price
+    about it. Running sums of volume, price * volume, & price^2 * volume restart at each anchor.
+
+    set() takes an anchor id per bar, bars sharing an id are summed together. update() takes a
+    flag that a new bar starts a new anchor period. Bars with a missing price or volume carry no
+    weight. set() & update() return (vwap, stdev).
+    """
+
+    def __init__(self):
+        super().__init__(1)  # Anchored rather than a fixed length window
+        # Sums of the committed bars of the current anchor period & of the current bar
+        self._sums = (0.0, 0.0, 0.0)
+        self._curr = (0.0, 0.0, 0.0)
+
+    def set(  # pylint: disable=arguments-differ
+        self, price: np.ndarray, volume: np.ndarray, anchors: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        weight = np.where(np.isnan(price) | np.isnan(volume), 0.0, volume)
+        price = np.nan_to_num(price)
+        pv = price * weight
+        sums = (
+            pd.DataFrame({"v": weight, "pv": pv, "pv2": pv * price})
+            .groupby(anchors, sort=False)
+            .cumsum()
+            .to_numpy()
+        )
+
+        if len(sums) > 0:
+            self._curr = (float(weight[-1]), float(pv[-1]), float(pv[-1] * price[-1]))
+            self._sums = tuple(float(s - c) for s, c in zip(sums[-1], self._curr))
+        else:
+            self._sums = self._curr = (0.0, 0.0, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(sums[:, 0] > 0, sums[:, 1] / sums[:, 0], nan)
+            var = np.maximum(sums[:, 2] / sums[:, 0] - vwap**2, 0.0)
+        return vwap, np.sqrt(var)
+
+    def update(  # pylint: disable=arguments-differ
+        self, price: float, volume: float, is_new: bool, reset: bool = False
+    ) -> tuple[float, float]:
+        if is_new:
+            if reset:
+                self._sums = (0.0, 0.0, 0.0)
+            else:
+                self._sums = tuple(s + c for s, c in zip(self._sums, self._curr))
+
+        if price != price or volume != volume:  # NaN Check
+            self._curr = (0.0, 0.0, 0.0)
+        else:
+            self._curr = (volume, price * volume, price * price * volume)
+
+        v, pv, pv2 = (s + c for s, c in zip(self._sums, self._curr))
+        if v <= 0:
+            return nan, nan
+        vwap = pv / v
+        return vwap, sqrt(max(pv2 / v - vwap * vwap, 0.0))
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    SeriesData,
+    default_output_property,
+    output_property,
+    param,
+)
+from lightweight_pycharts.orm.options import PriceScaleMargins, PriceScaleOptions
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    HistogramStyleOptions,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import Color
+
+from .kernels import MACDKernel
+
+
+@dataclass
+class MACDOptions(Options):
+    "Dataclass of Options for the MACD Indicator"
+    src: Optional[SeriesData] = None
+    fast: int = param(12, "Fast Period", min_val=1)
+    slow: int = param(26, "Slow Period", min_val=1)
+    signal: int = param(9, "Signal Period", min_val=1)
+    macd_color: ... = param(Color.from_rgb(41, 98, 255), "MACD Color")
+    signal_color: ... = param(Color.from_rgb(255, 109, 0), "Signal Color")
+    hist_color: ... = param(Color.from_rgb(38, 166, 154), "Histogram Color")
+
+
+# pylint: disable=arguments-differ
+class MACD(StoredOutputs, Indicator):
+    "Moving Average Convergence Divergence. Calculated incrementally with a MACDKernel"
+
+    __options__ = MACDOptions
+    COLUMNS = ("macd", "signal", "histogram")
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[MACDOptions] = None,
+        display_name: str = "",
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = MACDOptions()
+
+        self.src = None
+        self.periods = (0, 0, 0)
+        self._kernel = MACDKernel()
+        self._data = BarStore()
+        self.hist_series = sc.HistogramSeries(
+            self, HistogramStyleOptions(priceScaleId="macd")
+        )
+        self.macd_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="macd"), name="MACD"
+        )
+        self.signal_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="macd"), name="Signal"
+        )
+        self.macd_series.apply_scale_options(
+            PriceScaleOptions(scaleMargins=PriceScaleMargins(0.75, 0))
+        )
+
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: MACDOptions) -> bool:
+        recalc = False
+        self.macd_series.apply_options(LineStyleOptions(color=opts.macd_color))
+        self.signal_series.apply_options(LineStyleOptions(color=opts.signal_color))
+        self.hist_series.apply_options(HistogramStyleOptions(color=opts.hist_color))
+
+        if self.periods != (opts.fast, opts.slow, opts.signal):
+            self.periods = (opts.fast, opts.slow, opts.signal)
+            self._kernel = MACDKernel(*self.periods)
+            recalc = True
+
+        if opts.src is None:
+            opts.src = self.default_parent_src
+
+        if self.src != opts.src:
+            self.src = opts.src
+            self.link_args({"data": self.src})
+            recalc = True
+
+        return recalc
+
+    def set_data(self, data: pd.Series, *_, **__):
+        values = self._kernel.set(data.to_numpy(dtype=float, na_value=float("nan")))
+        self._data = BarStore(
+            pd.DataFrame(dict(zip(self.COLUMNS, values)), index=data.index)
+        )
+        self.macd_series.set_data(self.macd())
+        self.signal_series.set_data(self.signal())
+        self.hist_series.set_data(self.histogram())
+
+    def update_data(self, time: pd.Timestamp, data: WindowedSeries, *_, **__):
+        is_new = self._is_new_bar(time)
+        macd, signal, hist = self._kernel.update(float(data[-1]), is_new)
+
+        values = {"macd": macd, "signal": signal, "histogram": hist}
+        self._store_bar(time, values, is_new)
+        self.macd_series.update_data(SingleValueData(time, macd))
+        self.signal_series.update_data(SingleValueData(time, signal))
+        self.hist_series.update_data(SingleValueData(time, hist))
+
+    @default_output_property
+    def macd(self) -> pd.Series:
+        "The difference of the Fast & Slow EMAs"
+        return self._column("macd")
+
+    @output_property
+    def signal(self) -> pd.Series:
+        "EMA of the MACD"
+        return self._column("signal")
+
+    @output_property
+    def histogram(self) -> pd.Series:
+        "The difference of the MACD & its Signal"
+        return self._column("histogram")
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    SeriesData,
+    default_output_property,
+    param,
+)
+from lightweight_pycharts.orm.options import PriceScaleMargins, PriceScaleOptions
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import Color
+
+from .kernels import RSIKernel
+
+
+@dataclass
+class RSIOptions(Options):
+    "Dataclass of Options for the RSI Indicator"
+    src: Optional[SeriesData] = None
+    period: int = param(14, "Period", min_val=1)
+    color: ... = param(Color.from_rgb(126, 87, 194), "Line Color", inline="line_style")
+    size: ... = param(1, "Line Size", inline="line_style", min_val=0, max_val=5)
+
+
+# pylint: disable=arguments-differ
+class RSI(StoredOutputs, Indicator):
+    "Relative Strength Index. Calculated incrementally with an RSIKernel"
+
+    __options__ = RSIOptions
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[RSIOptions] = None,
+        display_name: str = "",
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = RSIOptions()
+
+        self.src = None
+        self.period = 0
+        self._kernel = RSIKernel(14)
+        self._data = BarStore()
+        self.line_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="rsi"), name="RSI"
+        )
+        self.line_series.apply_scale_options(
+            PriceScaleOptions(scaleMargins=PriceScaleMargins(0.75, 0))
+        )
+
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: RSIOptions) -> bool:
+        recalc = False
+        self.line_series.apply_options(
+            LineStyleOptions(color=opts.color, lineWidth=opts.size)
+        )
+
+        if self.period != opts.period:
+            self.period = opts.period
+            self._kernel = RSIKernel(self.period)
+            recalc = True
+
+        if opts.src is None:
+            opts.src = self.default_parent_src
+
+        if self.src != opts.src:
+            self.src = opts.src
+            self.link_args({"data": self.src})
+            recalc = True
+
+        return recalc
+
+    def set_data(self, data: pd.Series, *_, **__):
+        values = self._kernel.set(data.to_numpy(dtype=float, na_value=float("nan")))
+        self._data = BarStore(pd.DataFrame({"rsi": values}, index=data.index))
+        self.line_series.set_data(self.rsi())
+
+    def update_data(self, time: pd.Timestamp, data: WindowedSeries, *_, **__):
+        is_new = self._is_new_bar(time)
+        value = self._kernel.update(float(data[-1]), is_new)
+
+        self._store_bar(time, {"rsi": value}, is_new)
+        self.line_series.update_data(SingleValueData(time, value))
+
+    @default_output_property
+    def rsi(self) -> pd.Series:
+        "The Relative Strength Index"
+        return self._column("rsi")
@@ -1,6 +1,8 @@
 """Series Indicator that recieves raw Timeseries Data and filters it"""
 
+from time import perf_counter
 from logging import getLogger
+from asyncio import TimerHandle, get_running_loop
 from dataclasses import dataclass
 from typing import (
     Optional,
@@ -8,6 +10,7 @@ from typing import (
     Callable,
 )
 
+import numpy as np
 import pandas as pd
 from numpy import nan
 
@@ -16,6 +19,7 @@ from lightweight_pycharts.orm.options import PriceScaleMargins, PriceScaleOption
 from lightweight_pycharts.orm.types import Color, PriceFormat
 
 from lightweight_pycharts import window as win
+from lightweight_pycharts import data_hub as dh
 from lightweight_pycharts import series_common as sc
 from lightweight_pycharts.indicator import (
     Indicator,
@@ -24,14 +28,17 @@ from lightweight_pycharts.indicator import (
     default_output_property,
 )
 from lightweight_pycharts.orm import Symbol, TF
+from lightweight_pycharts.orm.resample import Resampler
 from lightweight_pycharts.orm.series import (
     HistogramData,
     HistogramStyleOptions,
     Series_DF,
     SeriesType,
     AnyBasicData,
+    BarStore,
     ValueMap,
     Whitespace_DF,
+    WindowedSeries,
     SingleValueData,
     update_dataframe,
 )
@@ -71,6 +78,7 @@ class SeriesIndicatorOptions:
     "Indicator Options for a Series"
     visible: bool = True
     series_type: SeriesType = SeriesType.Candlestick
+    max_render_rate: Optional[float] = None  # Hz, None displays every tick
 
 
 class Series(Indicator):
@@ -104,6 +112,17 @@ class Series(Indicator):
         self._bar_state: Optional[BarState] = None
         self.main_data: Optional[Series_DF] = None
         self.whitespace_data: Optional[Whitespace_DF] = None
+        # Dataset shared with other Frames' Series through the Window's DataHub, if any
+        self._shared: Optional[dh.SharedData] = None
+        # Base resolution data main_data is resampled from, if any. See set_data()
+        self._resampler: Optional[Resampler] = None
+
+        # Render Throttle State. See set_render_rate()
+        self._render_interval = 0.0
+        self._last_render = 0.0
+        self._render_handle: Optional[TimerHandle] = None
+        self._pending_render: Optional[AnyBasicData] = None
+        self.set_render_rate(self.opts.max_render_rate)
 
         self.main_series = sc.SeriesCommon(self, self.opts.series_type)
 
@@ -137,21 +156,21 @@ class Series(Indicator):
         if self.main_data is None or self._bar_state is None:
             return
 
-        df = self.main_data.df
-        col_names = self.main_data.df.columns
+        # Read from the forming bar rather than the dataframe, this runs on every tick
+        bar = self.main_data.forming_bar
 
-        self._bar_state.index = len(self.main_data.df) - 1
-        self._bar_state.time = self.main_data.curr_bar_open_time
+        self._bar_state.index = len(self.main_data) - 1
+        self._bar_state.time = bar.time
         # self._bar_state.timestamp ## Set in Update Data
         self._bar_state.time_close = self.main_data.curr_bar_close_time
         self._bar_state.time_length = self.main_data.timedelta
-        self._bar_state.open = df.iloc[-1]["open"] if "open" in col_names else nan
-        self._bar_state.high = df.iloc[-1]["high"] if "high" in col_names else nan
-        self._bar_state.low = df.iloc[-1]["low"] if "low" in col_names else nan
-        self._bar_state.close = df.iloc[-1]["close"] if "close" in col_names else nan
-        self._bar_state.value = df.iloc[-1]["value"] if "value" in col_names else nan
-        self._bar_state.volume = df.iloc[-1]["volume"] if "volume" in col_names else nan
-        self._bar_state.ticks = df.iloc[-1]["ticks"] if "ticks" in col_names else nan
+        self._bar_state.open = bar.open
+        self._bar_state.high = bar.high
+        self._bar_state.low = bar.low
+        self._bar_state.close = bar.close
+        self._bar_state.value = bar.value
+        self._bar_state.volume = bar.volume
+        self._bar_state.ticks = bar.ticks
         # self._bar_state.is_ext=self.main_data.ext, TODO: Implement Time check
         # self._bar_state.is_new ## Set in Update Data
         # self._bar_state.is_single_value ## Constant
@@ -159,17 +178,28 @@ class Series(Indicator):
 
     def delete(self):
         super().delete()
+        self._release_shared()
+        self._set_resampler(None)
         if self.socket_open:
             self.events.socket_switch(state="close", symbol=self.symbol, series=self)
 
     def set_data(
         self,
-        data: pd.DataFrame | list[dict[str, Any]],
+        data: pd.DataFrame | list[dict[str, Any]] | Series_DF | Resampler,
         *_,
         symbol: Optional[Symbol] = None,
+        timeframe: Optional[TF] = None,
         **__,
     ):
-        "Sets the main source of data for this Frame"
+        """
+        Sets the main source of data for this Frame.
+
+        When given a timeframe that is higher than that of the data, the data is held as a
+        base resolution and resampled to the timeframe. Updates are then expected at the base
+        resolution, and a later request for another timeframe that can be derived from the base
+        is resampled locally rather than requested. A Resampler may be given directly to display
+        another of its timeframes.
+        """
         # Update the Symbol Regardless if data is good or not
         if symbol is not None:
             self.symbol = symbol
@@ -180,9 +210,18 @@ class Series(Indicator):
             self.parent_frame.__set_displayed_symbol__(self.symbol)
 
         # Initialize Data
-        if not isinstance(data, pd.DataFrame):
-            data = pd.DataFrame(data)
-        self.main_data = Series_DF(data, self.symbol.exchange)
+        self._cancel_render()
+        resampler = None
+        if isinstance(data, Resampler):
+            resampler = data
+            self.main_data = data.base
+        elif isinstance(data, Series_DF):
+            # Already Normalized, e.g. loaded from a DataCache
+            self.main_data = data
+        else:
+            if not isinstance(data, pd.DataFrame):
+                data = pd.DataFrame(data)
+            self.main_data = Series_DF(data, self.symbol.exchange)
 
         # Clear and Return on bad data.
         if self.main_data.timeframe == TF(1, "E"):
@@ -192,12 +231,32 @@ class Series(Indicator):
             self.clear_data(timeframe=self.main_data.timeframe)
             return
 
+        if (
+            resampler is None
+            and timeframe is not None
+            and timeframe != self.main_data.timeframe
+            and Resampler.can_resample(self.main_data.timeframe, timeframe)
+        ):
+            resampler = Resampler(self.main_data, self.symbol)
+        self._set_resampler(resampler)
+        if resampler is not None and timeframe is not None:
+            self.main_data = resampler.derive(timeframe)
+
         self._init_bar_state()
+        if self.__frame_primary_src__:
+            self._share_data()
+            # Must be set before any series, this or a dependent indicator's, displays data
+            self.parent_frame.__set_display_start__(self.main_data.df.index)
         self.main_series.set_data(self.main_data)
 
         # Only make Whitespace Series if this is the primary dataset
         if self.__frame_primary_src__:
-            self.whitespace_data = Whitespace_DF(self.main_data)
+            if self._shared is not None and self._shared.whitespace is not None:
+                self.whitespace_data = self._shared.whitespace
+            else:
+                self.whitespace_data = Whitespace_DF(self.main_data)
+                if self._shared is not None:
+                    self._shared.whitespace = self.whitespace_data
             self.parent_frame.__set_whitespace__(
                 self.whitespace_data.df,
                 SingleValueData(self.main_data.curr_bar_open_time, 0),
@@ -229,60 +288,217 @@ class Series(Indicator):
         ):
             return
 
+        if self._resampler is not None:
+            self._resampled_update(data_update, accumulate)
+            return
+
         if data_update.time < self.main_data.next_bar_time:  # type: ignore
             # Update the last bar
+            is_new = False
             display_data = self.main_data.update_from_tick(
                 data_update, accumulate=accumulate
             )
-            if self._bar_state is not None:
-                self._bar_state.is_new = False
         else:
-            # Create new Bar
+            # Create new Bar, The closing state of the last bar must be displayed first.
+            is_new = True
+            for series in self._sharing():
+                series._render()
+
             if data_update.time != self.main_data.next_bar_time:
                 # Update given is a new bar, but not the expected time
                 # Ensure it fits the data's time interval
                 time_delta = data_update.time - self.main_data.next_bar_time  # type: ignore
                 data_update.time -= time_delta % self.main_data.timedelta  # type: ignore
 
-            curr_bar_time = self.main_data.curr_bar_open_time
             display_data = self.main_data.update(data_update)
-            if self._bar_state is not None:
-                self._bar_state.is_new = True
-
-            # Manage Whitespace Series
-            if self.__frame_primary_src__ and self.whitespace_data is not None:
-                if data_update.time != (
-                    expected_time := self.whitespace_data.next_timestamp(curr_bar_time)
-                ):
-                    # New Data Jumped more than expected, Replace Whitespace Data So
-                    # There are no unnecessary gaps.
-                    logger.info(
-                        "Whitespace_DF Predicted incorrectly. Expected_time: %s, Recieved_time: %s",
-                        expected_time,
-                        data_update.time,
-                    )
-                    self.whitespace_data = Whitespace_DF(self.main_data)
-                    self.parent_frame.__set_whitespace__(
-                        self.whitespace_data.df,
-                        SingleValueData(self.main_data.curr_bar_open_time, 0),
-                    )
-                else:
-                    # Lengthen Whitespace Data to keep 500bar Buffer
-                    self.parent_frame.__update_whitespace__(
-                        self.whitespace_data.extend(),
-                        SingleValueData(self.main_data.curr_bar_open_time, 0),
-                    )
+
+        self._share_update(display_data, is_new, data_update.time)
+
+    def _resampled_update(self, data_update: AnyBasicData, accumulate: bool):
+        "Apply a base resolution update to the Resampler then display it on every timeframe"
+        resampler = self._resampler
+        if resampler is None:
+            return
+        # The closing state of any bar that is about to be completed must be displayed first.
+        for subscriber in resampler.subscribers:
+            if (
+                subscriber.main_data is not None
+                and data_update.time >= subscriber.main_data.next_bar_time
+            ):
+                for series in subscriber._sharing():
+                    series._render()
+
+        updates = resampler.update(data_update, accumulate=accumulate)
+        for subscriber in list(resampler.subscribers):
+            if subscriber.main_data is None:
+                continue
+            tf_str = subscriber.main_data.timeframe.toString
+            if (update := updates.get(tf_str)) is not None:
+                subscriber._share_update(*update, data_update.time)
+
+    def _sharing(self) -> list["Series"]:
+        "Every Series displaying this Series' main_data, itself included"
+        return list(self._shared.subscribers) if self._shared is not None else [self]
+
+    def _share_update(
+        self, display_data: AnyBasicData, is_new: bool, timestamp: pd.Timestamp
+    ):
+        "Manage the Whitespace of an update applied to main_data then display it on every Frame"
+        whitespace_update: Optional[AnyBasicData | Whitespace_DF] = None
+        if (
+            is_new
+            and self.main_data is not None
+            and self.__frame_primary_src__
+            and self.whitespace_data is not None
+        ):
+            prev_bar_time = self.main_data.df.index[-2]
+            if self.main_data.curr_bar_open_time != (
+                expected_time := self.whitespace_data.next_timestamp(prev_bar_time)
+            ):
+                # New Data Jumped more than expected, Replace Whitespace Data So
+                # There are no unnecessary gaps.
+                logger.info(
+                    "Whitespace_DF Predicted incorrectly. Expected_time: %s, Recieved_time: %s",
+                    expected_time,
+                    self.main_data.curr_bar_open_time,
+                )
+                whitespace_update = Whitespace_DF(self.main_data)
+                if self._shared is not None:
+                    self._shared.whitespace = whitespace_update
+            else:
+                # Lengthen Whitespace Data to keep 500bar Buffer
+                whitespace_update = self.whitespace_data.extend()
+
+        # The update is only applied to the data once, every sharing Frame displays it
+        for series in self._sharing():
+            series._display_update(display_data, is_new, timestamp, whitespace_update)
+
+    def _display_update(
+        self,
+        display_data: AnyBasicData,
+        is_new: bool,
+        timestamp: pd.Timestamp,
+        whitespace_update: Optional[AnyBasicData | Whitespace_DF] = None,
+    ):
+        "Display an update that has already been applied to main_data"
+        if self.main_data is None:
+            return
+        if self._bar_state is not None:
+            self._bar_state.is_new = is_new
+
+        if isinstance(whitespace_update, Whitespace_DF):
+            self.whitespace_data = whitespace_update
+            self.parent_frame.__set_whitespace__(
+                self.whitespace_data.df,
+                SingleValueData(self.main_data.curr_bar_open_time, 0),
+            )
+        elif whitespace_update is not None:
+            self.parent_frame.__update_whitespace__(
+                whitespace_update,
+                SingleValueData(self.main_data.curr_bar_open_time, 0),
+            )
 
         self._update_bar_state()
         if self._bar_state is not None:
-            self._bar_state.timestamp = pd.Timestamp(data_update.time)
-        self.main_series.update_data(display_data)
+            self._bar_state.timestamp = pd.Timestamp(timestamp)
 
-        # All Indicators need to update given new data, notify them to reset the updated state
-        self._watcher.reset_updated_state()
-        self._watcher.updated = True
+        self._pending_render = display_data
+        delay = self._last_render + self._render_interval - perf_counter()
+        if not is_new and delay > 0:
+            # Throttled, display the latest tick once the render interval has elapsed
+            self._schedule_render(delay)
+        else:
+            self._render()
+
+        # All Indicators need to update given new data, Notified in dependency order.
+        # Only the display is throttled, dependent indicators see every tick.
         self._notify_observers_update()
 
+    def _share_data(self):
+        "Subscribe main_data to the Window's DataHub so it's shared with Frames displaying it"
+        hub = self.parent_frame._window.data_hub
+        if hub is None or self.main_data is None:
+            return
+        shared = hub.subscribe(self, self.symbol, self.main_data)
+        if self._shared is not None and self._shared is not shared:
+            hub.unsubscribe(self, self._shared)
+        self._shared = shared
+
+    def _set_resampler(self, resampler: Optional[Resampler]):
+        "Subscribe to a Resampler, leaving the previous. Its feed moves to the next subscriber"
+        prev = self._resampler
+        if prev is resampler:
+            return
+        if resampler is not None:
+            resampler.subscribers.append(self)
+        self._resampler = resampler
+        if prev is None or self not in prev.subscribers:
+            return
+
+        was_feeder = prev.feeder is self
+        prev.subscribers.remove(self)
+        if not was_feeder or (feeder := prev.feeder) is None:
+            return
+        if not feeder.socket_open:
+            feeder.events.socket_switch(state="open", symbol=prev.symbol, series=feeder)
+
+    @property
+    def socket_feeder(self) -> bool:
+        "False if another Series' socket supplies the updates of the data this Series displays"
+        if self._resampler is not None:
+            return self._resampler.feeder is self
+        if self._shared is not None:
+            return self._shared.feeder is self
+        return True
+
+    def _release_shared(self):
+        "Unsubscribe from the Window's DataHub"
+        if self._shared is None:
+            return
+        if (hub := self.parent_frame._window.data_hub) is not None:
+            hub.unsubscribe(self, self._shared)
+        self._shared = None
+
+    def set_render_rate(self, max_rate: Optional[float]):
+        """
+        Limit the rate, in Hz, at which tick updates of the Series are displayed. The Series' own
+        data, BarState, and dependent indicators are still updated on every tick. Only the latest
+        tick is displayed once the interval elapses, and the closing state of a bar is always
+        displayed before a new bar. None or 0 displays every tick.
+        """
+        self._render_interval = 1 / max_rate if max_rate else 0.0
+        if self._render_interval == 0:
+            self._render()
+
+    def _schedule_render(self, delay: float):
+        "Ensure a pending render is displayed even if no further ticks are received"
+        if self._render_handle is not None:
+            return
+        try:
+            self._render_handle = get_running_loop().call_later(delay, self._render)
+        except RuntimeError:
+            # No Event Loop to schedule on, Display immediately instead.
+            self._render()
+
+    def _cancel_render(self):
+        "Drop any pending render"
+        self._pending_render = None
+        if self._render_handle is not None:
+            self._render_handle.cancel()
+            self._render_handle = None
+
+    def _render(self):
+        "Display the pending update"
+        if self._render_handle is not None:
+            self._render_handle.cancel()
+            self._render_handle = None
+        if self._pending_render is None:
+            return
+
+        display_data, self._pending_render = self._pending_render, None
+        self._last_render = perf_counter()
+        self.main_series.update_data(display_data)
+
     def clear_data(
         self, timeframe: Optional[TF] = None, symbol: Optional[Symbol] = None, **_
     ):
@@ -292,10 +508,14 @@ class Series(Indicator):
         """
         self.main_data = None
         self._bar_state = None
+        self._cancel_render()
+        self._release_shared()
+        self._set_resampler(None)
 
         if self.__frame_primary_src__:
             self.whitespace_data = None
             self.parent_frame.__clear_whitespace__()
+            self.parent_frame.__set_display_start__(None)
 
         if self.socket_open:
             # Ensure Socket is Closed
@@ -380,6 +600,14 @@ class Series(Indicator):
 
     # region ---------------- Output Properties ----------------
 
+    def __windowed_output__(self, name: str) -> Optional[WindowedSeries]:
+        "Zero-copy views of the open, high, low, close, & volume columns of the main data"
+        if name not in ("open", "high", "low", "close", "volume"):
+            return None
+        if self.main_data is None or name not in self.main_data.df.columns:
+            return None
+        return self.main_data.window(name)
+
     @output_property
     def last_bar_index(self) -> int:
         "Last Bar Index of the dataset. Returns -1 if there is no valid data"
@@ -458,7 +686,13 @@ class VolumeIndicatorOptions:
 
 
 class Volume(Indicator):
-    "Histogram Series that plots the Volume of a given Series(Indicator)"
+    """
+    Histogram Series that plots the Volume of a given Series(Indicator)
+
+    Bar colors are precomputed once as JS color strings and assigned with a vectorized lookup,
+    so they are serialized as plain strings rather than Color objects encoded row by row. The
+    volume & color columns are held in a BarStore so updates are appended in place.
+    """
 
     def __init__(
         self,
@@ -469,7 +703,11 @@ class Volume(Indicator):
         super().__init__(parent)
 
         self.opts = options
-        self._data = pd.DataFrame()
+        self._data = BarStore()
+        # Color of a down bar, up bar, and a bar with no open/close. Indexed by _color_codes()
+        self._palette = np.array(
+            [repr(self.opts.down_color), repr(self.opts.up_color), None], dtype=object
+        )
         self.series_map = ValueMap("volume", color="vol_color")
         self.series = sc.SeriesCommon(
             self, SeriesType.Histogram, self.opts.series_opts, v_map=self.series_map
@@ -485,26 +723,36 @@ class Volume(Indicator):
         if "volume" not in data.columns:
             return
 
-        self._data = pd.DataFrame(data["volume"])
-
+        columns = {"volume": data["volume"].to_numpy()}
         if set(["open", "close"]).issubset(data.columns):
-            color = data["close"] > data["open"]
-            self._data["vol_color"] = color.replace(
-                {True: self.opts.up_color, False: self.opts.down_color}
+            codes = self._color_codes(
+                data["open"].to_numpy(np.float64), data["close"].to_numpy(np.float64)
             )
-        self.series.set_data(self._data)
+            columns["vol_color"] = self._palette[codes]
+
+        self._data = BarStore(pd.DataFrame(columns, index=data.index))
+        self.series.set_data(self._data.df)
 
     def update_data(self, bar_state: BarState, *_, **__):
-        if bar_state.volume is nan:
+        if bar_state.volume != bar_state.volume:  # NaN Check
             return
 
-        if bar_state.close is nan or bar_state.open is nan:
-            color = None
-        elif bar_state.close > bar_state.open:
-            color = self.opts.up_color
-        else:
-            color = self.opts.down_color
+        code = self._color_codes(
+            np.array([bar_state.open]), np.array([bar_state.close])
+        )[0]
+        color = self._palette[code]
+
+        self.series.update_data(
+            HistogramData(bar_state.time, bar_state.volume, color=color)
+        )
+        update_dataframe(
+            self._data,
+            {"time": bar_state.time, "volume": bar_state.volume, "vol_color": color},
+        )
 
-        update_data = HistogramData(bar_state.time, bar_state.volume, color=color)
-        self.series.update_data(update_data)
-        self._data = update_dataframe(self._data, update_data, self.series_map)
+    @staticmethod
+    def _color_codes(open_: np.ndarray, close: np.ndarray) -> np.ndarray:
+        "Index into the palette of each bar. 0 = down, 1 = up, 2 = open or close is NaN"
+        codes = (close > open_).astype(np.intp)
+        codes[np.isnan(open_) | np.isnan(close)] = 2
+        return codes
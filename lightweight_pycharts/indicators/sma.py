@@ -8,15 +8,23 @@ from lightweight_pycharts.indicator import (
     IndParent_T,
     Options,
     Indicator,
+    StoredOutputs,
     SeriesData,
     default_output_property,
     param,
 )
 from lightweight_pycharts.orm.enum import LineStyle
-from lightweight_pycharts.orm.series import LineStyleOptions, SingleValueData
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
 from lightweight_pycharts import series_common as sc
 from lightweight_pycharts.orm.types import Color
 
+from .kernels import Kernel, SMAKernel, EMAKernel, RMAKernel
+
 
 class Method(Enum):
     "Calculation Methods"
@@ -25,6 +33,13 @@ class Method(Enum):
     RMA = auto()
 
 
+KERNELS: dict[Method, type[Kernel]] = {
+    Method.SMA: SMAKernel,
+    Method.EMA: EMAKernel,
+    Method.RMA: RMAKernel,
+}
+
+
 @dataclass
 class SMAOptions(Options):
     "Dataclass of Options for the SMA Indicator"
@@ -36,8 +51,8 @@ class SMAOptions(Options):
 
 
 # pylint: disable=arguments-differ possibly-unused-variable
-class SMA(Indicator):
-    "Simple Moving Average Indicator"
+class SMA(StoredOutputs, Indicator):
+    "Moving Average Indicator. Calculated incrementally with an SMA, EMA, or RMA Kernel"
 
     __options__ = SMAOptions
 
@@ -53,7 +68,9 @@ class SMA(Indicator):
 
         self.src = None
         self.period = 0
-        self._data = pd.Series()
+        self.method = Method.SMA
+        self._kernel: Kernel = SMAKernel(1)
+        self._data = BarStore()
         self.line_series = sc.LineSeries(self, name="My SMA")
         self.line_series.apply_options(
             LineStyleOptions(lineStyle=LineStyle.SparseDotted)
@@ -68,8 +85,10 @@ class SMA(Indicator):
             LineStyleOptions(color=opts.color, lineWidth=opts.size)
         )
 
-        if self.period != opts.period:
+        if self.period != opts.period or self.method != opts.method:
             self.period = opts.period
+            self.method = opts.method
+            self._kernel = KERNELS[self.method](self.period)
             recalc = True
 
         if opts.src is None:
@@ -83,14 +102,18 @@ class SMA(Indicator):
         return "recalc" in locals()
 
     def set_data(self, data: pd.Series, *_, **__):
-        self._data = data.rolling(window=self.period).mean()
-        self.line_series.set_data(self._data)
+        values = self._kernel.set(data.to_numpy(dtype=float, na_value=float("nan")))
+        self._data = BarStore(pd.DataFrame({"average": values}, index=data.index))
+        self.line_series.set_data(self.average())
+
+    def update_data(self, time: pd.Timestamp, data: WindowedSeries, *_, **__):
+        is_new = self._is_new_bar(time)
+        value = self._kernel.update(float(data[-1]), is_new)
 
-    def update_data(self, time: pd.Timestamp, data: pd.Series, *_, **__):
-        self._data[time] = data.tail(self.period).mean()
-        self.line_series.update_data(SingleValueData(time, self._data.iloc[-1]))
+        self._store_bar(time, {"average": value}, is_new)
+        self.line_series.update_data(SingleValueData(time, value))
 
     @default_output_property
     def average(self) -> pd.Series:
-        "The resulting SMA"
-        return self._data
+        "The resulting Moving Average"
+        return self._column("average")
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    default_output_property,
+    output_property,
+    param,
+)
+from lightweight_pycharts.orm.options import PriceScaleMargins, PriceScaleOptions
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import Color
+
+from .kernels import StochKernel
+from .series import Series
+
+
+@dataclass
+class StochasticOptions(Options):
+    "Dataclass of Options for the Stochastic Indicator"
+
+    period: int = param(14, "%K Length", min_val=1)
+    k_smooth: int = param(1, "%K Smoothing", min_val=1)
+    d_period: int = param(3, "%D Smoothing", min_val=1)
+    k_color: ... = param(Color.from_rgb(41, 98, 255), "%K Color")
+    d_color: ... = param(Color.from_rgb(255, 109, 0), "%D Color")
+
+
+# pylint: disable=arguments-differ
+class Stochastic(StoredOutputs, Indicator):
+    """
+    Stochastic Oscillator of a Series. Calculated incrementally with a StochKernel.
+    Uses the parent Series, or the Frame's main Series when the parent isn't a Series.
+    """
+
+    __options__ = StochasticOptions
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[StochasticOptions] = None,
+        display_name: str = "",
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = StochasticOptions()
+
+        self.periods = (0, 0, 0)
+        self._kernel = StochKernel()
+        self._data = BarStore()
+        self.k_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="stoch"), name="%K"
+        )
+        self.d_series = sc.LineSeries(
+            self, LineStyleOptions(priceScaleId="stoch"), name="%D"
+        )
+        self.k_series.apply_scale_options(
+            PriceScaleOptions(scaleMargins=PriceScaleMargins(0.75, 0))
+        )
+
+        src = self.parent_indicator
+        if not isinstance(src, Series):
+            src = self.parent_frame.main_series
+        self.link_args({"high": src.high, "low": src.low, "close": src.close})
+
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: StochasticOptions) -> bool:
+        recalc = False
+        self.k_series.apply_options(LineStyleOptions(color=opts.k_color))
+        self.d_series.apply_options(LineStyleOptions(color=opts.d_color))
+
+        if self.periods != (opts.period, opts.k_smooth, opts.d_period):
+            self.periods = (opts.period, opts.k_smooth, opts.d_period)
+            self._kernel = StochKernel(*self.periods)
+            recalc = True
+
+        return recalc
+
+    def set_data(self, high: pd.Series, low: pd.Series, close: pd.Series, *_, **__):
+        k, d = self._kernel.set(
+            *(
+                s.to_numpy(dtype=float, na_value=float("nan"))
+                for s in (high, low, close)
+            )
+        )
+        self._data = BarStore(pd.DataFrame({"k": k, "d": d}, index=close.index))
+        self.k_series.set_data(self.k())
+        self.d_series.set_data(self.d())
+
+    def update_data(
+        self,
+        time: pd.Timestamp,
+        high: WindowedSeries,
+        low: WindowedSeries,
+        close: WindowedSeries,
+        *_,
+        **__,
+    ):
+        is_new = self._is_new_bar(time)
+        k, d = self._kernel.update(
+            float(high[-1]), float(low[-1]), float(close[-1]), is_new
+        )
+
+        self._store_bar(time, {"k": k, "d": d}, is_new)
+        self.k_series.update_data(SingleValueData(time, k))
+        self.d_series.update_data(SingleValueData(time, d))
+
+    @default_output_property
+    def k(self) -> pd.Series:
+        "The %K Line"
+        return self._column("k")
+
+    @output_property
+    def d(self) -> pd.Series:
+        "The %D Line, an SMA of %K"
+        return self._column("d")
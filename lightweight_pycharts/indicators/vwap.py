@@ -0,0 +1,277 @@
+from enum import Enum, auto
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from lightweight_pycharts.indicator import (
+    IndParent_T,
+    Options,
+    Indicator,
+    StoredOutputs,
+    default_output_property,
+    output_property,
+    param,
+)
+from lightweight_pycharts.orm.calendars import SessionBounds
+from lightweight_pycharts.orm.resample import period_labels
+from lightweight_pycharts.orm.series import (
+    BarStore,
+    LineStyleOptions,
+    SingleValueData,
+    WindowedSeries,
+)
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.orm.types import TF, Color
+
+from .kernels import VWAPKernel
+from .series import Series
+
+
+class Anchor(Enum):
+    "Periods the VWAP restarts at the beginning of"
+    SESSION = auto()
+    WEEK = auto()
+    MONTH = auto()
+    QUARTER = auto()
+    YEAR = auto()
+    CUSTOM = auto()
+
+
+ANCHOR_TFS: dict[Anchor, TF] = {
+    Anchor.SESSION: TF(1, "D"),
+    Anchor.WEEK: TF(1, "W"),
+    Anchor.MONTH: TF(1, "M"),
+    Anchor.QUARTER: TF(3, "M"),
+    Anchor.YEAR: TF(1, "Y"),
+}
+
+
+@dataclass
+class VWAPOptions(Options):
+    "Dataclass of Options for the VWAP Indicator"
+    anchor: Anchor = param(Anchor.SESSION, "Anchor Period")
+    bands: bool = param(False, "Show Bands", inline="bands")
+    mult: float = param(1.0, "StdDev Multiplier", inline="bands", min_val=0.0, step=0.5)
+    color: ... = param(Color.from_rgb(41, 98, 255), "VWAP Color")
+    band_color: ... = param(Color.from_rgb(76, 175, 80), "Band Color")
+
+
+# pylint: disable=arguments-differ
+class VWAP(StoredOutputs, Indicator):
+    """
+    Anchored Volume Weighted Average Price of the HLC3 of a Series, with optional bands a multiple
+    of the volume weighted standard deviation above & below it. Uses the parent Series, or the
+    Frame's main Series when the parent isn't a Series.
+
+    The VWAP restarts at the first bar of each Session, Week, Month, Quarter, or Year of the
+    data's market calendar. Anchor.CUSTOM restarts at each of the times given by set_anchors().
+    Session boundaries are precomputed so live updates only compare the bar's time to the start
+    of the next session.
+    """
+
+    __options__ = VWAPOptions
+    COLUMNS = ("vwap", "upper", "lower")
+
+    def __init__(
+        self,
+        parent: IndParent_T,
+        opts: Optional[VWAPOptions] = None,
+        display_name: str = "",
+        anchors: Optional[Sequence[pd.Timestamp | str]] = None,
+    ):
+        super().__init__(parent, display_name=display_name)
+        if opts is None:
+            opts = VWAPOptions()
+
+        self.anchor: Optional[Anchor] = None
+        self.mult = 0.0
+        self._anchors = np.empty(0, dtype=np.int64)
+        self._sessions: Optional[SessionBounds] = None
+        self._by_date = False
+        # Anchor id of the most recent bar & the time at which the next anchor could begin
+        self._anchor_id = None
+        self._next_reset = 0
+
+        self._kernel = VWAPKernel()
+        self._data = BarStore()
+        self.vwap_series = sc.LineSeries(self, name="VWAP")
+        self.upper_series = sc.LineSeries(self, name="Upper")
+        self.lower_series = sc.LineSeries(self, name="Lower")
+
+        self._source = self.parent_indicator
+        if not isinstance(self._source, Series):
+            self._source = self.parent_frame.main_series
+        src = self._source
+        self.link_args(
+            {"high": src.high, "low": src.low, "close": src.close, "volume": src.volume}
+        )
+
+        if anchors is not None:
+            self.set_anchors(anchors)
+        self.update_options(opts)
+        self.init_menu(opts)
+        self.recalculate()
+
+    def update_options(self, opts: VWAPOptions) -> bool:
+        recalc = False
+        self.vwap_series.apply_options(LineStyleOptions(color=opts.color))
+        for band in (self.upper_series, self.lower_series):
+            band.apply_options(
+                LineStyleOptions(color=opts.band_color, visible=opts.bands)
+            )
+
+        if self.anchor != opts.anchor or self.mult != opts.mult:
+            self.anchor, self.mult = opts.anchor, opts.mult
+            recalc = True
+
+        return recalc
+
+    def set_anchors(self, anchors: Sequence[pd.Timestamp | str]):
+        "Set the times Anchor.CUSTOM restarts at. Naive times are assumed to be UTC"
+        times = pd.DatetimeIndex(anchors)
+        if times.tz is None:
+            times = times.tz_localize("UTC")
+        self._anchors = np.sort(times.tz_convert("UTC").as_unit("ns").asi8)
+        if self.anchor == Anchor.CUSTOM:
+            self.recalculate()
+
+    # region ---------------- Anchors ----------------
+
+    def _ensure_sessions(self) -> bool:
+        "Match the session bounds to the calendar of the source's data. False if there's no data"
+        if (data := self._source.main_data) is None:
+            return False
+        sessions = self._sessions
+        if (
+            sessions is None
+            or sessions.calendar is not data.calendar
+            or sessions.ext != data.ext
+        ):
+            self._sessions = SessionBounds(data.calendar, data.ext)
+        self._by_date = data.only_days
+        return True
+
+    def _anchor_ids(self, times: np.ndarray) -> np.ndarray:
+        "Id of the anchor period each of the given bar times, UTC Epoch Nanoseconds, belongs to"
+        if self.anchor == Anchor.CUSTOM:
+            return np.searchsorted(self._anchors, times, side="right")
+        opens, days = self._sessions.locate(times, self._by_date)  # type: ignore
+        return period_labels(times, opens, days, ANCHOR_TFS[self.anchor])  # type: ignore
+
+    def _reset_after(self, time_ns: int) -> int:
+        "The earliest time after the given time that could begin a new anchor period"
+        if self.anchor == Anchor.CUSTOM:
+            i = int(np.searchsorted(self._anchors, time_ns, side="right"))
+            if i < len(self._anchors):
+                return int(self._anchors[i])
+            return int(np.iinfo(np.int64).max)
+        return self._sessions.next_start(time_ns, self._by_date)  # type: ignore
+
+    # endregion
+
+    def set_data(
+        self,
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        volume: pd.Series,
+        *_,
+        **__,
+    ):
+        self._anchor_id, self._next_reset = None, 0
+        if len(close) == 0 or not self._ensure_sessions():
+            self._kernel = VWAPKernel()
+            self._data = BarStore()
+            return
+
+        # Series without a high & low, e.g. Line Series, fall back to the close
+        index, nan = close.index, float("nan")
+        h, l, c = (
+            s.reindex(index).to_numpy(dtype=float, na_value=nan)
+            for s in (high, low, close)
+        )
+        price = (h + l + c) / 3
+        price = np.where(np.isnan(price), c, price)
+
+        times = index.asi8
+        ids = self._anchor_ids(times)
+        vwap, stdev = self._kernel.set(
+            price, volume.reindex(index).to_numpy(dtype=float, na_value=nan), ids
+        )
+        self._anchor_id = ids[-1]
+        self._next_reset = self._reset_after(int(times[-1]))
+
+        self._data = BarStore(
+            pd.DataFrame(
+                {
+                    "vwap": vwap,
+                    "upper": vwap + self.mult * stdev,
+                    "lower": vwap - self.mult * stdev,
+                },
+                index=index,
+            )
+        )
+        self.vwap_series.set_data(self.vwap())
+        self.upper_series.set_data(self.upper())
+        self.lower_series.set_data(self.lower())
+
+    def update_data(
+        self,
+        time: pd.Timestamp,
+        high: WindowedSeries,
+        low: WindowedSeries,
+        close: WindowedSeries,
+        volume: WindowedSeries,
+        *_,
+        **__,
+    ):
+        if self._sessions is None and self.anchor != Anchor.CUSTOM:
+            # Updated without first being set, e.g. after clear_data()
+            if not self._ensure_sessions():
+                return
+        is_new = self._is_new_bar(time)
+
+        reset = False
+        if is_new and (self._anchor_id is None or time.value >= self._next_reset):
+            # Only determine the bar's anchor period once a new period could have begun
+            anchor_id = self._anchor_ids(np.array([time.value]))[0]
+            reset = anchor_id != self._anchor_id
+            self._anchor_id = anchor_id
+            self._next_reset = self._reset_after(time.value)
+
+        price = (high.ago(0) + low.ago(0) + close.ago(0)) / 3
+        if price != price:  # NaN Check
+            price = close.ago(0)
+        vwap, stdev = self._kernel.update(price, volume.ago(0), is_new, reset)
+
+        values = {
+            "vwap": vwap,
+            "upper": vwap + self.mult * stdev,
+            "lower": vwap - self.mult * stdev,
+        }
+        self._store_bar(time, values, is_new)
+        self.vwap_series.update_data(SingleValueData(time, vwap))
+        self.upper_series.update_data(SingleValueData(time, values["upper"]))
+        self.lower_series.update_data(SingleValueData(time, values["lower"]))
+
+    def clear_data(self):
+        super().clear_data()
+        self._sessions = None
+        self._anchor_id = None
+
+    @default_output_property
+    def vwap(self) -> pd.Series:
+        "The Volume Weighted Average Price"
+        return self._column("vwap")
+
+    @output_property
+    def upper(self) -> pd.Series:
+        "The Upper Band, 'mult' standard deviations above the VWAP"
+        return self._column("upper")
+
+    @output_property
+    def lower(self) -> pd.Series:
+        "The Lower Band, 'mult' standard deviations below the VWAP"
+        return self._column("lower")
@@ -6,7 +6,8 @@ from inspect import getmembers, ismethod
 import multiprocessing as mp
 from multiprocessing.synchronize import Event as mp_EventClass
 from dataclasses import dataclass, field
-from typing import Callable, Optional, Protocol
+from time import perf_counter, time
+from typing import Any, Callable, Optional, Protocol
 from abc import ABC, abstractmethod
 
 import webview
@@ -18,6 +19,7 @@ from . import orm
 from . import js_cmd as cmds
 from .orm.series import SeriesType
 from .js_cmd import JS_CMD, PY_CMD
+from .stats import StatsRecorder
 
 file_dir = dirname(abspath(__file__))
 logger = logging.getLogger("lightweight-pycharts")
@@ -106,6 +108,19 @@ class js_api:
         except ValueError as e:
             logger.warning(e)
 
+    def range_change(
+        self, container_id: str, frame_id: str, logical_from: float, logical_to: float
+    ):
+        self.rtn_queue.put(
+            (
+                PY_CMD.RANGE_CHANGE,
+                container_id,
+                frame_id,
+                float(logical_from),
+                float(logical_to),
+            )
+        )
+
     def symbol_search(
         self,
         symbol: str,
@@ -129,6 +144,15 @@ class js_api:
 ##### --------------------------------- Helper Classes --------------------------------- #####
 
 
+@dataclass
+class QueueCounters:
+    "Running totals kept by a View while managing the fwd_queue"
+    commands: int = 0
+    batches: int = 0
+    coalesced: int = 0
+    script_bytes: int = 0
+
+
 @dataclass
 class MpHooks:
     "All required Multiprocessor Hooks required for a javascript interface"
@@ -162,6 +186,14 @@ class View(ABC):
         run_script():       Callable function that takes a string representation of javascript that
                             will be evaluated in the window
         rolodex:            A Dict Mapping JS_CMDs to Instance Functions for easy access
+        batch_bytes:        Script size, in characters, at which a batch of cmds is flushed
+        batch_time:         Time, in seconds, after which a batch of cmds is flushed. Defaults
+                                to a single 60Hz frame.
+        counters:           Running totals of the commands received, batches run, and
+                                superseded UPDATE_SERIES_DATA cmds that were dropped
+        recorder:           Optional per JS_CMD instrumentation. Enabled by giving a
+                                stats_interval, snapshots are returned to __main_mp__ via
+                                PY_CMD.PIPELINE_STATS at most once per interval (seconds)
 
     """
 
@@ -169,8 +201,15 @@ class View(ABC):
         self,
         hooks: MpHooks,
         run_script: _scriptProtocol,
+        batch_bytes: int = 2**21,
+        batch_time: float = 0.016,
+        stats_interval: Optional[float] = None,
     ) -> None:
         self.run_script = run_script
+        self.batch_bytes = batch_bytes
+        self.batch_time = batch_time
+        self.counters = QueueCounters()
+        self.recorder = StatsRecorder(stats_interval) if stats_interval else None
         self.fwd_queue = hooks.fwd_queue
         self.rtn_queue = hooks.rtn_queue
         self.js_loaded_event = hooks.js_loaded_event
@@ -205,36 +244,99 @@ class View(ABC):
 
     def _manage_queue(self):
         "Infinite loop to manage Process Queue since it is launched in an isolated process"
-        batch_cmd, batch_size = "", 0
+        batch: list[str] = []
+        batch_bytes, batch_start = 0, 0.0
+        # {(frame, indicator, series): (batch index, bar time)} of the last UPDATE_SERIES_DATA
+        # in the batch for each series. Cleared by any other command so order is never altered.
+        updates: dict[tuple, tuple[int, Any]] = {}
+
         while not self.stop_event.is_set():
             # get() doesn't need a timeout. the waiting will get interupted by the os
             # to go manage the thread that the webview is running in. Bit wasteful i think.
             # Would be nice to have pywebview run in an asyncio Thread
             msg = self.fwd_queue.get()
+            recv_time = time() if self.recorder is not None else 0
             cmd, *args = msg
             logger.debug("Received CMD: %s, args: %s", cmd.name, args)
+            self.counters.commands += 1
 
             try:
                 # Lookup JS Command
+                fmt_start = perf_counter()
                 cmd_str = cmds.CMD_ROLODEX[cmd](*args)
             except TypeError as e:
                 arg_list = [type(arg) for arg in args]
                 logger.error("Command:%s: Given %s \n\tError msg: %s", cmd, arg_list, e)
                 continue  # Skip to next Command
+            finally:
+                # Shared memory has been read into the cmd_str, __main_mp__ can free it.
+                for arg in args:
+                    if isinstance(arg, cmds.ColumnarData) and arg.block is not None:
+                        self.rtn_queue.put((PY_CMD.RELEASE_BLOCK, arg.block.name))
+
+            if self.recorder is not None:
+                # put_time only exists when __main_mp__ stamps the messages it sends
+                cmd_stats = self.recorder.record_cmd(
+                    cmd.name,
+                    getattr(self.fwd_queue, "put_time", 0),
+                    recv_time,
+                    perf_counter() - fmt_start,
+                )
+
+            if len(batch) == 0:
+                batch_start = perf_counter()
 
+            # Batch index of a script superseded by this command's script, if any
+            replaced = None
             if cmd_str is None:
                 self.rolodex[cmd](*args)  # Given a PyWv Command, execute Immediately
+            elif cmd == JS_CMD.UPDATE_SERIES_DATA:
+                key, bar_time = tuple(args[:3]), getattr(args[3], "time", None)
+                if (prev := updates.get(key)) is not None and prev[1] == bar_time:
+                    # Same Series, Same Bar. The previous update has been superseded.
+                    batch_bytes += len(cmd_str) - len(batch[prev[0]])
+                    batch[prev[0]] = cmd_str
+                    replaced = prev[0]
+                    self.counters.coalesced += 1
+                else:
+                    updates[key] = (len(batch), bar_time)
+                    batch.append(cmd_str)
+                    batch_bytes += len(cmd_str)
             else:
-                batch_size += 1
-                batch_cmd += cmd_str
+                updates.clear()
+                batch.append(cmd_str)
+                batch_bytes += len(cmd_str)
+
+            if self.recorder is not None and cmd_str is not None:
+                self.recorder.record_script(cmd_stats, len(cmd_str), replaced)
 
             # Batching is critical. Batching is atleast 3x faster than running individual cmds
-            # If not done then the queue can easily pileup too. The Batch Size Limit exists to
-            # limit how much the viewport appears to lockup while being flooded w/ cmds
-            if self.fwd_queue.empty() or batch_size >= 100:
-                self.run_script(batch_cmd)
-                batch_cmd = ""
-                batch_size = 0
+            # If not done then the queue can easily pileup too. The Size and Time Limits exist
+            # to limit how much the viewport appears to lockup while being flooded w/ cmds
+            if len(batch) > 0 and (
+                self.fwd_queue.empty()
+                or batch_bytes >= self.batch_bytes
+                or perf_counter() - batch_start >= self.batch_time
+            ):
+                eval_start = perf_counter()
+                self.run_script("".join(batch))
+                self.counters.batches += 1
+                self.counters.script_bytes += batch_bytes
+                batch, batch_bytes = [], 0
+                updates.clear()
+
+                if self.recorder is not None:
+                    self.recorder.record_batch(perf_counter() - eval_start)
+                    if self.recorder.report_due():
+                        self._report_stats()
+
+        if self.recorder is not None:
+            self._report_stats()
+
+    def _report_stats(self):
+        "Return a snapshot of the pipeline statistics to __main_mp__"
+        snapshot = self.recorder.snapshot()  # type: ignore
+        self.rtn_queue.put((PY_CMD.PIPELINE_STATS, snapshot))
 
 
 class PyWv(View):
@@ -247,6 +349,10 @@ class PyWv(View):
         Param: api
             Optional instance of js_api, can be an extended subclass. If it is extended
             Any additional class methods will behave as javascript api callbacks
+        Param: batch_bytes, batch_time
+            Size and Time limits of a batch of JS_CMDs. See View.
+        Param: stats_interval
+            Enables per JS_CMD instrumentation when given. See View.
         param: **kwargs
             key-word args that are passed directly to the pywebview window.
             See https://pywebview.flowrl.com/guide/api.html for docs on available kwargs.
@@ -259,10 +365,19 @@ class PyWv(View):
         debug: bool = False,
         log_level: Optional[str | int] = None,
         api: Optional[js_api] = None,
+        batch_bytes: int = 2**21,
+        batch_time: float = 0.016,
+        stats_interval: Optional[float] = None,
         **kwargs,
     ) -> None:
         # Pass Hooks and run_script to super
-        super().__init__(mp_hooks, run_script=self._handle_eval_js)
+        super().__init__(
+            mp_hooks,
+            run_script=self._handle_eval_js,
+            batch_bytes=batch_bytes,
+            batch_time=batch_time,
+            stats_interval=stats_interval,
+        )
 
         if log_level is not None:
             logger.setLevel(log_level)
@@ -332,6 +447,10 @@ class PyWv(View):
             if not is_dunder(name):  # filter out dunder methods
                 self.assign_callback(name)
 
+        # Define the decoder used by the columnar Series Data transfer format
+        self.run_script(cmds.COLUMNAR_DECODER)
+        self.run_script(cmds.BACKFILL_HOOKS)
+
         # Signal to both python and javascript listeners that inital setup is complete
         self.js_loaded_event.set()
         self.show()
@@ -381,6 +500,87 @@ class PyWv(View):
         # self.run_script("") #Should make this update the icon...
 
 
+class HeadlessView(View):
+    """
+    View that runs without a GUI. The fwd_queue is consumed and formatted into scripts exactly
+    as a PyWv would, the scripts are then recorded, evaluated, or simply discarded.
+    Useful for benchmarking and testing the Window -> fwd_queue -> JS_CMD pipeline.
+
+    Args:
+        Param: mp_hooks
+            A Dataclass struct of all the necessary multiprocessor hooks.
+        Param: record
+            Optional filepath. Every batch of scripts is appended to this file.
+        Param: evaluator
+            Optional callable, e.g. an embedded javascript engine, that is given every batch of
+            scripts. This is run in __view_mp__ so it must be picklable.
+        Param: replay
+            Optional list of PY_CMD tuples that are placed into the rtn_queue once 'loaded'.
+            These simulate the callbacks a user would otherwise trigger from the window.
+        Param: batch_bytes, batch_time
+            Size and Time limits of a batch of JS_CMDs. See View.
+        Param: stats_interval
+            Enables per JS_CMD instrumentation when given. See View.
+        Param: **_
+            Window kwargs that only apply to a GUI, e.g. title, are ignored.
+    """
+
+    def __init__(
+        self,
+        mp_hooks: MpHooks,
+        log_level: Optional[str | int] = None,
+        record: Optional[str] = None,
+        evaluator: Optional[Callable[[str], Any]] = None,
+        replay: Optional[list[tuple]] = None,
+        batch_bytes: int = 2**21,
+        batch_time: float = 0.016,
+        stats_interval: Optional[float] = None,
+        **_,
+    ) -> None:
+        super().__init__(
+            mp_hooks,
+            run_script=self._handle_script,
+            batch_bytes=batch_bytes,
+            batch_time=batch_time,
+            stats_interval=stats_interval,
+        )
+        if log_level is not None:
+            logger.setLevel(log_level)
+
+        self.evaluator = evaluator
+        self.record = open(record, "a", encoding="UTF-8") if record else None
+        try:
+            self.run_script(cmds.COLUMNAR_DECODER)
+            self.run_script(cmds.BACKFILL_HOOKS)
+            self.js_loaded_event.set()
+            for msg in replay if replay is not None else []:
+                self.rtn_queue.put(msg)
+            self._manage_queue()
+        finally:
+            if self.record is not None:
+                self.record.close()
+            self.stop_event.set()
+
+    def _handle_script(self, cmd: str, promise: Optional[Callable] = None):
+        if self.record is not None:
+            self.record.write(cmd + ";\n")
+        if self.evaluator is not None:
+            rtn = self.evaluator(cmd)
+            if promise is not None:
+                promise(rtn)
+
+    def close(self):
+        self.stop_event.set()
+
+    def assign_callback(self, func_name: str): ...
+    def show(self): ...
+    def hide(self): ...
+    def minimize(self): ...
+    def maximize(self): ...
+    def restore(self): ...
+    def load_css(self, filepath: str): ...
+
+
 class QWebView:  # (View):
     """Class to create and manage a Pyside QWebView widget"""
 
@@ -1,18 +1,22 @@
 "Function definitions that return formatted Javascript scripts as literal strings"
 
 from math import floor
+from base64 import b64encode
 from enum import Enum, IntEnum, auto
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Optional, Self
 from json import JSONEncoder, dumps
-from dataclasses import is_dataclass, asdict
+from dataclasses import dataclass, is_dataclass, asdict
 
+import numpy as np
 from pandas import DataFrame, Timestamp, notnull
+from pandas.api.types import is_numeric_dtype, is_bool_dtype
 
 from lightweight_pycharts.orm.options import PriceScaleOptions
 
 from .orm import types
 from .orm.types import Color, j_func
 from .orm.enum import layouts
+from .shared_memory import SharedBlock, SharedBlockStore
 from .orm.series import (
     AnySeriesData,
     AnySeriesOptions,
@@ -55,6 +59,104 @@ def dump(obj: Any) -> str:
     return dumps(obj, cls=ORM_JSONEncoder, separators=(",", ":"))
 
 
+@dataclass(slots=True)
+class ColumnarData:
+    """
+    Column-wise packing of a transfer DataFrame. Alternative to sending a DataFrame through the
+    fwd_queue that is then dumped row by row into a list of JSON objects.
+
+    Numeric columns are packed into little-endian float64 byte buffers where NaN marks a missing
+    value. Any remaining columns (e.g. Colors) are kept as lists and are JSON encoded as normal.
+    The buffers are only base64 encoded once formatted into a script by the View process.
+
+    When given a SharedBlockStore the numeric columns are written into shared memory instead,
+    leaving only the SharedBlock descriptor to be pickled through the Queue.
+    """
+
+    length: int
+    buffers: dict[str, bytes]
+    objects: dict[str, list]
+    block: Optional[SharedBlock] = None
+
+    @classmethod
+    def from_dataframe(
+        cls, df: DataFrame, store: Optional[SharedBlockStore] = None
+    ) -> Self:
+        "Pack the columns of a transfer DataFrame."
+        arrays, objects = {}, {}
+        for name, col in df.items():
+            if is_numeric_dtype(col.dtype) and not is_bool_dtype(col.dtype):
+                arrays[name] = col.to_numpy(np.dtype("<f8"), na_value=np.nan)
+            else:
+                # Object columns, e.g. precomputed color strings, are dumped as a single list
+                col = col.astype(object)
+                objects[name] = col.where(col.notna(), None).tolist()
+
+        if store is not None:
+            return cls(len(df), {}, objects, store.put(arrays))
+        return cls(len(df), {k: v.tobytes() for k, v in arrays.items()}, objects)
+
+    @property
+    def js_str(self) -> str:
+        "Javascript expression that rehydrates the data into a list of row objects"
+        if self.block is not None:
+            bufs = self.block.b64_columns()
+        else:
+            bufs = {k: b64encode(v).decode("ascii") for k, v in self.buffers.items()}
+        return f"unpack_columns({self.length},{dump(bufs)},{dump(self.objects)})"
+
+
+# Defines the Javascript counterpart of ColumnarData.js_str. Evaluated once the window has loaded.
+COLUMNAR_DECODER = """
+window.unpack_columns = function(len, bufs, objs) {
+    const rows = new Array(len);
+    for (let i = 0; i < len; i++) rows[i] = {};
+    for (const [key, b64] of Object.entries(bufs)) {
+        const bin = atob(b64);
+        const bytes = new Uint8Array(bin.length);
+        for (let j = 0; j < bin.length; j++) bytes[j] = bin.charCodeAt(j);
+        const col = new Float64Array(bytes.buffer);
+        for (let i = 0; i < len; i++) if (!Number.isNaN(col[i])) rows[i][key] = col[i];
+    }
+    for (const [key, col] of Object.entries(objs)) {
+        for (let i = 0; i < len; i++) if (col[i] !== null) rows[i][key] = col[i];
+    }
+    return rows;
+};
+"""
+
+
+# Defines the Javascript that back-fills history as a Chart is scrolled, see
+# ChartingFrame.set_bars_back(). Evaluated once the window has loaded.
+# Lightweight-Charts has no prepend, so prepend_data() re-sets the entire series. That is
+# O(n) in the number of displayed bars, but only occurs once per back-filled chunk.
+BACKFILL_HOOKS = """
+window.watch_range = function(container_id, frame, pane, margin) {
+    let requested = false;
+    pane.chart.timeScale().subscribeVisibleLogicalRangeChange((range) => {
+        if (range === null) return;
+        if (range.from > Math.max(range.to - range.from, margin)) {
+            requested = false;
+            return;
+        }
+        if (requested) return;
+        requested = true;
+        window.api.range_change(container_id, frame.id, range.from, range.to);
+    });
+};
+window.prepend_data = function(ser, rows) {
+    ser.setData(rows.concat(ser.data()));
+};
+"""
+
+
+def series_data(data: DataFrame | ColumnarData) -> str:
+    "Javascript representation of a series dataset in either transfer format"
+    if isinstance(data, ColumnarData):
+        return data.js_str
+    return dump(data)
+
+
 class PY_CMD(IntEnum):
     "Enumeration of the various commands that javascript can send to python"
     ADD_CONTAINER = auto()
@@ -68,12 +170,15 @@ class PY_CMD(IntEnum):
     SYMBOL_SELECT = auto()
 
     DATA_REQUEST = auto()
-    # RANGE_CHANGE = auto() # Maybe?
+    RANGE_CHANGE = auto()
     SERIES_CHANGE = auto()
     LAYOUT_CHANGE = auto()
     ADD_INDICATOR = auto()
     SET_INDICATOR_OPTS = auto()
 
+    RELEASE_BLOCK = auto()
+    PIPELINE_STATS = auto()
+
 
 class JS_CMD(IntEnum):
     "Enumeration of the various commands that Python can send to Javascript"
@@ -97,6 +202,7 @@ class JS_CMD(IntEnum):
 
     # Frame Commands
     ADD_PANE = auto()
+    WATCH_VISIBLE_RANGE = auto()
     SET_WHITESPACE_DATA = auto()
     CLEAR_WHITESPACE_DATA = auto()
     UPDATE_WHITESPACE_DATA = auto()
@@ -119,6 +225,7 @@ class JS_CMD(IntEnum):
     REMOVE_SERIES = auto()
     SET_LEGEND_LABEL = auto()
     SET_SERIES_DATA = auto()
+    PREPEND_SERIES_DATA = auto()
     CLEAR_SERIES_DATA = auto()
     UPDATE_SERIES_DATA = auto()
     CHANGE_SERIES_TYPE = auto()
@@ -210,6 +317,12 @@ def add_pane(frame_id: str, pane_id: str) -> str:
     return f"var {pane_id} = {frame_id}.add_pane('{pane_id}');"
 
 
+def watch_visible_range(
+    container_id: str, frame_id: str, pane_id: str, margin: int
+) -> str:
+    return f"watch_range('{container_id}', {frame_id}, {pane_id}, {margin});"
+
+
 def set_frame_series_type(frame_id: str, series: SeriesType) -> str:
     return f"{frame_id}.set_series_type({series});"
 
@@ -329,11 +442,20 @@ def remove_series(frame_id: str, indicator_id: str, series_id: str) -> str:
 
 
 def set_series_data(
-    frame_id: str, indicator_id: str, series_id: str, data: DataFrame
+    frame_id: str, indicator_id: str, series_id: str, data: DataFrame | ColumnarData
+) -> str:
+    return (
+        series_preamble(frame_id, indicator_id, series_id)
+        + f"_ser.setData({series_data(data)});"
+    )
+
+
+def prepend_series_data(
+    frame_id: str, indicator_id: str, series_id: str, data: DataFrame | ColumnarData
 ) -> str:
     return (
         series_preamble(frame_id, indicator_id, series_id)
-        + f"_ser.setData({dump(data)});"
+        + f"prepend_data(_ser, {series_data(data)});"
     )
 
 
@@ -355,11 +477,11 @@ def change_series_type(
     indicator_id: str,
     series_id: str,
     series_type: SeriesType,
-    data: DataFrame,
+    data: DataFrame | ColumnarData,
 ) -> str:
     return (
         series_preamble(frame_id, indicator_id, series_id)
-        + f"_ser.change_series_type({series_type}, {dump(data)});"
+        + f"_ser.change_series_type({series_type}, {series_data(data)});"
     )
 
 
@@ -459,6 +581,7 @@ CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     JS_CMD.REMOVE_FRAME: remove_frame,
     # ---- Frame Commands ----
     JS_CMD.ADD_PANE: add_pane,
+    JS_CMD.WATCH_VISIBLE_RANGE: watch_visible_range,
     JS_CMD.SET_WHITESPACE_DATA: set_whitespace_data,
     JS_CMD.CLEAR_WHITESPACE_DATA: clear_whitespace_data,
     JS_CMD.UPDATE_WHITESPACE_DATA: update_whitespace_data,
@@ -475,6 +598,7 @@ CMD_ROLODEX: dict[JS_CMD, Callable[..., str | None]] = {
     JS_CMD.ADD_SERIES: add_series,
     JS_CMD.REMOVE_SERIES: remove_series,
     JS_CMD.SET_SERIES_DATA: set_series_data,
+    JS_CMD.PREPEND_SERIES_DATA: prepend_series_data,
     JS_CMD.SET_LEGEND_LABEL: set_legend_label,
     JS_CMD.CLEAR_SERIES_DATA: clear_series_data,
     JS_CMD.UPDATE_SERIES_DATA: update_series_data,
@@ -4,6 +4,8 @@ from . import types
 from . import enum
 from . import series
 from . import options
+from . import calendars
+from . import resample
 
 from .types import TF, Color, Symbol
 from .enum import layouts, ColorLiteral
@@ -14,6 +16,8 @@ __all__ = (
     "enum",
     "series",
     "options",
+    "calendars",
+    "resample",
     #
     # Types
     "TF",
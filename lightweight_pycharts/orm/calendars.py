@@ -0,0 +1,452 @@
+"""
+Process-wide Market Calendar Registry and Precomputed Trading Session Indices used to
+extrapolate Whitespace.
+
+Pandas_Market_Calendars is slow to import and is only needed for exchanges that are not open
+24/7. It is therefore imported on first use rather than with the module.
+"""
+
+from __future__ import annotations
+import logging
+from math import ceil
+from pathlib import Path
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from pandas_market_calendars import MarketCalendar
+
+logger = logging.getLogger("lightweight-pycharts")
+
+ALT_EXCHANGE_NAMES = {
+    "xnas": "NASDAQ",
+    "forex": "24/5",
+    "alpaca": "24/7",
+    "polygon": "24/7",
+    "polygon.io": "24/7",
+    "coinbase": "24/7",
+    "kraken": "24/7",
+    "crypto": "24/7",
+}
+
+# region ------------------------------------ Calendar Registry ------------------------------------ #
+
+
+class AlwaysOpen:
+    """
+    Stand-in for Pandas_Market_Calendars' 24/7 Calendar. Everything that consumes a calendar
+    short-circuits on the name '24/7' so the real calendar, and the import, are never needed.
+    """
+
+    name = "24/7"
+    tz = "UTC"
+
+
+ALWAYS_OPEN = AlwaysOpen()
+
+_EXCHANGE_NAMES: dict[str, str] = {}
+_CALENDARS: dict[str, MarketCalendar] = {}
+_MARKET_TIMES: dict[str, Any] = {}
+_SCHEDULES: dict[tuple, pd.DataFrame] = {}
+_SCHEDULE_CACHE_DIR: Optional[Path] = None
+_REGISTRY_LOCK = Lock()
+
+
+def _mcal():
+    "Lazily import pandas_market_calendars"
+    # pylint: disable=import-outside-toplevel
+    import pandas_market_calendars as mcal
+
+    return mcal
+
+
+def exchange_names() -> dict[str, str]:
+    "Dict of {lowercase name: name} of every calendar known to pandas_market_calendars"
+    if len(_EXCHANGE_NAMES) == 0:
+        _EXCHANGE_NAMES.update(
+            {name.lower(): name for name in _mcal().get_calendar_names()}
+        )
+    return _EXCHANGE_NAMES
+
+
+def get_calendar(exchange: Optional[str]) -> MarketCalendar | AlwaysOpen:
+    "Returns the memoized Market Calendar of an exchange. Unknown exchanges are 24/7"
+    if exchange is None:
+        return ALWAYS_OPEN
+
+    exchange = exchange.lower()
+    name = ALT_EXCHANGE_NAMES.get(exchange, None)
+    if name is None:
+        name = exchange_names().get(exchange, None)
+    if name is None:
+        logger.warning("Exchange '%s' doesn't match any calendars.", exchange)
+        return ALWAYS_OPEN
+    if name == "24/7":
+        return ALWAYS_OPEN
+
+    with _REGISTRY_LOCK:
+        if name not in _CALENDARS:
+            _CALENDARS[name] = _mcal().get_calendar(name)
+        return _CALENDARS[name]
+
+
+def regular_market_times(calendar: MarketCalendar) -> Any:
+    "The memoized regular_market_times of a calendar"
+    if calendar.name not in _MARKET_TIMES:
+        _MARKET_TIMES[calendar.name] = calendar.regular_market_times
+    return _MARKET_TIMES[calendar.name]
+
+
+def set_schedule_cache_dir(path: Optional[str | Path]):
+    """
+    Persist calendar schedules to the given directory so they can be reused between runs.
+    Schedules are stored per calendar year and pandas_market_calendars version.
+    None disables the on-disk cache, the in-memory cache is always used.
+    """
+    global _SCHEDULE_CACHE_DIR  # pylint: disable=global-statement
+    if path is None:
+        _SCHEDULE_CACHE_DIR = None
+        return
+    _SCHEDULE_CACHE_DIR = Path(path)
+    _SCHEDULE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _year_schedule(
+    calendar: MarketCalendar, year: int, market_times: tuple[str, ...]
+) -> pd.DataFrame:
+    "The schedule of a full calendar year. Loaded from memory, then disk, then computed"
+    key = (calendar.name, market_times, year)
+    if key in _SCHEDULES:
+        return _SCHEDULES[key]
+
+    file = None
+    if _SCHEDULE_CACHE_DIR is not None:
+        mcal_version = getattr(_mcal(), "__version__", "0")
+        file_name = (
+            f"{calendar.name}_{'-'.join(market_times)}_{year}_{mcal_version}.pkl"
+        )
+        file = _SCHEDULE_CACHE_DIR / file_name.replace("/", "_")
+
+    if file is not None and file.exists():
+        try:
+            _SCHEDULES[key] = pd.read_pickle(file)
+            return _SCHEDULES[key]
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning("Could not load cached schedule %s: %s", file, e)
+
+    sched = calendar.schedule(
+        start_date=f"{year}-01-01",
+        end_date=f"{year}-12-31",
+        market_times=list(market_times),
+    )
+    _SCHEDULES[key] = sched
+
+    if file is not None:
+        try:
+            sched.to_pickle(file)
+        except OSError as e:
+            logger.warning("Could not cache schedule %s: %s", file, e)
+    return sched
+
+
+def schedule(
+    calendar: MarketCalendar,
+    start_date: pd.Timestamp,
+    end_date: pd.Timestamp,
+    market_times: list[str],
+) -> pd.DataFrame:
+    "Memoized equivalent of calendar.schedule(start_date, end_date, market_times=market_times)"
+    start_date = pd.Timestamp(start_date).tz_localize(None).normalize()
+    end_date = pd.Timestamp(end_date).tz_localize(None).normalize()
+
+    with _REGISTRY_LOCK:
+        sched = pd.concat(
+            [
+                _year_schedule(calendar, year, tuple(market_times))
+                for year in range(start_date.year, end_date.year + 1)
+            ]
+        )
+    return sched[(sched.index >= start_date) & (sched.index <= end_date)]
+
+
+# endregion
+
+# region ------------------------------------ Trading Sessions ------------------------------------ #
+
+
+class SessionIndex:
+    """
+    Sorted int64 array (UTC Epoch Nanoseconds) of every valid bar open time of a market calendar.
+
+    The array starts as a horizon of a few thousand bars and grows, backwards or forwards, to cover
+    every time it is asked about. It is shared by every Whitespace_DF of the calendar & timeframe
+    so computed times are never dropped. Finding the bar after a given time is a binary search
+    rather than a calendar.schedule() call. When a lookup lands close to the end of the horizon it
+    is extended on a background thread, if it is ever reached before that thread finishes the
+    extension is computed in the calling thread instead.
+    """
+
+    CHUNK_BARS = 2000  # Approximate number of bars generated by each extension
+    LOW_WATER = 1000  # Extend in the background once this few bars remain past a lookup
+    MIN_CHUNK_DAYS = 7  # Always spans at least a weekend + holiday
+
+    def __init__(
+        self,
+        calendar: MarketCalendar,
+        freq: str,
+        pd_tf: pd.Timedelta,
+        mkt_start: str,
+        mkt_end: str,
+        only_days: bool,
+    ):
+        self.calendar = calendar
+        self.freq = freq
+        self.mkt_start = mkt_start
+        self.mkt_end = mkt_end
+        self.only_days = only_days
+
+        # Rough number of days a chunk of bars spans. Pads for weekends + Holidays
+        mkt_times = regular_market_times(calendar)
+        day_len = _unpack_mcal_time(*mkt_times[mkt_end][-1]) - _unpack_mcal_time(
+            *mkt_times[mkt_start][-1]
+        )
+        if day_len <= pd.Timedelta(0):
+            day_len = pd.Timedelta(days=1)
+        bars_per_day = max(ceil(day_len / pd_tf), 1)
+        self._chunk = pd.Timedelta(
+            days=max(ceil(self.CHUNK_BARS * 1.6 / bars_per_day), self.MIN_CHUNK_DAYS)
+        )
+
+        self._times = np.empty(0, dtype=np.int64)
+        # First & Last Session Dates that have been computed
+        self._start: Optional[pd.Timestamp] = None
+        self._end: Optional[pd.Timestamp] = None
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def times(self) -> np.ndarray:
+        "The sorted array of bar open times currently computed"
+        return self._times
+
+    def _compute(self, start: pd.Timestamp, end: pd.Timestamp) -> np.ndarray:
+        "Bar open times of all sessions between the two dates, inclusive"
+        sched = schedule(self.calendar, start, end, [self.mkt_start, self.mkt_end])
+        if len(sched) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        dt_index = _mcal().date_range(
+            sched, frequency=self.freq, closed="left", force_close=False
+        )
+        if self.only_days:
+            dt_index = dt_index.normalize()  # type: ignore
+
+        return np.unique(pd.DatetimeIndex(dt_index).as_unit("ns").asi8)
+
+    def _extend_to(self, end: pd.Timestamp):
+        "Compute sessions from the current end date through the given date"
+        with self._lock:
+            if self._end is None or end <= self._end:
+                return
+            # Restart a day early since a session can open on the previous UTC date
+            new_times = self._compute(self._end - pd.Timedelta(days=1), end)
+            if len(self._times) > 0:
+                new_times = new_times[new_times > self._times[-1]]
+            self._times = np.concatenate([self._times, new_times])
+            self._end = end
+
+    def _extend_back(self, time: pd.Timestamp):
+        """
+        Compute sessions from the given time through the current start date. Times already
+        computed are kept since the index is shared by every Whitespace_DF of the calendar.
+        """
+        with self._lock:
+            start = time.tz_localize(None).normalize() - pd.Timedelta(days=1)
+            if self._start is None or self._end is None:
+                self._start, self._end = start, start + self._chunk
+                self._times = self._compute(self._start, self._end)
+                return
+            if start >= self._start:
+                return
+            # Overlap by a day since a session can open on the previous UTC date
+            new_times = self._compute(start, self._start + pd.Timedelta(days=1))
+            if len(self._times) > 0:
+                new_times = new_times[new_times < self._times[0]]
+            self._times = np.concatenate([new_times, self._times])
+            self._start = start
+
+    def _background_extend(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = Thread(
+            target=self._extend_to,
+            args=(self._end + self._chunk,),  # type: ignore
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _ensure(self, time: pd.Timestamp, bars_ahead: int = 0):
+        "Ensure the horizon covers the given time followed by at least 'bars_ahead' bars"
+        time_ns = time.value
+        if self._start is None or (len(self._times) > 0 and time_ns < self._times[0]):
+            self._extend_back(time)
+        elif len(self._times) > 0 and time - self.last_time > self._chunk:
+            # Far beyond the horizon, extend up to the time in one step
+            if self._thread is not None:
+                self._thread.join()
+            self._extend_to(time.tz_localize(None).normalize() + self._chunk)
+
+        while True:
+            i = int(np.searchsorted(self._times, time_ns, side="right"))
+            remaining = len(self._times) - i
+            if (
+                len(self._times) > 0
+                and time_ns <= self._times[-1]
+                and remaining > bars_ahead
+            ):
+                break
+            if self._thread is not None:
+                self._thread.join()
+            prev_len = len(self._times)
+            self._extend_to(self._end + self._chunk)  # type: ignore
+            if len(self._times) == prev_len:
+                raise ValueError(f"{self.calendar.name} has no sessions after {time}")
+
+        if remaining - bars_ahead < self.LOW_WATER:
+            self._background_extend()
+
+    @property
+    def last_time(self) -> pd.Timestamp:
+        "The last bar time that has been computed"
+        return pd.Timestamp(self._times[-1], tz="UTC")
+
+    def index_of(self, time: pd.Timestamp, bars_ahead: int = 0) -> int:
+        "Index of the given bar time in times. -1 if it is not a valid bar time"
+        self._ensure(time, bars_ahead)
+        i = int(np.searchsorted(self._times, time.value))
+        if i < len(self._times) and self._times[i] == time.value:
+            return i
+        return -1
+
+    def next_after(self, time: pd.Timestamp) -> pd.Timestamp:
+        "The first valid bar time that follows the given time"
+        self._ensure(time, 1)
+        i = int(np.searchsorted(self._times, time.value, side="right"))
+        return pd.Timestamp(self._times[i], tz="UTC")
+
+
+_SESSION_INDICES: dict[tuple, SessionIndex] = {}
+
+
+def session_index(
+    calendar: MarketCalendar,
+    freq: str,
+    pd_tf: pd.Timedelta,
+    mkt_start: str,
+    mkt_end: str,
+    only_days: bool,
+) -> SessionIndex:
+    "Returns the process-wide SessionIndex of the given calendar & timeframe, creating it if needed"
+    key = (calendar.name, freq, mkt_start, mkt_end, only_days)
+    if key not in _SESSION_INDICES:
+        _SESSION_INDICES[key] = SessionIndex(
+            calendar, freq, pd_tf, mkt_start, mkt_end, only_days
+        )
+    return _SESSION_INDICES[key]
+
+
+DAY_NS = 86_400_000_000_000
+
+
+class SessionBounds:
+    """
+    Open times & dates (UTC Epoch Nanoseconds) of a calendar's trading sessions spanning a padded
+    range of times. Finding the session a bar belongs to is a binary search rather than a
+    calendar.schedule() call. 24/7 calendars have one session per UTC day.
+
+    Args:
+        Param: calendar
+            The Market Calendar of the data
+        Param: ext
+            Sessions span the extended, pre & post, market hours when available
+    """
+
+    def __init__(self, calendar: MarketCalendar | AlwaysOpen, ext: bool = False):
+        self.calendar = calendar
+        self.always_open = calendar.name == "24/7"
+        if ext and "pre" in getattr(calendar, "market_times", []):
+            self._mkt_times = ["pre", "post"]
+        else:
+            self._mkt_times = ["market_open", "market_close"]
+
+        self._opens = np.empty(0, dtype=np.int64)
+        self._dates = np.empty(0, dtype=np.int64)
+        self._start: Optional[pd.Timestamp] = None
+        self._end: Optional[pd.Timestamp] = None
+
+    @property
+    def ext(self) -> bool:
+        return self._mkt_times[0] == "pre"
+
+    def ensure(self, start_ns: int, end_ns: int):
+        "Ensure the computed sessions span the given times"
+        if self.always_open:
+            return
+        start = pd.Timestamp(start_ns, tz="UTC")
+        end = pd.Timestamp(end_ns, tz="UTC")
+        if self._start is not None and self._end is not None:
+            if self._start <= start and end <= self._end:
+                return
+            start, end = min(start, self._start), max(end, self._end)
+
+        # Pad the range so live updates rarely need to recompute it
+        self._start = start - pd.Timedelta(days=7)
+        self._end = end + pd.Timedelta(days=30)
+        sched = schedule(
+            self.calendar, self._start, self._end, self._mkt_times  # type: ignore
+        )
+        opens = pd.DatetimeIndex(sched[self._mkt_times[0]])
+        self._opens = opens.tz_convert("UTC").as_unit("ns").asi8
+        self._dates = pd.DatetimeIndex(sched.index).as_unit("ns").asi8
+
+    def locate(
+        self, times: np.ndarray, by_date: bool = False
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Session open & session date of each of the given times. Times before the first session
+        are assigned to it. Daily bars, labeled with their date rather than an open time, should
+        be located by_date.
+        """
+        if self.always_open:
+            days = times - times % DAY_NS
+            return days, days
+        self.ensure(times[0], times[-1])
+        bounds = self._dates if by_date else self._opens
+        i = np.maximum(np.searchsorted(bounds, times, side="right") - 1, 0)
+        return self._opens[i], self._dates[i]
+
+    def next_start(self, time_ns: int, by_date: bool = False) -> int:
+        "The open (or date) of the first session that starts after the given time"
+        if self.always_open:
+            return time_ns - time_ns % DAY_NS + DAY_NS
+        # Spanning a week past the time covers any weekend + holiday before the next session
+        self.ensure(time_ns, time_ns + 7 * DAY_NS)
+        bounds = self._dates if by_date else self._opens
+        i = int(np.searchsorted(bounds, time_ns, side="right"))
+        return int(bounds[i]) if i < len(bounds) else int(np.iinfo(np.int64).max)
+
+
+def _unpack_mcal_time(_, _time, days: Optional[int] = None) -> pd.Timedelta:
+    # 1st argument is Effective Date. If None then it was the first time established.
+    if days is None:
+        days = 0
+    return pd.Timedelta(days=days, hours=_time.hour, minutes=_time.minute)
+
+
+# endregion
@@ -0,0 +1,259 @@
+""" Local Resampling of a Base Resolution Series_DF into Higher Timeframes """
+
+from __future__ import annotations
+import logging
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from .calendars import DAY_NS, SessionBounds
+from .types import TF, Symbol
+from .series import (
+    AnyBasicData,
+    OhlcData,
+    Series_DF,
+    SeriesType,
+    SingleValueData,
+    TickBar,
+)
+
+# prevent circular import
+if TYPE_CHECKING:
+    from ..indicators import Series
+
+logger = logging.getLogger("lightweight-pycharts")
+
+# How each column is aggregated into a higher timeframe. All other columns take the last value
+AGGREGATIONS = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "value": "last",
+    "volume": "sum",
+    "ticks": "sum",
+}
+
+
+def timeframe_delta(timeframe: TF) -> pd.Timedelta:
+    "The bar length Series_DF would determine for data of the given timeframe"
+    match timeframe.period:
+        case "W":
+            return pd.Timedelta(days=7 * timeframe.mult)
+        case "M":
+            return pd.Timedelta(days=28 * timeframe.mult)
+        case "Y":
+            return pd.Timedelta(days=365 * timeframe.mult)
+        case _:
+            return pd.Timedelta(seconds=timeframe.unix_len)
+
+
+def period_labels(
+    times: np.ndarray, opens: np.ndarray, days: np.ndarray, timeframe: TF
+) -> np.ndarray:
+    """
+    Open time, UTC Epoch Nanoseconds, of the timeframe's bar each of the given times belongs to,
+    given the open & date of each time's trading session. (See SessionBounds.locate())
+    """
+    mult = timeframe.mult
+    match timeframe.period:
+        case "s" | "m" | "h":
+            step = timeframe_delta(timeframe).value
+            return opens + (times - opens) // step * step
+        case "D":
+            return days - days % (mult * DAY_NS)
+        case "W":
+            # The Epoch is a Thursday, Weeks start on Mondays
+            step, monday = 7 * mult * DAY_NS, 3 * DAY_NS
+            return days - (days + monday) % step
+        case "M" | "Y":
+            unit = "M8[M]" if timeframe.period == "M" else "M8[Y]"
+            periods = days.view("M8[ns]").astype(unit).astype(np.int64)
+            periods -= periods % mult
+            return periods.astype(unit).astype("M8[ns]").view(np.int64)
+    raise ValueError(f"Cannot resample into {timeframe}")
+
+
+class Resampler:
+    """
+    Holds a base resolution Series_DF, e.g. 1 Minute bars, and derives higher timeframes from it.
+
+    derive() aggregates the whole base history into a timeframe with vectorized numpy reductions.
+    Every derived timeframe is then kept up to date by update(), which applies a single base
+    resolution tick or bar to the base data and to each derived Series_DF in O(1).
+
+    Intraday bars are anchored to the open of each trading session of the base data's calendar,
+    so a 1h bar of a 9:30 open exchange spans 9:30-10:30. Daily and longer bars are labeled with
+    the session's date. Multiples of days, weeks, months and years count from the Unix Epoch.
+
+    Args:
+        Param: base
+            The base resolution data
+        Param: symbol
+            Symbol of the data, used to match requests that can be derived from it
+    """
+
+    def __init__(self, base: Series_DF, symbol: Symbol):
+        self.base = base
+        self.symbol = symbol
+        self.derived: dict[str, Series_DF] = {base.timeframe.toString: base}
+        # Series displaying a timeframe of this data. subscribers[0] supplies the base updates
+        self.subscribers: list[Series] = []
+
+        # Volume of the completed base bars within each derived timeframe's current bar
+        self._closed_volume: dict[str, float] = {}
+
+        self._sessions = SessionBounds(base.calendar, base.ext)
+
+    @property
+    def feeder(self) -> Optional[Series]:
+        return self.subscribers[0] if len(self.subscribers) > 0 else None
+
+    @staticmethod
+    def can_resample(base_tf: TF, timeframe: TF) -> bool:
+        "True if bars of the given timeframe can be built from bars of the base timeframe"
+        if base_tf == timeframe:
+            return True
+        base_td, target_td = timeframe_delta(base_tf), timeframe_delta(timeframe)
+        if timeframe.period in ("s", "m", "h"):
+            return base_td < target_td and target_td % base_td == pd.Timedelta(0)
+        # Daily or longer bars are built from Daily or Intraday base bars
+        return base_td <= pd.Timedelta(days=1) and base_td < target_td
+
+    def can_derive(self, symbol: Symbol, timeframe: TF) -> bool:
+        "True if the given Symbol & Timeframe can be derived from this Resampler's data"
+        return (
+            symbol.ticker == self.symbol.ticker
+            and symbol.broker == self.symbol.broker
+            and symbol.sec_type == self.symbol.sec_type
+            and symbol.exchange == self.symbol.exchange
+            and self.can_resample(self.base.timeframe, timeframe)
+        )
+
+    # region ---------------- Historical, Vectorized, Resampling ----------------
+
+    def derive(self, timeframe: TF) -> Series_DF:
+        "The base data resampled to the given timeframe. Kept up to date by update() thereafter"
+        if (derived := self.derived.get(timeframe.toString)) is not None:
+            return derived
+        if not self.can_resample(self.base.timeframe, timeframe):
+            raise ValueError(
+                f"Cannot resample {self.base.timeframe} data into {timeframe}"
+            )
+
+        df = self.base.df
+        labels = self._labels(df.index.asi8, timeframe)
+        # Labels are non-decreasing so each derived bar is a contiguous run of base bars
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(labels)) + 1))
+        ends = np.append(starts[1:], len(labels)) - 1
+
+        columns = {}
+        for col in df.columns:
+            values = df[col].to_numpy()
+            match AGGREGATIONS.get(col, "last"):
+                case "first":
+                    columns[col] = values[starts]
+                case "max" if values.dtype.kind in "iuf":
+                    columns[col] = np.fmax.reduceat(values, starts)
+                case "min" if values.dtype.kind in "iuf":
+                    columns[col] = np.fmin.reduceat(values, starts)
+                case "sum" if values.dtype.kind in "iuf":
+                    columns[col] = np.add.reduceat(
+                        np.nan_to_num(values) if values.dtype.kind == "f" else values,
+                        starts,
+                    )
+                case _:
+                    columns[col] = values[ends]
+
+        index = pd.DatetimeIndex(labels[starts].view("M8[ns]"), tz="UTC")
+        derived = Series_DF.from_normalized(
+            pd.DataFrame(columns, index=index),
+            None if self._sessions.always_open else self.base.calendar.name,
+            timeframe,
+            timeframe_delta(timeframe),
+            only_days=timeframe.period in ("D", "W", "M", "Y"),
+            ext=self.base.ext,
+        )
+
+        if "volume" in df.columns:
+            # Completed base bars of the last derived bar, i.e. all but the forming base bar
+            volume = df["volume"].to_numpy()[starts[-1] : ends[-1]]
+            self._closed_volume[timeframe.toString] = float(np.nansum(volume))
+        self.derived[timeframe.toString] = derived
+        return derived
+
+    def discard(self, timeframe: TF):
+        "Stop maintaining a derived timeframe"
+        if timeframe != self.base.timeframe:
+            self.derived.pop(timeframe.toString, None)
+            self._closed_volume.pop(timeframe.toString, None)
+
+    def _labels(self, times: np.ndarray, timeframe: TF) -> np.ndarray:
+        "Open time, UTC Epoch Nanoseconds, of the derived bar each of the given times belongs to"
+        opens, days = self._sessions.locate(times)
+        return period_labels(times, opens, days, timeframe)
+
+    # endregion
+
+    # region ---------------- Incremental Updates ----------------
+
+    def update(
+        self, data: AnyBasicData, accumulate: bool = False
+    ) -> dict[str, tuple[AnyBasicData, bool]]:
+        """
+        Apply a base resolution tick or bar to the base data and every derived timeframe.
+        Returns {timeframe string: (display data, is new bar)} of each timeframe, base included.
+        """
+        base, updates = self.base, {}
+        if data.time < base.curr_bar_open_time:  # type: ignore
+            return updates
+        prev_volume = base.forming_bar.volume
+
+        if data.time < base.next_bar_time:  # type: ignore
+            base_new = False
+            display_data = base.update_from_tick(data, accumulate=accumulate)
+        else:
+            base_new = True
+            if data.time != base.next_bar_time:
+                # Ensure the new bar fits the data's time interval
+                time_delta = data.time - base.next_bar_time  # type: ignore
+                data.time -= time_delta % base.timedelta  # type: ignore
+            display_data = base.update(data)
+        updates[base.timeframe.toString] = (display_data, base_new)
+
+        bar = base.forming_bar
+        volume = bar.volume if bar.volume == bar.volume else 0.0
+        has_volume = bar.has("volume")
+        for tf_str, derived in self.derived.items():
+            if derived is base:
+                continue
+            label = self._labels(np.array([bar.time.value]), derived.timeframe)[0]
+
+            if label > derived.curr_bar_open_time.value:
+                self._closed_volume[tf_str] = 0.0
+                new_bar = self._as_data(
+                    pd.Timestamp(label, tz="UTC"), bar, volume if has_volume else None
+                )
+                updates[tf_str] = (derived.update(new_bar), True)
+                continue
+
+            closed = self._closed_volume.get(tf_str, 0.0)
+            if base_new and prev_volume == prev_volume:
+                closed = self._closed_volume[tf_str] = closed + prev_volume
+            tick = self._as_data(
+                derived.curr_bar_open_time, bar, closed + volume if has_volume else None
+            )
+            updates[tf_str] = (derived.update_from_tick(tick), False)
+
+        return updates
+
+    def _as_data(
+        self, time: pd.Timestamp, bar: TickBar, volume: Optional[float]
+    ) -> AnyBasicData:
+        "Data of the current base bar, with the given time & volume, to apply to a derived bar"
+        if self.base.data_type == SeriesType.OHLC_Data:
+            return OhlcData(time, bar.open, bar.high, bar.low, bar.close, volume=volume)
+        return SingleValueData(time, bar.value, volume=volume)
+
+    # endregion
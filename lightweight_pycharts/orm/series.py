@@ -2,35 +2,22 @@
 
 from __future__ import annotations
 import logging
-from datetime import time as dt_time
-from math import ceil, floor, inf
+from math import ceil, floor, inf, nan
 from inspect import signature
 from enum import IntEnum, auto
 from typing import Literal, Optional, Self, TypeAlias, Dict, Any
 from dataclasses import asdict, dataclass, field
 
+import numpy as np
 import pandas as pd
-import pandas_market_calendars as mcal
 
+from .calendars import SessionIndex, get_calendar, session_index
 from .types import TF, Time, JS_Color, PriceFormat, BaseValuePrice, LineWidth, j_func
 from .enum import LineStyle, PriceLineSource, LastPriceAnimationMode, LineType
 
 
 logger = logging.getLogger("lightweight-pycharts")
 
-EXCHANGE_NAMES = dict([(val.lower(), val) for val in mcal.get_calendar_names()])
-
-ALT_EXCHANGE_NAMES = {
-    "xnas": "NASDAQ",
-    "forex": "24/5",
-    "alpaca": "24/7",
-    "polygon": "24/7",
-    "polygon.io": "24/7",
-    "coinbase": "24/7",
-    "kraken": "24/7",
-    "crypto": "24/7",
-}
-
 
 # pylint: disable=line-too-long
 # pylint: disable=invalid-name
@@ -38,15 +25,16 @@ ALT_EXCHANGE_NAMES = {
 
 
 def update_dataframe(
-    df: pd.DataFrame,
+    df: pd.DataFrame | BarStore,
     data: AnySeriesData | dict[str, Any],
     v_map: Optional[ValueMap | dict[str, str]] = None,
-) -> pd.DataFrame:
+) -> pd.DataFrame | BarStore:
     """
     Convenience Function to Update a Pandas DataFrame from a given piece of data w/ optional rename
 
     Unfortunately, no, The dataframe cannot be efficiently updated in place since a reference
     is passed. The new DataFrame can only be returned to update the reference in the higher scope.
+    A BarStore, on the other hand, is always updated in place and the same object is returned.
     """
     if isinstance(data, AnySeriesData):
         data_dict = data.as_dict
@@ -66,6 +54,13 @@ def update_dataframe(
     for key in set(data_dict.keys()).difference(df.columns):
         del data_dict[key]
 
+    if isinstance(df, BarStore):
+        if len(df) > 0 and df.last_time == time:
+            df.update_last(data_dict)
+        else:
+            df.append(time, data_dict)
+        return df
+
     if df.index[-1] == time:
         # Update Last Entry
         for key, value in data_dict.items():
@@ -76,19 +71,310 @@ def update_dataframe(
         return pd.concat([df, pd.DataFrame([data_dict], index=[time])])
 
 
+# endregion
+
+# region ---------------------------------- Columnar Bar Storage ---------------------------------- #
+
+
+class BarStore:
+    """
+    Capacity doubling, columnar storage of time indexed bar data.
+
+    Each column is a preallocated numpy array and the index is an int64 array of UTC epoch
+    nanoseconds. Appending a bar writes into the spare capacity, O(1) amortized, rather than
+    re-allocating the whole table as pd.concat() does. The filled region is exposed as a
+    pd.DataFrame whose columns are views of the underlying arrays. That DataFrame is cached
+    until the next append so tick updates written via update_last() are visible through it.
+    """
+
+    _MIN_GROWTH = 64
+
+    def __init__(self, df: Optional[pd.DataFrame] = None):
+        if df is None:
+            df = pd.DataFrame(index=pd.DatetimeIndex([], tz="UTC"))
+
+        self._len = len(df)
+        capacity = self._len + max(self._len, self._MIN_GROWTH)
+
+        index = pd.DatetimeIndex(df.index)
+        index = (
+            index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+        )
+        self._time = np.empty(capacity, dtype=np.int64)
+        self._time[: self._len] = index.as_unit("ns").asi8
+
+        self._cols: dict[str, np.ndarray] = {}
+        for col in df.columns:
+            values = df[col].to_numpy()
+            if values.dtype.kind not in "iufb":
+                values = values.astype(object)
+            self._cols[col] = self._empty_col(values.dtype, capacity)
+            self._cols[col][: self._len] = values
+
+        self._view: Optional[pd.DataFrame] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def capacity(self) -> int:
+        "Number of bars that can be stored before the arrays are re-allocated"
+        return len(self._time)
+
+    @property
+    def columns(self) -> list[str]:
+        "Names of the stored columns"
+        return list(self._cols.keys())
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        "UTC DatetimeIndex of the stored bars"
+        if self._view is not None:
+            return self._view.index  # type: ignore
+        return pd.DatetimeIndex(self._time[: self._len].view("M8[ns]"), tz="UTC")
+
+    @property
+    def df(self) -> pd.DataFrame:
+        "A DataFrame of the stored bars. Columns are views, not copies, of the underlying arrays."
+        if self._view is None:
+            self._view = pd.DataFrame(
+                {col: arr[: self._len] for col, arr in self._cols.items()},
+                index=pd.DatetimeIndex(
+                    self._time[: self._len].view("M8[ns]"), tz="UTC"
+                ),
+                copy=False,
+            )
+        return self._view
+
+    @property
+    def last_time(self) -> pd.Timestamp:
+        "Time of the last stored bar"
+        return pd.Timestamp(self._time[self._len - 1], tz="UTC")
+
+    @property
+    def times(self) -> np.ndarray:
+        "View of the stored bar times as UTC epoch nanoseconds"
+        return self._time[: self._len]
+
+    def column(self, col: str) -> np.ndarray:
+        "View of the stored values of a column"
+        return self._cols[col][: self._len]
+
+    def last_row(self) -> dict[str, Any]:
+        "The last stored bar as a dict of {column: value} including its 'time'"
+        i = self._len - 1
+        row: dict[str, Any] = {col: arr[i] for col, arr in self._cols.items()}
+        row["time"] = self.last_time
+        return row
+
+    def append(self, time: pd.Timestamp, values: dict[str, Any]):
+        "Append a new bar. Keys that are not yet columns are added and back-filled as missing"
+        if self._len == self.capacity:
+            self._grow(self.capacity * 2)
+
+        i = self._len
+        self._time[i] = pd.Timestamp(time).value
+        for col, value in values.items():
+            if col not in self._cols:
+                # Prior bars are missing so a new column is never an integer or bool column
+                is_num = isinstance(value, (int, float)) and not isinstance(value, bool)
+                self._cols[col] = self._empty_col(
+                    np.dtype(np.float64 if is_num else object), self.capacity
+                )
+            self._set(col, i, value)
+
+        for col in self._cols.keys() - values.keys():
+            self._set(col, i, nan)
+
+        self._len += 1
+        self._view = None
+
+    def update_last(self, values: dict[str, Any]):
+        "Overwrite values of the last bar. Keys that are not columns are ignored"
+        i = self._len - 1
+        for col, value in values.items():
+            if col in self._cols:
+                self._set(col, i, value)
+
+    def _set(self, col: str, i: int, value: Any):
+        "Write a single value, promoting the column's dtype if it cannot represent the value"
+        arr = self._cols[col]
+        if arr.dtype.kind == "b" and not isinstance(value, (bool, np.bool_)):
+            arr = self._promote(col, object)
+        elif arr.dtype.kind in "iu" and not isinstance(value, (int, np.integer)):
+            numeric = value is None or isinstance(value, (float, np.floating))
+            arr = self._promote(col, np.float64 if numeric else object)
+        try:
+            arr[i] = nan if value is None and arr.dtype.kind == "f" else value
+        except (ValueError, TypeError):
+            self._promote(col, object)[i] = value
+
+    def _promote(self, col: str, dtype) -> np.ndarray:
+        "Re-allocate a column with a new dtype. Invalidates the cached DataFrame"
+        arr = self._empty_col(np.dtype(dtype), self.capacity)
+        arr[: self._len] = self._cols[col][: self._len]
+        self._cols[col] = arr
+        self._view = None
+        return arr
+
+    def _grow(self, capacity: int):
+        time = np.empty(capacity, dtype=np.int64)
+        time[: self._len] = self._time[: self._len]
+        self._time = time
+        for col, old_arr in self._cols.items():
+            arr = self._empty_col(old_arr.dtype, capacity)
+            arr[: self._len] = old_arr[: self._len]
+            self._cols[col] = arr
+
+    @staticmethod
+    def _empty_col(dtype: np.dtype, capacity: int) -> np.ndarray:
+        "Missing values are NaN for floats, None for objects. Integer & Bool columns are promoted"
+        if dtype.kind == "f":
+            return np.full(capacity, nan, dtype=dtype)
+        if dtype.kind in "iub":
+            return np.zeros(capacity, dtype=dtype)
+        return np.full(capacity, None, dtype=object)
+
+
+class WindowedSeries:
+    """
+    Read only, zero-copy view over the tail of a BarStore column, e.g. a Series_DF's 'close'.
+
+    Values are read from the store's arrays on access, so the view stays valid as bars are
+    appended or revised. Integer indexing is O(1) and, as with a list, negative indices count
+    back from the last bar. ago(n) offers Pinescript style history access where ago(0) is the
+    last bar & ago(1) the bar before it. Slices, tail(), & values are numpy views.
+
+    When given a length only the most recent 'length' bars are visible through the view.
+    """
+
+    __slots__ = ("_store", "_col", "_length")
+
+    def __init__(
+        self,
+        store: Optional[BarStore] = None,
+        col: str = "value",
+        length: Optional[int] = None,
+    ):
+        self._store = BarStore() if store is None else store
+        self._col = col
+        self._length = length
+
+    @classmethod
+    def from_series(cls, series: pd.Series, length: Optional[int] = None) -> Self:
+        "A view of a copy of a pandas Series. Used for sources that aren't held in a BarStore"
+        return cls(BarStore(series.to_frame("value")), "value", length)
+
+    def _bounds(self) -> tuple[np.ndarray, int]:
+        "The column's stored values and the position of the first value in the window"
+        if self._col not in self._store._cols:
+            return np.empty(0), 0
+        values = self._store.column(self._col)
+        if self._length is None or self._length >= len(values):
+            return values, 0
+        return values, len(values) - self._length
+
+    def __len__(self) -> int:
+        values, start = self._bounds()
+        return len(values) - start
+
+    def __getitem__(self, key: int | slice) -> Any:
+        values, start = self._bounds()
+        if isinstance(key, slice):
+            return values[start:][key]
+        if key < 0:
+            if key < start - len(values):
+                raise IndexError("WindowedSeries index out of range")
+            return values[key]
+        if start + key >= len(values):
+            raise IndexError("WindowedSeries index out of range")
+        return values[start + key]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.values
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __repr__(self) -> str:
+        return f"WindowedSeries({self._col}, len={len(self)}, last={self.ago(0)})"
+
+    @property
+    def iat(self) -> Self:
+        "Positional indexing. Provided so code written for a pd.Series, e.g. data.iat[-1], works"
+        return self
+
+    @property
+    def values(self) -> np.ndarray:
+        "View of the values within the window"
+        values, start = self._bounds()
+        return values[start:]
+
+    def to_numpy(self) -> np.ndarray:
+        "View of the values within the window"
+        return self.values
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        "UTC DatetimeIndex of the bars within the window"
+        start = len(self._store) - len(self)
+        return pd.DatetimeIndex(self._store.times[start:].view("M8[ns]"), tz="UTC")
+
+    def ago(self, n: int = 0) -> Any:
+        "Value of the bar 'n' bars before the last bar. NaN if it's outside of the window"
+        return self[-1 - n] if 0 <= n < len(self) else nan
+
+    def tail(self, n: int) -> np.ndarray:
+        "View of the last 'n' values within the window"
+        return self.values[-n:] if n > 0 else self.values[:0]
+
+    def to_series(self) -> pd.Series:
+        "The window as a pandas Series. Its values are a view of the window"
+        return pd.Series(self.values, index=self.index, name=self._col, copy=False)
+
+
+class TickBar:
+    """
+    Mutable representation of the bar that is forming at the end of a BarStore.
+
+    Tick updates are aggregated into it with scalar math and written back to the store once
+    per tick. Fields without a matching column in the store are NaN and are never written back.
+    """
+
+    FIELDS = ("open", "high", "low", "close", "value", "volume", "ticks")
+    __slots__ = ("time", "_cols") + FIELDS
+
+    def __init__(self, store: BarStore):
+        row = store.last_row()
+        self.time: pd.Timestamp = row["time"]
+        self._cols = tuple(col for col in self.FIELDS if col in row)
+        for col in self.FIELDS:
+            setattr(self, col, nan if row.get(col) is None else float(row[col]))
+
+    def as_dict(self) -> dict[str, float]:
+        "The fields that are columns of the store"
+        return {col: getattr(self, col) for col in self._cols}
+
+    def has(self, col: str) -> bool:
+        "True if the store has a column for the given field"
+        return col in self._cols
+
+    def to_data(self, data_type: AnyBasicSeriesType) -> AnyBasicData:
+        "Returns the bar as the given basic data type. NaN volumes are omitted"
+        volume = self.volume if self.volume == self.volume else None
+        if data_type == SeriesType.OHLC_Data:
+            return OhlcData(
+                self.time, self.open, self.high, self.low, self.close, volume=volume
+            )
+        elif data_type == SeriesType.SingleValueData:
+            return SingleValueData(self.time, self.value, volume=volume)
+        return WhitespaceData(self.time)
+
+
 # endregion
 
 # region -------------------------------- Pandas Series Objects -------------------------------- #
 
-# TODO: Integrate a method of tracking what is displayed and use that to limit the amount displayed.
-# Currently, All data is sent to the screen. This may be thousands of data-points that may never be
-# viewed. To limit the load on the Multi-processor fwd_queue an 'infinite history' system is needed
-# i.e. : https://tradingview.github.io/lightweight-charts/tutorials/demos/infinite-history
-#
-# I imagine this code will originate w/ a JS Window API callback in the rtn_queue. From there,
-# The Main_Series of the respective frame will handle the call; Updating a 'bars-back' variable in
-# the Frame's Main Series[_DF/Ind]. This update will then propagate down through the indicator stack
-# so each indicator can inform their respective series_common elements to display a certain range.
+# When a Frame is given a 'bars-back' only the most recent bars of a Series_DF are displayed, older
+# bars are back-filled as the chart is scrolled. See ChartingFrame.set_bars_back() & __range_change__()
 
 
 @pd.api.extensions.register_dataframe_accessor("lwc_df")
@@ -105,23 +391,15 @@ class Series_DF:
             return
 
         if pandas_df.size == 0:
+            self._store = BarStore()
+            self._forming: Optional[TickBar] = None
             self._data_type = SeriesType.WhitespaceData
             self._tf = TF(1, "E")
             logger.warning("DataFrame has no Data.")
             return
 
-        # Determine Appropriate Calendar & Market Hours
-        if exchange is not None:
-            exchange = exchange.lower()
-            if exchange in EXCHANGE_NAMES:
-                self.calendar = mcal.get_calendar(EXCHANGE_NAMES[exchange])
-            elif exchange in ALT_EXCHANGE_NAMES:
-                self.calendar = mcal.get_calendar(ALT_EXCHANGE_NAMES[exchange])
-            else:
-                logger.warning("Exchange '%s' doesn't match any calendars.", exchange)
-                self.calendar = mcal.get_calendar("24/7")
-        else:
-            self.calendar = mcal.get_calendar("24/7")
+        # Determine Appropriate Calendar & Market Hours. Calendars are memoized process-wide
+        self.calendar = get_calendar(exchange)
 
         # Ensure Consistent Column Naming Convention
         rename_dict = self._validate_names(pandas_df)
@@ -139,7 +417,9 @@ class Series_DF:
         self._data_type: AnyBasicSeriesType = SeriesType.data_type(pandas_df)
 
         self._tf, self._pd_tf = self._determine_tf(pandas_df)
-        self.df = pandas_df.set_index("time")  # Set Time as index after TF check
+        # Set Time as index after TF check. Bars are kept in a BarStore so appends are O(1)
+        self._store = BarStore(pandas_df.set_index("time"))
+        self._forming = None
 
         # True if 'Time' is only days, or has an opening time
         if self._pd_tf >= pd.Timedelta(days=1):
@@ -150,9 +430,37 @@ class Series_DF:
             self.only_days = False
         self._ext = False
 
+    @classmethod
+    def from_normalized(
+        cls,
+        df: pd.DataFrame,
+        exchange: Optional[str],
+        timeframe: TF,
+        timedelta: pd.Timedelta,
+        only_days: bool = False,
+        ext: bool = False,
+    ) -> Series_DF:
+        """
+        Construct a Series_DF from the df of another Series_DF, e.g. one that was cached.
+        The DataFrame must already have standard column names and a UTC DatetimeIndex,
+        none of the usual validation and normalization is repeated.
+        """
+        self = cls.__new__(cls)
+        self.calendar = get_calendar(exchange)
+        # Type check on the column names alone, 'time' is the index
+        columns = pd.DataFrame(columns=["time", *df.columns])
+        self._data_type = SeriesType.data_type(columns)
+        self._tf, self._pd_tf = timeframe, timedelta
+        self._store = BarStore(df)
+        self._forming = None
+        self.only_days = only_days
+        self._ext = ext
+        return self
+
     def _init_from_series_df_(self, base_df: Series_DF):
         "Copy the attributes (TF, Calendar) and time column of the given Series_DF into a new object"
-        self.df = pd.DataFrame({"time": base_df.df["time"]})
+        self._store = BarStore(pd.DataFrame(index=base_df.df.index))
+        self._forming = None
         self._tf = base_df.timeframe
         self._ext = base_df.ext
         self._pd_tf = base_df.timedelta
@@ -160,6 +468,30 @@ class Series_DF:
         self.only_days = base_df.only_days
         self._data_type = SeriesType.Custom
 
+    @property
+    def df(self) -> pd.DataFrame:
+        "The Series Data as a DataFrame. Columns are views of the underlying BarStore"
+        return self._store.df
+
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        self._store = BarStore(value)
+        self._forming = None
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def window(self, col: str, length: Optional[int] = None) -> WindowedSeries:
+        "A zero-copy WindowedSeries view of the last 'length' bars of a column"
+        return WindowedSeries(self._store, col, length)
+
+    @property
+    def forming_bar(self) -> TickBar:
+        "The current bar (last entry in the dataframe) as a mutable TickBar"
+        if self._forming is None:
+            self._forming = TickBar(self._store)
+        return self._forming
+
     @property
     def ext(self) -> bool:
         "True if data given has Extended Trading Hours Data"
@@ -183,7 +515,7 @@ class Series_DF:
     @property
     def curr_bar_open_time(self) -> pd.Timestamp:
         "Open Time of the Current Bar"
-        return self.df.index[-1]
+        return self._store.last_time
 
     @property
     def curr_bar_close_time(self) -> pd.Timestamp:
@@ -198,9 +530,7 @@ class Series_DF:
     @property
     def last_bar(self) -> AnyBasicData:
         "The current bar (last entry in the dataframe) returned as AnyBasicType"
-        data_dict = self.df.iloc[-1].to_dict()
-        data_dict["time"] = self.df.index[-1]
-        return self._to_dataclass_instance_(data_dict)
+        return self._to_dataclass_instance_(self._store.last_row())
 
     @staticmethod
     def _validate_names(df: pd.DataFrame) -> dict[str, str]:
@@ -332,8 +662,6 @@ class Series_DF:
         "Checks the sample times of the data set and determines if each datapoint is RTH, ETH or neither"
         raise NotImplementedError
 
-    # Next line Silences a False-Positive Flag. Dunno why it thinks last_data's vars aren't initialized
-    # @pylint: disable=attribute-defined-outside-init
     def update_from_tick(
         self, data: AnyBasicData, accumulate: bool = False
     ) -> AnyBasicData:
@@ -346,54 +674,36 @@ class Series_DF:
         """
         if not isinstance(data, (SingleValueData, OhlcData)):
             return data  # Nothing to update
-        last_data = self.last_bar
-
-        # Update price
-        match last_data, data:
-            case SingleValueData(), SingleValueData():
-                last_data.value = data.value
-            case OhlcData(), SingleValueData():
-                last_data.high = max(
-                    (last_data.high if last_data.high is not None else -inf),
-                    (data.value if data.value is not None else -inf),
-                )
-                last_data.low = min(
-                    (last_data.low if last_data.low is not None else inf),
-                    (data.value if data.value is not None else inf),
-                )
-                last_data.close = data.value
-                data.value = last_data.close
-            case OhlcData(), OhlcData():
-                last_data.high = max(
-                    (last_data.high if last_data.high is not None else -inf),
-                    (data.high if data.high is not None else -inf),
-                )
-                last_data.low = min(
-                    (last_data.low if last_data.low is not None else inf),
-                    (data.low if data.low is not None else inf),
-                )
-                last_data.close = data.close
-            # Last Two are VERY unlikely Scenarios
-            case SingleValueData(), OhlcData():
-                last_data.value = data.close
-            case WhitespaceData(), _:
-                last_data = data
-                if accumulate:  # Needed as setup for volume accumulation
-                    data.volume = 0
+        bar = self.forming_bar
+
+        if isinstance(data, OhlcData):
+            high, low, close = data.high, data.low, data.close
+        else:
+            high = low = close = data.value
+
+        # Update price. Comparisons are negated so a NaN high / low is always replaced
+        if self._data_type == SeriesType.OHLC_Data:
+            if high is not None and not high <= bar.high:
+                bar.high = high
+            if low is not None and not low >= bar.low:
+                bar.low = low
+            if close is not None:
+                bar.close = close
+        elif self._data_type == SeriesType.SingleValueData and close is not None:
+            bar.value = close
 
         # update volume
-        if last_data.volume is not None and data.volume is not None:
-            if accumulate:
-                last_data.volume += data.volume
+        if data.volume is not None and bar.has("volume"):
+            if accumulate and bar.volume == bar.volume:
+                bar.volume += data.volume
             else:
-                last_data.volume = data.volume
+                bar.volume = data.volume
 
-        # Ensure time is constant, If not a new bar will be created on screen
-        last_data.time = self.curr_bar_open_time
-        update_dataframe(self.df, last_data)
+        self._store.update_last(bar.as_dict())
 
-        # The next line ensures the return dataclass matches the type stored by the Dataframe.
-        return self._to_dataclass_instance_(last_data.as_dict)
+        # Return dataclass matches the type stored by the Dataframe. Time is kept constant,
+        # If not a new bar would be created on screen
+        return bar.to_data(self._data_type)
 
     def update(self, data: AnyBasicData) -> AnyBasicData:
         "Update the OHLC / Single Value DataFrame from a new bar. Data Assumed as next in sequence"
@@ -420,7 +730,8 @@ class Series_DF:
         datacls_inst = self._to_dataclass_instance_(data_dict)
 
         time = data_dict.pop("time")
-        self.df = pd.concat([self.df, pd.DataFrame([data_dict], index=[time])])
+        self._store.append(time, data_dict)
+        self._forming = None
 
         return datacls_inst
 
@@ -445,12 +756,13 @@ class Whitespace_DF:
         self.calendar = base_data.calendar
         self.only_days = base_data.only_days
         self.simple_override = self.calendar.name == "24/7"
+        self._sessions: Optional[SessionIndex] = None
+        self._df: Optional[pd.DataFrame] = None
 
         if self.simple_override:  # 24/7 Market. Don't bother with calendars.
-            self.df = self._simple_whitespace_df(base_data.curr_bar_open_time)
+            self._df = self._simple_whitespace_df(base_data.curr_bar_open_time)
             return
 
-        mkt_times = self.calendar.regular_market_times
         if (
             base_data.ext
             and "pre" in self.calendar.market_times
@@ -462,76 +774,46 @@ class Whitespace_DF:
             self.mkt_start = "market_open"
             self.mkt_end = "market_close"
 
-        # Calculate Length of a day from RTH / ETH
-        mkt_open = self._unpack_mcal_time_(*mkt_times[self.mkt_start][-1])
-        mkt_close = self._unpack_mcal_time_(*mkt_times[self.mkt_end][-1])
-
-        # Determine a rough end date given the # of bars per day
-        bars_per_day = ceil((mkt_close - mkt_open) / self.pd_tf)
-
-        # Get a smudge factor to artificially push out the end_date to ensure we make
-        # enough, but not too many, extra bars. (This accounts for weekends + Holidays)
-        if self.pd_tf >= pd.Timedelta(hours=4):
-            smudge_factor = 8 / 5  # = 1.6
-        elif self.pd_tf >= pd.Timedelta(minutes=30):
-            smudge_factor = 1.4
-        else:
-            smudge_factor = 1.2
-
-        start_date: pd.Timestamp = base_data.df.index[-1]
-        end_date = start_date + pd.Timedelta(
-            days=ceil(500 * smudge_factor / bars_per_day)
-        )
-
-        # Create Datetime Index from the calendar given the known start_date and projected end_date
-        dt_index = mcal.date_range(
-            self.calendar.schedule(
-                start_date=start_date,
-                end_date=end_date,
-                market_times=[self.mkt_start, self.mkt_end],
-            ),
-            frequency=base_data.timeframe.toString,
-            closed="left",  # Stupid. Just Absolutely Stupid. This whole function...
-            force_close=False,  # It's 4 Methods wearing a trench-coat that says "C̷l̷a̷s̷s̷  *Function*"
+        # Bar times are looked up from a precomputed index of the calendar's trading sessions
+        # that is shared by every Whitespace_DF of the same calendar & timeframe.
+        sessions = session_index(
+            self.calendar,
+            base_data.timeframe.toString,
+            self.pd_tf,
+            self.mkt_start,
+            self.mkt_end,
+            self.only_days,
         )
 
-        if self.only_days:  # False alarm Type Error? Its a DT_Index, not an Index[int]?
-            dt_index = dt_index.normalize()  # type: ignore
-
-        start_index = dt_index.get_indexer_for([start_date])[0]
-        if start_index == -1:
+        start_date: pd.Timestamp = base_data.curr_bar_open_time
+        if (start_index := sessions.index_of(start_date, bars_ahead=500)) == -1:
             # Most likely cause of this error is that start_date was not a valid bar-time for the day
             # i.e. a 5Min bar that starts at 8:32 instead of 8:30, or a start time outside of RTH & ETH
             # Alternatively, the calendar starts at a stupid time like XX:01 or something...
             # (*eye-roll*, yup. that's possible...)
             logger.error(
-                "mcal.date_range() couldn't calculate start_date!. start_date = %s, dt_index[0] = %s",
+                "Trading Session Index couldn't locate start_date!. start_date = %s, next_valid_time = %s",
                 start_date,
-                dt_index[0],
+                sessions.next_after(start_date),
             )
             self.simple_override = True
-            self.df = self._simple_whitespace_df(base_data.curr_bar_open_time)
+            self._df = self._simple_whitespace_df(base_data.curr_bar_open_time)
             return
 
-        # mcal.date_range returns all bar times for all days requested.
-        # Trim off the overlapping start, and trim total length down to a consistent 500 bars
-        self.df = pd.DataFrame({"time": dt_index[start_index : 501 + start_index]})
+        # The whitespace spans from start_date through the 500 bars that follow it
+        self._sessions = sessions
+        self._start_ns = start_date.value
+        self._end_ns = sessions.times[start_index + 500]
 
-        if len(dt_index) < 500 + start_index:
-            # Log an Error, No need to raise an exception though, failure isn't THAT critical.
-            logger.error(
-                "Whitespace Dataframe under-estimated end-date!. len_df = %s",
-                len(self.df),
-            )
-
-    @staticmethod
-    def _unpack_mcal_time_(
-        _: Optional[str | pd.Timestamp], _time: dt_time, days: Optional[int] = None
-    ) -> pd.Timedelta:
-        # 1st argument is Effective Date. If None then it was the first time established.
-        if days is None:
-            days = 0
-        return pd.Timedelta(days=days, hours=_time.hour, minutes=_time.minute)
+    @property
+    def df(self) -> pd.DataFrame:
+        "DataFrame with a single 'time' column of all the whitespace bar times"
+        if self._df is None and self._sessions is not None:
+            times = self._sessions.times
+            start, end = np.searchsorted(times, [self._start_ns, self._end_ns])
+            whitespace = times[start : end + 1].view("M8[ns]")
+            self._df = pd.DataFrame({"time": pd.DatetimeIndex(whitespace, tz="UTC")})
+        return self._df  # type: ignore
 
     def _simple_extend(self) -> AnyBasicData:
         "Extend the dataframe by the current timestep without checking against a calendar"
@@ -540,7 +822,7 @@ class Whitespace_DF:
             next_bar_time = next_bar_time.normalize()
 
         rtn_data = WhitespaceData(next_bar_time)
-        self.df = pd.concat(
+        self._df = pd.concat(
             [self.df, pd.DataFrame([{"time": rtn_data.time}])], ignore_index=True
         )
         return rtn_data
@@ -558,58 +840,25 @@ class Whitespace_DF:
         if self.only_days:
             curr_time = curr_time.normalize()
 
-        try:
-            curr_index = pd.Index(self.df["time"]).get_loc(curr_time)
-        except KeyError as e:
-            raise KeyError(f"Whitespace_DF did not contain {curr_time}.") from e
-
-        if isinstance(curr_index, int):
-            return self.df["time"].iloc[curr_index + 1]
-        else:
-            raise KeyError(f"Whitespace DF contains multiple indexs of {curr_time}?")
+        if (
+            not self._start_ns <= curr_time.value <= self._end_ns
+            or self._sessions.index_of(curr_time) == -1  # type: ignore
+        ):
+            raise KeyError(f"Whitespace_DF did not contain {curr_time}.")
+        return self._sessions.next_after(curr_time)  # type: ignore
 
     def extend(self) -> AnyBasicData:
         "Extends the dataframe with one datapoint of whitespace. This whitespace datapoint is a valid trading time."
         if self.simple_override:  # Don't Bother with calendar if 24/7 market
             return self._simple_extend()
 
-        # TODO : Optimize this function... by optimizing pandas_market_calendars... :(
-        # The calendar function calls far above and a way the most inefficient code in all of
-        # the backend calculations that are done. Sadly it's also the library that probably
-        # slows down start-up the most. It just does everything I need it to do tho.
-
-        curr_bar_time: pd.Timestamp = self.df["time"].iloc[-1]
-        next_bar_time = curr_bar_time + self.pd_tf
-
-        day_offset = pd.Timedelta(days=5)
-        schedule = self.calendar.schedule(
-            curr_bar_time - day_offset,
-            curr_bar_time + day_offset,
-            market_times=[self.mkt_start, self.mkt_end],
-        )
-
-        if self.calendar.open_at_time(schedule, next_bar_time):
-            # Ticking forward by the chart's timeframe kept us in trading hours. Use that.
-            rtn_data = WhitespaceData(next_bar_time)
-        else:
-            # Next timestep is outside of trading hours, grab next open
-            todays_ind = schedule.index.get_indexer_for(
-                [curr_bar_time.normalize().tz_localize(None)]
-            )[0]
-            if todays_ind == -1:
-                raise ValueError("Today not found... How does this happen????")
-
-            next_trade_day = schedule.iloc[todays_ind + 1]
-            rtn_data = WhitespaceData(next_trade_day[self.mkt_start])
-
-        if self.only_days:
-            rtn_data.time = rtn_data.time.normalize()  # type: ignore (time guaranteed to be a Timestamp)
-
-        # Append new datapoint and return
-        self.df = pd.concat(
-            [self.df, pd.DataFrame([{"time": rtn_data.time}])], ignore_index=True
+        # Binary search of the precomputed sessions rather than a calendar.schedule() call
+        next_bar_time = self._sessions.next_after(  # type: ignore
+            pd.Timestamp(self._end_ns, tz="UTC")
         )
-        return rtn_data
+        self._end_ns = next_bar_time.value
+        self._df = None
+        return WhitespaceData(next_bar_time)
 
 
 # endregion
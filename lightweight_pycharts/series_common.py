@@ -6,13 +6,16 @@ Docs: https://tradingview.github.io/lightweight-charts/docs/api/interfaces/ISeri
 """
 
 import logging
+import threading
 from weakref import ref
-from typing import Optional, TYPE_CHECKING
+from functools import partial, wraps
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
 
 import pandas as pd
 from pandas.api.types import is_datetime64_any_dtype
 
-from .js_cmd import JS_CMD
+from .js_cmd import JS_CMD, ColumnarData
 from .orm import series as s
 from .orm.options import PriceScaleOptions
 from .orm.types import SeriesPriceLine, SeriesMarker
@@ -22,6 +25,37 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightweight-pycharts")
 
+# Display calls recorded by the current thread rather than run. See defer_display()
+_deferred = threading.local()
+
+
+@contextmanager
+def defer_display() -> Iterator[list[Callable[[], None]]]:
+    """
+    Within the context, the display calls of every Series made by the current thread, e.g.
+    set_data(), are recorded rather than run. Used to calculate Indicators in a worker thread
+    while their results are displayed by the event loop's thread, in order, once complete.
+    """
+    calls: list[Callable[[], None]] = []
+    _deferred.calls = calls
+    try:
+        yield calls
+    finally:
+        _deferred.calls = None
+
+
+def _display[F: Callable](func: F) -> F:
+    "Decorator of Series methods that send commands to the screen. See defer_display()"
+
+    @wraps(func)
+    def _wrapper(self, *args, **kwargs):
+        if (calls := getattr(_deferred, "calls", None)) is not None:
+            calls.append(partial(func, self, *args, **kwargs))
+            return None
+        return func(self, *args, **kwargs)
+
+    return _wrapper  # type: ignore
+
 
 # This was placed here and not in orm.Series because of the Queue & Pane Dependency
 class SeriesCommon:
@@ -30,7 +64,8 @@ class SeriesCommon:
     direct access to a lightweight-charts ISeriesAPI Object. This Object is mutable between
     all of the series types.
 
-    This object does not store a copy of the dataset given.
+    This object does not store a copy of the dataset given. It keeps a reference to the last
+    dataset set so older bars can be back-filled when the parent Frame limits its bars_back.
 
     Docs: https://tradingview.github.io/lightweight-charts/docs/api/interfaces/ISeriesApi
     """
@@ -74,7 +109,12 @@ class SeriesCommon:
 
         # Make _series reference a Weakref since this is a child obj.
         self._parent_series = ref(indicator._series)
+        self._parent_frame = ref(indicator.parent_frame)
+        # Time of the first bar displayed, None when the entire dataset is displayed.
+        self._display_start: Optional[pd.Timestamp] = None
+        self._data_ref: Optional[s.Series_DF | pd.DataFrame | pd.Series] = None
         self._fwd_queue = indicator._fwd_queue
+        self._window = indicator.parent_frame._window
 
         self._fwd_queue.put((JS_CMD.ADD_SERIES, *self._ids, self._series_type, name))
         self.apply_options(self._options)
@@ -188,16 +228,57 @@ class SeriesCommon:
 
         return tmp_df
 
+    def _to_transfer_data_(
+        self,
+        data: s.Series_DF | pd.DataFrame | pd.Series,
+    ) -> pd.DataFrame | ColumnarData:
+        """
+        Formats the data for transfer over the multiprocessor Queue. When the Window's
+        columnar_transfer option is set the formatted Dataframe is packed into column buffers
+        (placed in shared memory if enabled), otherwise the Dataframe is given as is and is
+        JSON encoded row by row.
+        """
+        xfer_df = self._to_transfer_dataframe_(data)
+        if self._window.columnar_transfer:
+            return ColumnarData.from_dataframe(xfer_df, self._window._block_store)
+        return xfer_df
+
+    @_display
     def set_data(self, data: s.Series_DF | pd.DataFrame | pd.Series) -> None:
-        "Sets the Data of the Series to the given data set. All irrlevant data is ignored"
+        """
+        Sets the Data of the Series to the given data set. All irrlevant data is ignored.
+        Only bars from the parent Frame's display_start onward are sent to the screen.
+        """
+        self._data_ref = data
+        frame = self._parent_frame()
+        self._display_start = frame.display_start if frame is not None else None
         # Set display type so data.json() only passes relevant information
-        xfer_df = self._to_transfer_dataframe_(data)
-        self._fwd_queue.put((JS_CMD.SET_SERIES_DATA, *self._ids, xfer_df))
+        xfer_data = self._to_transfer_data_(_time_slice(data, self._display_start))
+        self._fwd_queue.put((JS_CMD.SET_SERIES_DATA, *self._ids, xfer_data))
 
+    @_display
     def clear_data(self) -> None:
         "Remove All displayed Data. This does not remove/delete the Series Object."
+        self._data_ref, self._display_start = None, None
         self._fwd_queue.put((JS_CMD.CLEAR_SERIES_DATA, *self._ids))
 
+    def __backfill__(self, start: Optional[pd.Timestamp]) -> None:
+        """
+        Display the bars of the last data set from 'start' up to the first bar that is currently
+        displayed. A start of None displays everything that remains.
+        """
+        if self._data_ref is None or self._display_start is None:
+            return  # Entire Dataset is already displayed
+        if start is not None and start >= self._display_start:
+            return
+
+        chunk = _time_slice(self._data_ref, start, self._display_start)
+        self._display_start = start
+        if len(chunk) > 0:
+            xfer_data = self._to_transfer_data_(chunk)
+            self._fwd_queue.put((JS_CMD.PREPEND_SERIES_DATA, *self._ids, xfer_data))
+
+    @_display
     def update_data(self, data: s.AnySeriesData) -> None:
         """
         Update the Data on Screen. The data is sent to the lightweight charts API without checks.
@@ -213,11 +294,13 @@ class SeriesCommon:
 
         self._fwd_queue.put((JS_CMD.UPDATE_SERIES_DATA, *self._ids, data))
 
+    @_display
     def apply_options(self, options: s.AnySeriesOptions) -> None:
         "Update the Display Options of the Series."
         self._options = options
         self._fwd_queue.put((JS_CMD.UPDATE_SERIES_OPTS, *self._ids, options))
 
+    @_display
     def apply_scale_options(self, options: PriceScaleOptions) -> None:
         """
         Update the Options for the Price Scale this Series belongs too.
@@ -225,6 +308,7 @@ class SeriesCommon:
         """
         self._fwd_queue.put((JS_CMD.UPDATE_PRICE_SCALE_OPTS, *self._ids, options))
 
+    @_display
     def change_series_type(
         self, series_type: s.SeriesType, data: s.Series_DF | pd.DataFrame | pd.Series
     ) -> None:
@@ -234,12 +318,13 @@ class SeriesCommon:
         self._series_data_cls = self._series_type.cls
         self._series_ohlc_derived = s.SeriesType.OHLC_Derived(self._series_type)
 
+        self._data_ref = data
         self._fwd_queue.put(
             (
                 JS_CMD.CHANGE_SERIES_TYPE,
                 *self._ids,
                 series_type,
-                self._to_transfer_dataframe_(data),
+                self._to_transfer_data_(_time_slice(data, self._display_start)),
             )
         )
 
@@ -254,6 +339,36 @@ class SeriesCommon:
     def remove_price_line(self, price_line: SeriesPriceLine | float) -> None: ...
 
 
+def _time_slice(
+    data: s.Series_DF | pd.DataFrame | pd.Series,
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp] = None,
+) -> s.Series_DF | pd.DataFrame | pd.Series:
+    "Slice data to the rows where start <= time < end. Data is assumed to be sorted by time."
+    if start is None and end is None:
+        return data
+
+    if isinstance(data, s.Series_DF):
+        data = data.df
+    if isinstance(data, pd.DataFrame) and "time" in data.columns:
+        times = pd.DatetimeIndex(data["time"])
+    elif is_datetime64_any_dtype(data.index):
+        times = pd.DatetimeIndex(data.index)
+    else:
+        return data  # Not a timeseries, let _to_transfer_dataframe_ raise the error
+
+    def _loc(time: Optional[pd.Timestamp], default: int) -> int:
+        if time is None:
+            return default
+        if times.tz is None and time.tz is not None:
+            time = time.tz_convert(None)
+        elif times.tz is not None and time.tz is None:
+            time = time.tz_localize(times.tz)
+        return int(times.searchsorted(time))
+
+    return data.iloc[_loc(start, 0) : _loc(end, len(times))]
+
+
 # region ----------------------------- Single Value Series Objects ------------------------------ #
 
 # The Subclasses below are solely to make object creation cleaner for the user. They don't
@@ -284,6 +399,7 @@ class LineSeries(SeriesCommon):
     def options(self) -> s.LineStyleOptions:
         return self._options
 
+    @_display
     def update_data(
         self, data: s.WhitespaceData | s.SingleValueData | s.LineData
     ) -> None:
@@ -320,6 +436,7 @@ class HistogramSeries(SeriesCommon):
     def options(self) -> s.HistogramStyleOptions:
         return self._options
 
+    @_display
     def update_data(
         self, data: s.WhitespaceData | s.SingleValueData | s.HistogramData
     ) -> None:
@@ -369,6 +486,7 @@ class CandlestickSeries(SeriesCommon):
             display_pane_id=display_pane_id,
         )
 
+    @_display
     def update_data(
         self, data: s.WhitespaceData | s.OhlcData | s.CandlestickData
     ) -> None:
@@ -0,0 +1,91 @@
+""" Shared Memory Blocks used to hand bulk series data from __main_mp__ to __view_mp__ """
+
+import logging
+from base64 import b64encode
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+logger = logging.getLogger("lightweight-pycharts")
+
+
+@dataclass(slots=True, frozen=True)
+class SharedBlock:
+    """
+    Descriptor of a block of numpy columns that have been written into a shared memory segment.
+    This is the only object that travels through the fwd_queue, the data itself is never pickled.
+
+    Attributes:
+        name:       Name of the shared memory segment
+        length:     Number of elements in each column
+        columns:    Dict of {column name: (byte offset, dtype string)}
+    """
+
+    name: str
+    length: int
+    columns: dict[str, tuple[int, str]]
+
+    def b64_columns(self) -> dict[str, str]:
+        "Attach to the segment and return every column as a base64 string"
+        rtn_dict = {}
+        shm = SharedMemory(name=self.name)
+        try:
+            for col, (offset, dtype) in self.columns.items():
+                view = shm.buf[offset : offset + self.length * np.dtype(dtype).itemsize]
+                rtn_dict[col] = b64encode(view).decode("ascii")
+                view.release()  # Exported views must be released before close()
+        finally:
+            shm.close()
+        return rtn_dict
+
+
+class SharedBlockStore:
+    """
+    Owner of all the Shared Memory Segments created by __main_mp__.
+
+    Each block is carried by exactly one command. Once __view_mp__ has consumed the descriptor
+    it returns a PY_CMD.RELEASE_BLOCK command and the segment is unlinked.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: dict[str, SharedMemory] = {}
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def put(self, arrays: dict[str, np.ndarray]) -> SharedBlock:
+        "Write a set of equal length 1D arrays into a new segment and return it's descriptor"
+        length = len(next(iter(arrays.values()))) if len(arrays) > 0 else 0
+
+        columns, offset = {}, 0
+        for col, arr in arrays.items():
+            columns[col] = (offset, arr.dtype.str)
+            # Keep every column 8-byte aligned so typed arrays can view them directly
+            offset += -(-arr.nbytes // 8) * 8
+
+        shm = SharedMemory(create=True, size=max(offset, 1))
+        for col, arr in arrays.items():
+            start = columns[col][0]
+            dest = np.ndarray(arr.shape, arr.dtype, buffer=shm.buf, offset=start)
+            dest[:] = arr
+            del dest  # Drop the export of shm.buf so the segment can be closed later
+
+        self._blocks[shm.name] = shm
+        return SharedBlock(shm.name, length, columns)
+
+    def release(self, name: str):
+        "Unlink the segment of a block that __view_mp__ has consumed"
+        if (shm := self._blocks.pop(name, None)) is None:
+            logger.warning("Release of unknown Shared Memory Block: %s", name)
+            return
+
+        shm.close()
+        shm.unlink()
+
+    def close(self):
+        "Unlink all remaining segments, consumed or not"
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
+        self._blocks = {}
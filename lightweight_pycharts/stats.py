@@ -0,0 +1,220 @@
+""" Optional Instrumentation of the __main_mp__ -> fwd_queue -> __view_mp__ Pipeline """
+
+from __future__ import annotations
+import os
+import logging
+import multiprocessing as mp
+from multiprocessing.queues import Queue
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from time import time
+from typing import Optional
+
+logger = logging.getLogger("lightweight-pycharts")
+
+# Upper bounds of the histogram buckets. Times are in seconds, Sizes are in characters.
+TIME_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class StampedQueue(Queue):
+    """
+    mp.Queue that records the wall-clock time each message was put. get() returns the message
+    unchanged and stores the time it was put in 'put_time' so the consumer can measure how long
+    the message waited in the queue.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize, ctx=mp.get_context())
+        self.put_time = 0.0
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.put_time = 0.0
+
+    def put(self, obj, block=True, timeout=None):
+        super().put((time(), obj), block, timeout)
+
+    def get(self, block=True, timeout=None):
+        self.put_time, obj = super().get(block, timeout)
+        return obj
+
+
+@dataclass(slots=True)
+class Histogram:
+    "Cumulative Prometheus style histogram. counts[i] is the number of observations <= bounds[i]"
+
+    bounds: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0
+
+    def __post_init__(self):
+        if len(self.counts) == 0:
+            # Last bucket is +Inf
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count > 0 else 0
+
+    def quantile(self, q: float) -> float:
+        "Upper bound of the bucket the q-th quantile falls in. +Inf is reported as the max bound"
+        target, running = q * self.count, 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return self.bounds[-1]
+
+
+@dataclass(slots=True)
+class CmdStats:
+    """
+    Statistics of a single JS_CMD.
+
+    Attributes:
+        count:      Number of commands received
+        dwell:      Time between fwd_queue.put() in __main_mp__ and get() in __view_mp__
+        format:     Time spent formatting the command into a script by its CMD_ROLODEX function
+        size:       Length of the formatted script, of those that were run
+        evaluate:   This command's share of the run_script() time of the batches it was in.
+                    Batches are evaluated as a single script so the time is split by script size.
+    """
+
+    count: int = 0
+    dwell: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    format: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    size: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+    evaluate: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+
+
+@dataclass(slots=True)
+class PipelineStats:
+    "Statistics of every JS_CMD, keyed by name, and of the batches of scripts that were run"
+
+    time: float = 0
+    commands: dict[str, CmdStats] = field(default_factory=dict)
+    batches: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+
+    def cmd(self, name: str) -> CmdStats:
+        if (stats := self.commands.get(name)) is None:
+            stats = self.commands[name] = CmdStats()
+        return stats
+
+    def log_summary(self, level: int = logging.INFO):
+        "Log a one line summary of each command"
+        for name, s in sorted(self.commands.items()):
+            logger.log(
+                level,
+                "%s: n=%d, dwell=%.3fms, format=%.3fms, size=%.0f, evaluate=%.3fms",
+                name,
+                s.count,
+                s.dwell.mean * 1e3,
+                s.format.mean * 1e3,
+                s.size.mean,
+                s.evaluate.mean * 1e3,
+            )
+
+    def to_prometheus(self, prefix: str = "pycharts") -> str:
+        "Format the statistics in the Prometheus text exposition format"
+        lines = []
+        metrics = (
+            ("dwell", "seconds", "Time JS_CMDs waited in the fwd_queue"),
+            ("format", "seconds", "Time spent formatting JS_CMDs into scripts"),
+            ("size", "chars", "Size of the scripts JS_CMDs were formatted into"),
+            ("evaluate", "seconds", "Share of run_script() time spent on JS_CMDs"),
+        )
+        for metric, unit, desc in metrics:
+            full_name = f"{prefix}_cmd_{metric}_{unit}"
+            lines.append(f"# HELP {full_name} {desc}")
+            lines.append(f"# TYPE {full_name} histogram")
+            for name, s in sorted(self.commands.items()):
+                lines += _prometheus_hist(
+                    full_name, getattr(s, metric), f'cmd="{name}"'
+                )
+
+        full_name = f"{prefix}_batch_evaluate_seconds"
+        lines.append(f"# HELP {full_name} Time spent in run_script() per batch")
+        lines.append(f"# TYPE {full_name} histogram")
+        lines += _prometheus_hist(full_name, self.batches)
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "pycharts"):
+        "Atomically replace the given file with the Prometheus text format of the statistics"
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="UTF-8") as file:
+                file.write(self.to_prometheus(prefix))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write pipeline stats to %s: %s", path, e)
+
+
+def _prometheus_hist(name: str, hist: Histogram, labels: str = "") -> list[str]:
+    sep = "," if labels else ""
+    lines, running = [], 0
+    for bound, count in zip(hist.bounds + (float("inf"),), hist.counts):
+        running += count
+        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+        lines.append(f'{name}_bucket{{{labels}{sep}le="{le}"}} {running}')
+    label_str = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{label_str} {hist.sum:g}")
+    lines.append(f"{name}_count{label_str} {hist.count}")
+    return lines
+
+
+class StatsRecorder:
+    """
+    Collects PipelineStats within __view_mp__. Each command's dwell and format time are recorded
+    as it is received. Script sizes & evaluate times are recorded once the batch the script was
+    placed in is run, so scripts superseded before then aren't counted.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stats = PipelineStats()
+        self._last_report = time()
+        # [(CmdStats, script size)] of the commands in the current batch
+        self._pending: list[tuple[CmdStats, int]] = []
+
+    def record_cmd(self, name: str, put_time: float, get_time: float, fmt_time: float):
+        "Record a command's dwell & format time. Returns it's stats so the size can be added"
+        stats = self.stats.cmd(name)
+        stats.count += 1
+        if put_time > 0:
+            stats.dwell.observe(max(get_time - put_time, 0))
+        stats.format.observe(fmt_time)
+        return stats
+
+    def record_script(self, stats: CmdStats, size: int, replaced: Optional[int] = None):
+        """
+        Add a command's script to the current batch. When the script superseded one already in
+        the batch, e.g. a coalesced series update, 'replaced' is that script's index in the batch.
+        """
+        if replaced is None:
+            self._pending.append((stats, size))
+        else:
+            self._pending[replaced] = (stats, size)
+
+    def record_batch(self, eval_time: float):
+        "Record the run time of a batch, splitting it across the scripts that were run"
+        self.stats.batches.observe(eval_time)
+        total = sum(size for _, size in self._pending)
+        for stats, size in self._pending:
+            share = size / total if total > 0 else 1 / len(self._pending)
+            stats.size.observe(size)
+            stats.evaluate.observe(eval_time * share)
+        self._pending.clear()
+
+    def report_due(self) -> bool:
+        return time() - self._last_report >= self.interval
+
+    def snapshot(self) -> PipelineStats:
+        self._last_report = self.stats.time = time()
+        return self.stats
@@ -6,6 +6,8 @@ from enum import Enum, auto
 import logging
 import asyncio
 import multiprocessing as mp
+from queue import Empty
+from threading import Thread
 from functools import partial
 from dataclasses import asdict
 from typing import Literal, Optional
@@ -20,8 +22,14 @@ from . import indicators
 from .orm.types import TF, Color, Symbol
 
 from .orm import layouts
+from .orm.series import Series_DF
+from .orm.resample import Resampler
+from .data_cache import DataCache
+from .data_hub import DataHub
 from .events import Events, Emitter, Socket_Switch_Protocol
-from .js_api import PyWv, MpHooks
+from .js_api import PyWv, HeadlessView, MpHooks
+from .shared_memory import SharedBlockStore
+from .stats import PipelineStats, StampedQueue
 from .js_cmd import JS_CMD, PY_CMD
 
 logger = logging.getLogger("lightweight-pycharts")
@@ -54,7 +62,16 @@ class Window:
         self,
         *,
         daemon: bool = True,
+        headless: bool = False,
+        columnar_transfer: bool = False,
+        shared_memory: bool = False,
+        instrument: bool = False,
+        stats_interval: float = 1.0,
+        stats_file: Optional[str] = None,
+        stats_log: bool = False,
         events: Optional[Events] = None,
+        data_cache: Optional[DataCache] = None,
+        data_hub: Optional[DataHub] = None,
         log_level: Optional[logging._Level] = None,
         options: Optional[orm.options.PyWebViewOptions] = None,
         **kwargs,
@@ -71,14 +88,21 @@ class Window:
             logger.setLevel(logging.DEBUG)
 
         # create and then unpack the hooks directly into class variables
-        mp_hooks = MpHooks()
+        if instrument:
+            # Messages are stamped with the time they're put so the View can measure dwell time
+            mp_hooks = MpHooks(fwd_queue=StampedQueue())
+            kwargs["stats_interval"] = stats_interval
+        else:
+            mp_hooks = MpHooks()
         self._fwd_queue = mp_hooks.fwd_queue
         self._rtn_queue = mp_hooks.rtn_queue
         self._stop_event = mp_hooks.stop_event
         self._js_loaded_event = mp_hooks.js_loaded_event
 
-        kwargs["mp_hooks"] = mp_hooks  # Pass the hooks along to PyWv
-        self._view_process = mp.Process(target=PyWv, kwargs=kwargs, daemon=daemon)
+        # A HeadlessView consumes the fwd_queue without a GUI, e.g. for Benchmarks & CI
+        view_cls = HeadlessView if headless else PyWv
+        kwargs["mp_hooks"] = mp_hooks  # Pass the hooks along to the View
+        self._view_process = mp.Process(target=view_cls, kwargs=kwargs, daemon=daemon)
         self._view_process.start()
 
         # Wait for PyWebview to load before continuing
@@ -88,9 +112,20 @@ class Window:
                 "Failed to load PyWebView in a reasonable amount of time."
             )
 
+        # Latest Snapshot of the View's instrumentation and where it should be dumped to
+        self._stats: Optional[PipelineStats] = None
+        self._stats_file = stats_file
+        self._stats_log = stats_log
+
         # Begin Listening for any responses from PyWV Process
         self._queue_manager = asyncio.create_task(self._manage_queue())
 
+        # When True, Series Data is sent to the window as packed column buffers
+        # instead of a list of JSON Objects. Significantly faster for large datasets.
+        # Shared Memory further skips pickling those buffers through the fwd_queue.
+        self.columnar_transfer = columnar_transfer or shared_memory
+        self._block_store = SharedBlockStore() if shared_memory else None
+
         # -------- Create Subobjects  -------- #
         if events is not None:
             self.events = events
@@ -99,8 +134,13 @@ class Window:
         self.events.symbol_search.response = partial(
             self._symbol_search_rsp, fwd_queue=self._fwd_queue
         )
+        # Optional in-memory & on-disk stores of datasets. Checked before a request is emitted.
+        self.data_hub = data_hub
+        self.data_cache = data_cache
         self.events.data_request.response = partial(
-            self._data_request_rsp, socket_switch=self.events.socket_switch
+            self._data_request_rsp,
+            socket_switch=self.events.socket_switch,
+            data_cache=self.data_cache,
         )
 
         # Using ID_List over ID_Dict so element order is mutable for PY_CMD.REORDER_CONTAINERS
@@ -133,7 +173,31 @@ class Window:
                     "symbol": args[2],
                     "timeframe": args[3],
                 }
-                self.events.data_request(symbol=args[2], tf=args[3], rsp_kwargs=kwargs)
+                # Resampled locally from base resolution data that is already loaded,
+                # Else the in-memory DataHub, Else the on-disk DataCache.
+                cached = self._local_resampler(frame.main_series, args[2], args[3])
+                if cached is None and self.data_hub is not None:
+                    cached = self.data_hub.get(args[2], args[3])
+                if self.data_cache is not None:
+                    # Save any bars received since the current data was loaded before it's replaced
+                    self._cache_append(frame.main_series)
+                    if cached is None:
+                        cached = self.data_cache.get(args[2], args[3])
+                if cached is not None:
+                    # A cache hit also supersedes any request still in flight for the Frame
+                    self.events.data_request.cancel(frame.js_id)
+                    self.events.data_request.response(cached, **kwargs)
+                    return
+
+                # Keyed by Frame so a new request supersedes any still in flight for it
+                self.events.data_request(
+                    symbol=args[2], tf=args[3], rsp_kwargs=kwargs, task_key=frame.js_id
+                )
+
+            case PY_CMD.RANGE_CHANGE, str(), str(), float(), float():
+                frame = self.get_container(args[0]).frames[args[1]]
+                if isinstance(frame, ChartingFrame):
+                    frame.__range_change__(args[2], args[3])
 
             case PY_CMD.LAYOUT_CHANGE, str(), orm.enum.layouts():
                 container = self.get_container(args[0])
@@ -163,33 +227,117 @@ class Window:
                 self._container_ids.insert(args[1], self._container_ids.pop(args[0]))
                 self.containers.insert(args[1], self.containers.pop(args[0]))
 
+            case PY_CMD.RELEASE_BLOCK, str():
+                if self._block_store is not None:
+                    self._block_store.release(args[0])
+
+            case PY_CMD.PIPELINE_STATS, PipelineStats():
+                self._stats = args[0]
+                if self._stats_log:
+                    args[0].log_summary()
+                if self._stats_file is not None:
+                    args[0].write_prometheus(self._stats_file)
+
+    def _read_rtn_queue(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        "Blocking rtn_queue reader. Run in a dedicated thread so the event loop is never polled."
+        while not self._stop_event.is_set():
+            try:
+                # Timeout only bounds how long it takes to notice the stop_event
+                msg = self._rtn_queue.get(timeout=0.25)
+            except Empty:
+                continue
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, msg)
+            except RuntimeError:
+                return  # Event Loop was closed out from under the reader
+
+        try:  # Wake the Queue Manager so it can exit
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+        except RuntimeError:
+            pass
+
     async def _manage_queue(self):
         logger.debug("Entered Async Queue Manager")
-        while not self._stop_event.is_set():
-            if self._rtn_queue.empty():
-                await asyncio.sleep(0.05)
-            else:
-                cmd, *rsp = self._rtn_queue.get()
+        queue: asyncio.Queue[Optional[tuple]] = asyncio.Queue()
+        reader = Thread(
+            target=self._read_rtn_queue,
+            args=(asyncio.get_running_loop(), queue),
+            name="rtn_queue_reader",
+            daemon=True,
+        )
+        reader.start()
+
+        while (msg := await queue.get()) is not None:
+            cmd, *rsp = msg
+            self._execute_cmd(cmd, *rsp)
+            # logger.debug("Window Recieved Command: %s: %s", cmd, rsp)
+
+            # Drain any burst of commands without yielding back to the loop between each.
+            while not queue.empty() and (msg := queue.get_nowait()) is not None:
+                cmd, *rsp = msg
                 self._execute_cmd(cmd, *rsp)
-                # logger.debug("Window Recieved Command: %s: %s", cmd, rsp)
+            if msg is None:
+                break
+
+        if self._block_store is not None:
+            # View is closed, Nothing left to read the remaining blocks.
+            self._block_store.close()
+
+        # Nothing is left to display the results of any outstanding requests
+        await self.events.shutdown(cancel=True)
+
+        if self.data_cache is not None:
+            for container in self.containers:
+                for frame in container.frames.values():
+                    if isinstance(frame, ChartingFrame):
+                        self._cache_append(frame.main_series)
         logger.debug("Exited Async Queue Manager")
 
     # endregion
 
     # region ------------------------ Private Event Response Methods ------------------------ #
 
+    def _cache_append(self, series: indicators.Series):
+        "Append the bars a Series has received since its data was loaded to the data_cache"
+        if self.data_cache is None or series.main_data is None:
+            return
+        # Resampled data is cached at its base resolution
+        data = series.main_data
+        if series._resampler is not None:
+            data = series._resampler.base
+        try:
+            self.data_cache.append(series.symbol, series.main_data.timeframe, data)
+        except OSError as e:
+            logger.warning("Could not append to the data cache: %s", e)
+
+    def _local_resampler(
+        self, series: indicators.Series, symbol: Symbol, timeframe: TF
+    ) -> Optional[Resampler]:
+        "A Resampler, of this Series or any other Frame's, the Symbol & Timeframe can be derived from"
+        resamplers = [series._resampler] + [
+            frame.main_series._resampler
+            for container in self.containers
+            for frame in container.frames.values()
+            if isinstance(frame, ChartingFrame)
+        ]
+        for resampler in resamplers:
+            if resampler is not None and resampler.can_derive(symbol, timeframe):
+                return resampler
+        return None
+
     @staticmethod
     def _symbol_search_rsp(items: list[orm.types.Symbol], *_, fwd_queue: mp.Queue):
         fwd_queue.put((JS_CMD.SET_SYMBOL_ITEMS, items))
 
     @staticmethod
     def _data_request_rsp(
-        data: Optional[pd.DataFrame],
+        data: Optional[pd.DataFrame | Series_DF | Resampler],
         *_,
         series: indicators.Series,
         symbol: orm.Symbol,
         timeframe: orm.TF,
         socket_switch: Emitter[Socket_Switch_Protocol],  # Set by Partial Func
+        data_cache: Optional[DataCache] = None,  # Set by Partial Func
     ):
         # Close the socket if there was a symbol change
         if series.socket_open and series.symbol != symbol:
@@ -197,8 +345,25 @@ class Window:
 
         if data is not None:
             # Set Data *before* series.update_data can be called
-            series.set_data(data, symbol=symbol)
-            if not series.socket_open:
+            series.set_data(data, symbol=symbol, timeframe=timeframe)
+            if (
+                data_cache is not None
+                and not isinstance(data, (Series_DF, Resampler))  # i.e. Already local
+                and series.main_data is not None
+            ):
+                # Resampled data is cached at its base resolution
+                cache_data = series.main_data
+                if series._resampler is not None:
+                    cache_data = series._resampler.base
+                try:
+                    data_cache.put(symbol, timeframe, cache_data)
+                except OSError as e:
+                    logger.warning("Could not write to the data cache: %s", e)
+            if not series.socket_feeder:
+                # Another Series' socket already supplies the updates of this data
+                if series.socket_open:
+                    socket_switch(state="close", symbol=symbol, series=series)
+            elif not series.socket_open:
                 socket_switch(state="open", symbol=symbol, series=series)
         else:
             if series.socket_open:
@@ -235,6 +400,13 @@ class Window:
         "Hide the View Window"
         self._fwd_queue.put((JS_CMD.CLOSE,))
 
+    def stats(self) -> Optional[PipelineStats]:
+        """
+        Latest snapshot of the per JS_CMD statistics recorded by the View.
+        Only available when the Window was created with instrument=True.
+        """
+        return self._stats
+
     async def await_close(self):
         "Await closure of the window's asyncio loop. (Window Closure)"
         await self._queue_manager
@@ -18,6 +18,9 @@ setup(
         "pandas_market_calendars>=4.4.1",
         "pywebview>=5.1",
     ],
+    extras_require={
+        "cache": ["pyarrow>=15.0"],  # DataCache
+    },
     package_data={
         "lightweight_pycharts": ["frontend/*"],
     },
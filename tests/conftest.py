@@ -0,0 +1,48 @@
+""" Shared fixtures of the tests """
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def prices() -> np.ndarray:
+    "A random walk of 300 prices with a few missing values"
+    rng = np.random.default_rng(42)
+    values = 100 + rng.normal(size=300).cumsum()
+    values[[5, 50, 51, 52, 180]] = np.nan
+    return values
+
+
+@pytest.fixture
+def ohlc() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    "High, low, & close of 300 random bars with a few missing values"
+    rng = np.random.default_rng(7)
+    close = 100 + rng.normal(size=300).cumsum()
+    high = close + rng.uniform(0, 2, size=300)
+    low = close - rng.uniform(0, 2, size=300)
+    close[[40, 41]] = np.nan
+    low[[120, 200]] = np.nan
+    return high, low, close
+
+
+def _stream(kernel, *inputs: np.ndarray, start: int = 0, revise: bool = True) -> list:
+    """
+    Feed the inputs from 'start' onwards to kernel.update() one bar at a time. When revising,
+    each bar first appears as a different value & is then revised to its actual value.
+    Returns the output of each bar's final update.
+    """
+    outputs = []
+    for i in range(start, len(inputs[0])):
+        values = [float(x[i]) for x in inputs]
+        if revise:
+            kernel.update(*(v * 1.01 + 1 for v in values), True)
+            outputs.append(kernel.update(*values, False))
+        else:
+            outputs.append(kernel.update(*values, True))
+    return outputs
+
+
+@pytest.fixture
+def stream():
+    "kernel.update() driver, see _stream()"
+    return _stream
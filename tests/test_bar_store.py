@@ -0,0 +1,142 @@
+""" Columnar BarStore storage behind every Series_DF """
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightweight_pycharts.orm.series import BarStore
+
+# Time of the bar following the 'bars' fixture
+NEXT_TIME = pd.Timestamp("2024-01-02 14:40", tz="UTC")
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    "Ten minute bars with a float, an integer, & a string column"
+    index = pd.date_range("2024-01-02 14:30", periods=10, freq="1min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "close": np.arange(10, dtype=float),
+            "volume": np.arange(10, dtype=np.int64),
+            "note": [f"bar {i}" for i in range(10)],
+        },
+        index=index,
+    )
+
+
+def test_init_matches_dataframe(bars):
+    store = BarStore(bars)
+    assert len(store) == 10
+    assert store.columns == ["close", "volume", "note"]
+    pd.testing.assert_frame_equal(store.df, bars, check_freq=False)
+    assert store.last_time == bars.index[-1]
+    np.testing.assert_array_equal(store.times, bars.index.asi8)
+
+
+def test_empty_store():
+    store = BarStore()
+    assert len(store) == 0
+    assert store.columns == []
+    assert len(store.df) == 0
+    assert str(store.index.tz) == "UTC"
+
+
+def test_index_converted_to_utc():
+    naive = pd.DataFrame(
+        {"close": [1.0, 2.0]}, index=pd.date_range("2024-01-02", periods=2)
+    )
+    assert BarStore(naive).last_time == pd.Timestamp("2024-01-03", tz="UTC")
+
+    eastern = naive.tz_localize("America/New_York")
+    store = BarStore(eastern)
+    assert store.last_time == pd.Timestamp("2024-01-03 05:00", tz="UTC")
+    assert str(store.df.index.tz) == "UTC"
+
+
+def test_append_grows_capacity(bars):
+    store = BarStore(bars)
+    capacity = store.capacity
+    times = pd.date_range(bars.index[-1], periods=capacity + 1, freq="1min")[1:]
+    for i, time in enumerate(times):
+        store.append(time, {"close": 100.0 + i, "volume": i, "note": "new"})
+
+    assert len(store) == 10 + len(times)
+    assert store.capacity > capacity
+    assert store.last_time == times[-1]
+    df = store.df
+    np.testing.assert_array_equal(df["close"].iloc[:10], bars["close"])
+    np.testing.assert_array_equal(df["close"].iloc[10:], 100.0 + np.arange(len(times)))
+    assert df["volume"].dtype == np.int64
+    assert df["note"].iloc[-1] == "new"
+    assert df.index.equals(bars.index.append(times))
+
+
+def test_append_invalidates_cached_df(bars):
+    store = BarStore(bars)
+    before = store.df
+    store.append(NEXT_TIME, {"close": 10.0})
+    assert store.df is not before
+    assert len(before) == 10 and len(store.df) == 11
+
+
+def test_append_missing_and_new_columns(bars):
+    store = BarStore(bars)
+    store.append(NEXT_TIME, {"close": 10.0, "open": 9.5})
+
+    df = store.df
+    assert np.isnan(df["open"].iloc[:-1]).all() and df["open"].iloc[-1] == 9.5
+    # Missing values can't be held by an integer column so it's promoted
+    assert df["volume"].dtype == np.float64 and np.isnan(df["volume"].iloc[-1])
+    assert pd.isna(df["note"].iloc[-1])
+
+
+def test_update_last_visible_through_cached_df(bars):
+    store = BarStore(bars)
+    df = store.df
+    close, volume, note = df["close"], df["volume"], df["note"]
+    store.update_last({"close": 42.0, "volume": 7, "note": "revised"})
+
+    assert store.df is df
+    assert df["close"].iloc[-1] == 42.0 and close.iloc[-1] == 42.0
+    assert df["volume"].iloc[-1] == 7 and volume.iloc[-1] == 7
+    assert df["note"].iloc[-1] == "revised" and note.iloc[-1] == "revised"
+    assert df["close"].iloc[-2] == 8.0
+
+
+def test_update_last_ignores_unknown_columns(bars):
+    store = BarStore(bars)
+    store.update_last({"close": 1.5, "open": 1.0})
+    assert "open" not in store.columns
+    assert store.last_row()["close"] == 1.5
+
+
+def test_column_promotion(bars):
+    store = BarStore(bars)
+    df = store.df
+    store.update_last({"volume": 2.5})
+    assert store.column("volume").dtype == np.float64
+    assert store.df is not df and store.df["volume"].iloc[-1] == 2.5
+
+    store.update_last({"volume": "n/a"})
+    assert store.column("volume").dtype == object
+    assert store.df["volume"].iloc[-1] == "n/a"
+    assert store.df["volume"].iloc[0] == 0
+
+
+def test_object_column_values(bars):
+    store = BarStore(bars)
+    store.append(NEXT_TIME, {"note": ("a", 1)})
+    assert store.column("note").dtype == object
+    assert store.column("note")[-1] == ("a", 1)
+    assert store.df["note"].iloc[0] == "bar 0"
+
+
+def test_last_row(bars):
+    store = BarStore(bars)
+    row = store.last_row()
+    assert row == {
+        "close": 9.0,
+        "volume": 9,
+        "note": "bar 9",
+        "time": bars.index[-1],
+    }
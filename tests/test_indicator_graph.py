@@ -0,0 +1,120 @@
+""" Scheduling of Indicator recalculations over a Frame's dependency graph """
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import lightweight_pycharts as lwc
+from lightweight_pycharts import series_common as sc
+from lightweight_pycharts.indicator import Indicator, output_property
+from lightweight_pycharts.js_cmd import JS_CMD
+
+# pylint: disable=arguments-differ
+
+
+class Ramp(Indicator):
+    "A source of the values 0 through 99"
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self._out = pd.Series(dtype=float)
+
+    def set_data(self, *_, **__):
+        index = pd.date_range("2024-01-02", periods=100, freq="1min", tz="UTC")
+        self._out = pd.Series(np.arange(100.0), index=index)
+
+    def update_data(self, *_, **__):
+        pass
+
+    @output_property
+    def out(self) -> pd.Series:
+        return self._out
+
+
+class Scaled(Indicator):
+    "A source multiplied by a factor. Sleeps for 'delay' seconds before doing so"
+
+    def __init__(self, parent, src, factor: float, delay: float = 0.0):
+        super().__init__(parent)
+        self.factor, self.delay = factor, delay
+        self._out = pd.Series(dtype=float)
+        self.line_series = sc.LineSeries(self)
+        self.link_args({"data": src})
+
+    def set_data(self, data: pd.Series, *_, **__):
+        time.sleep(self.delay)
+        self._out = data * self.factor
+        self.line_series.set_data(self._out)
+
+    def update_data(self, *_, **__):
+        pass
+
+    @output_property
+    def out(self) -> pd.Series:
+        return self._out
+
+
+class Sum(Indicator):
+    "The sum of two sources"
+
+    def __init__(self, parent, a, b):
+        super().__init__(parent)
+        self._out = pd.Series(dtype=float)
+        self.line_series = sc.LineSeries(self)
+        self.link_args({"a": a, "b": b})
+
+    def set_data(self, a: pd.Series, b: pd.Series, *_, **__):
+        self._out = a + b
+        self.line_series.set_data(self._out)
+
+    def update_data(self, *_, **__):
+        pass
+
+    @output_property
+    def out(self) -> pd.Series:
+        return self._out
+
+
+class Recorder:
+    "Stand-in for the fwd_queue. Records the command, Indicator, & thread of each put()"
+
+    def __init__(self):
+        self.cmds: list[tuple[JS_CMD, str, threading.Thread]] = []
+
+    def put(self, cmd: tuple):
+        self.cmds.append((cmd[0], cmd[2], threading.current_thread()))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_diamond_recalculation(workers):
+    async def _main():
+        window = lwc.Window(headless=True)
+        frame = list(window.new_tab().frames.values())[0]
+        try:
+            # A -> (B, C) -> D. B is the slowest, so C completes first when run in parallel
+            a = Ramp(frame)
+            b = Scaled(frame, a.out, 2.0, delay=0.2)
+            c = Scaled(frame, a.out, 3.0)
+            d = Sum(frame, b.out, c.out)
+            recorder = Recorder()
+            for ind in (b, c, d):
+                ind.line_series._fwd_queue = recorder
+
+            frame.set_recalc_workers(workers)
+            a.recalculate()
+        finally:
+            frame.set_recalc_workers(None)
+            window.close()
+            await window.await_close()
+
+        np.testing.assert_array_equal(d.out(), 5 * np.arange(100.0))
+        assert recorder.cmds == [
+            (JS_CMD.SET_SERIES_DATA, ind.js_id, threading.main_thread())
+            for ind in (b, c, d)
+        ]
+
+    asyncio.run(_main())
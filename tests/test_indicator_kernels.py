@@ -0,0 +1,153 @@
+""" Rolling, Momentum, & Volatility Kernels against their vectorized pandas formulas """
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightweight_pycharts.indicators.kernels import (
+    ATRKernel,
+    BollingerKernel,
+    MACDKernel,
+    RollingMaxKernel,
+    RollingMinKernel,
+    RSIKernel,
+    StdDevKernel,
+    StochKernel,
+)
+
+# region ---------------- Reference Formulas ----------------
+
+
+def _ewm(values, alpha: float, period: int) -> np.ndarray:
+    ewm = pd.Series(values).ewm(
+        alpha=alpha, adjust=False, ignore_na=True, min_periods=period
+    )
+    return ewm.mean().to_numpy()
+
+
+def ref_rsi(close, period=14):
+    change = pd.Series(close).diff()
+    gain = _ewm(change.clip(lower=0), 1 / period, period)
+    loss = _ewm((-change).clip(lower=0), 1 / period, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, np.where(gain == 0, 50, 100), rsi)
+
+
+def ref_macd(close, fast=12, slow=26, signal=9):
+    macd = _ewm(close, 2 / (fast + 1), fast) - _ewm(close, 2 / (slow + 1), slow)
+    sig = _ewm(macd, 2 / (signal + 1), signal)
+    return macd, sig, macd - sig
+
+
+def ref_stoch(high, low, close, period=14, k_smooth=3, d_period=3):
+    hh = pd.Series(high).rolling(period).max()
+    ll = pd.Series(low).rolling(period).min()
+    raw = (100 * (pd.Series(close) - ll) / (hh - ll)).where(hh != ll)
+    k = raw.rolling(k_smooth).mean()
+    return k.to_numpy(), k.rolling(d_period).mean().to_numpy()
+
+
+def ref_atr(high, low, close, period=14):
+    prev = pd.Series(close).shift(1).to_numpy()
+    true_range = np.fmax(high - low, np.fmax(abs(high - prev), abs(low - prev)))
+    return _ewm(true_range, 1 / period, period)
+
+
+def ref_bollinger(close, period=20, mult=2.0):
+    rolling = pd.Series(close).rolling(period)
+    basis, dev = rolling.mean(), rolling.std(ddof=0)
+    upper, lower = basis + mult * dev, basis - mult * dev
+    return basis.to_numpy(), upper.to_numpy(), lower.to_numpy()
+
+
+# endregion
+
+# name: (Kernel factory, Inputs of (high, low, close), Reference of (high, low, close))
+CASES = {
+    "max": (
+        lambda: RollingMaxKernel(10),
+        lambda h, l, c: (h,),
+        lambda h, l, c: pd.Series(h).rolling(10).max().to_numpy(),
+    ),
+    "min": (
+        lambda: RollingMinKernel(10),
+        lambda h, l, c: (l,),
+        lambda h, l, c: pd.Series(l).rolling(10).min().to_numpy(),
+    ),
+    "stddev": (
+        lambda: StdDevKernel(20, ddof=1),
+        lambda h, l, c: (c,),
+        lambda h, l, c: pd.Series(c).rolling(20).std(ddof=1).to_numpy(),
+    ),
+    "rsi": (lambda: RSIKernel(14), lambda h, l, c: (c,), lambda h, l, c: ref_rsi(c)),
+    "macd": (MACDKernel, lambda h, l, c: (c,), lambda h, l, c: ref_macd(c)),
+    "stoch": (
+        lambda: StochKernel(14, 3, 3),
+        lambda h, l, c: (h, l, c),
+        ref_stoch,
+    ),
+    "atr": (lambda: ATRKernel(14), lambda h, l, c: (h, l, c), ref_atr),
+    "bollinger": (
+        BollingerKernel,
+        lambda h, l, c: (c,),
+        lambda h, l, c: ref_bollinger(c),
+    ),
+}
+
+
+def _outputs(result) -> list[np.ndarray]:
+    "Kernel output as a list of arrays, one per output"
+    if isinstance(result, tuple):
+        return [np.asarray(r, dtype=float) for r in result]
+    if len(result) > 0 and isinstance(result[0], tuple):
+        return [np.asarray(r, dtype=float) for r in zip(*result)]
+    return [np.asarray(result, dtype=float)]
+
+
+def _assert_equal(result, expected):
+    expected = expected if isinstance(expected, tuple) else (expected,)
+    result = _outputs(result)
+    assert len(result) == len(expected)
+    for res, exp in zip(result, expected):
+        np.testing.assert_allclose(res, exp, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_set(name, ohlc):
+    factory, inputs, reference = CASES[name]
+    _assert_equal(factory().set(*inputs(*ohlc)), reference(*ohlc))
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_update_from_empty(name, ohlc, stream):
+    factory, inputs, reference = CASES[name]
+    _assert_equal(stream(factory(), *inputs(*ohlc), revise=False), reference(*ohlc))
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_update_with_revisions(name, ohlc, stream):
+    factory, inputs, reference = CASES[name]
+    _assert_equal(stream(factory(), *inputs(*ohlc)), reference(*ohlc))
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_update_after_set(name, ohlc, stream):
+    factory, inputs, reference = CASES[name]
+    kernel, values = factory(), inputs(*ohlc)
+    kernel.set(*(v[:150] for v in values))
+    expected = reference(*ohlc)
+    expected = expected if isinstance(expected, tuple) else (expected,)
+    _assert_equal(stream(kernel, *values, start=150), tuple(e[150:] for e in expected))
+
+
+def test_atr_missing_low_matches_set():
+    high = np.array([11.0, 12.0, 13.0, 12.5])
+    low = np.array([9.0, 10.0, np.nan, 11.0])
+    close = np.array([10.0, 11.0, 12.0, 12.0])
+    vectorized = ATRKernel(2).set(high, low, close)
+
+    kernel = ATRKernel(2)
+    streamed = [kernel.update(h, l, c, True) for h, l, c in zip(high, low, close)]
+    np.testing.assert_allclose(streamed, vectorized)
+    assert not np.isnan(streamed[2])
@@ -0,0 +1,65 @@
+""" SMA, EMA, & RMA Kernels against their pandas equivalents """
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightweight_pycharts.indicators.kernels import EMAKernel, RMAKernel, SMAKernel
+
+
+def reference(kernel_cls, period: int, values: np.ndarray) -> np.ndarray:
+    series = pd.Series(values)
+    if kernel_cls is SMAKernel:
+        return series.rolling(period).mean().to_numpy()
+    alpha = 2 / (period + 1) if kernel_cls is EMAKernel else 1 / period
+    ewm = series.ewm(alpha=alpha, adjust=False, ignore_na=True, min_periods=period)
+    return ewm.mean().to_numpy()
+
+
+KERNELS = [SMAKernel, EMAKernel, RMAKernel]
+PERIODS = [1, 9, 20]
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+@pytest.mark.parametrize("period", PERIODS)
+def test_set(kernel_cls, period, prices):
+    result = kernel_cls(period).set(prices)
+    np.testing.assert_allclose(result, reference(kernel_cls, period, prices))
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+@pytest.mark.parametrize("period", PERIODS)
+def test_update_from_empty(kernel_cls, period, prices, stream):
+    result = stream(kernel_cls(period), prices, revise=False)
+    np.testing.assert_allclose(result, reference(kernel_cls, period, prices))
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+@pytest.mark.parametrize("period", PERIODS)
+def test_update_with_revisions(kernel_cls, period, prices, stream):
+    result = stream(kernel_cls(period), prices)
+    np.testing.assert_allclose(result, reference(kernel_cls, period, prices))
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+@pytest.mark.parametrize("period", PERIODS)
+def test_update_after_set(kernel_cls, period, prices, stream):
+    kernel = kernel_cls(period)
+    kernel.set(prices[:150])
+    result = stream(kernel, prices, start=150)
+    np.testing.assert_allclose(result, reference(kernel_cls, period, prices)[150:])
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+def test_nan_revision_is_undone(kernel_cls, prices):
+    kernel = kernel_cls(5)
+    kernel.set(prices[:100])
+    expected = kernel.update(1.5, True)
+    kernel.update(np.nan, False)
+    assert kernel.update(1.5, False) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("kernel_cls", KERNELS)
+def test_invalid_period(kernel_cls):
+    with pytest.raises(ValueError):
+        kernel_cls(0)
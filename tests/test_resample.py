@@ -0,0 +1,162 @@
+""" Local Resampling of a base resolution feed against pandas.resample """
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightweight_pycharts.orm.calendars import get_calendar, schedule
+from lightweight_pycharts.orm.resample import AGGREGATIONS, Resampler
+from lightweight_pycharts.orm.series import OhlcData, Series_DF
+from lightweight_pycharts.orm.types import TF, Symbol
+
+# region ---------------- Data ----------------
+
+
+def _ohlcv(index: pd.DatetimeIndex) -> pd.DataFrame:
+    "Random OHLCV bars at the given times"
+    rng = np.random.default_rng(3)
+    close = 100 + rng.normal(size=len(index)).cumsum()
+    open_ = close + rng.normal(scale=0.5, size=len(index))
+    spread = rng.uniform(0, 1, size=len(index))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.integers(1, 1000, size=len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+def _session_times(market_times: list[str]) -> pd.DatetimeIndex:
+    "1 Minute bar times of each NYSE session from Jan 3rd through Feb 9th 2024"
+    sched = schedule(
+        get_calendar("NYSE"),  # type: ignore
+        pd.Timestamp("2024-01-03"),
+        pd.Timestamp("2024-02-09"),
+        market_times,
+    )
+    sessions = [
+        pd.date_range(start, end, freq="1min", inclusive="left")
+        for start, end in zip(sched[market_times[0]], sched[market_times[1]])
+    ]
+    return sessions[0].append(sessions[1:])
+
+
+# Name: (exchange, base timeframe, extended hours, bar times)
+DATASETS = {
+    # 1 Hour bars from a Monday to a Saturday over two years later
+    "24/7": (
+        None,
+        TF(1, "h"),
+        False,
+        lambda: pd.date_range("2023-11-27", "2026-01-10", freq="1h", tz="UTC"),
+    ),
+    # Regular Trading Hours, 14:30 - 21:00 UTC. Starts with stray bars before the first open,
+    # they belong to the prior session
+    "rth": (
+        "NYSE",
+        TF(1, "m"),
+        False,
+        lambda: pd.date_range(
+            "2024-01-03 13:00", periods=90, freq="1min", tz="UTC"
+        ).append(_session_times(["market_open", "market_close"])),
+    ),
+    # Extended Trading Hours, 09:00 - 01:00 UTC. Sessions cross midnight UTC
+    "eth": ("NYSE", TF(1, "m"), True, lambda: _session_times(["pre", "post"])),
+}
+
+
+@pytest.fixture(params=DATASETS)
+def dataset(request) -> tuple[str, pd.DataFrame]:
+    return request.param, _ohlcv(DATASETS[request.param][3]())
+
+
+def _base(name: str, df: pd.DataFrame) -> Series_DF:
+    exchange, timeframe, ext, _ = DATASETS[name]
+    return Series_DF.from_normalized(
+        df, exchange, timeframe, pd.Timedelta(seconds=timeframe.unix_len), ext=ext
+    )
+
+
+# endregion
+
+# region ---------------- Reference ----------------
+
+# Time of each dataset's session open. Daily & longer bars are labeled by session date so the
+# times are shifted back by it before binning
+SESSION_OPEN = {"24/7": "0h", "rth": "14h30min", "eth": "9h"}
+
+# Timeframe string: {dataset: pandas.resample() arguments}, Defaults to the "24/7" arguments
+REFERENCE_ARGS = {
+    "5m": {"24/7": {"rule": "5min"}},
+    "1h": {"24/7": {"rule": "1h"}, "rth": {"rule": "1h", "offset": "30min"}},
+    "4h": {
+        "24/7": {"rule": "4h"},
+        "rth": {"rule": "4h", "origin": "start_day", "offset": "14h30min"},
+        "eth": {"rule": "4h", "origin": "start_day", "offset": "9h"},
+    },
+    "1D": {"24/7": {"rule": "D"}},
+    "2D": {"24/7": {"rule": "2D", "origin": "epoch"}},
+    # Weeks start on Mondays, Multiples of weeks count from the Monday before the Epoch
+    "1W": {"24/7": {"rule": "W-MON", "label": "left", "closed": "left"}},
+    "2W": {"24/7": {"rule": "14D", "origin": pd.Timestamp("1969-12-29", tz="UTC")}},
+    "1M": {"24/7": {"rule": "MS"}},
+    "3M": {"24/7": {"rule": "QS-JAN"}},
+    "1Y": {"24/7": {"rule": "YS"}},
+}
+
+
+def _reference(name: str, df: pd.DataFrame, timeframe: TF) -> pd.DataFrame:
+    "The bars aggregated by pandas.resample() with empty bins dropped"
+    args = REFERENCE_ARGS[timeframe.toString]
+    kwargs = dict(args.get(name, args["24/7"]))
+    if timeframe.period in ("D", "W", "M", "Y"):
+        df = df.set_axis(df.index - pd.Timedelta(SESSION_OPEN[name]))
+    resampled = df.resample(**kwargs).agg({col: AGGREGATIONS[col] for col in df})
+    return resampled.dropna(subset=["open"])
+
+
+# endregion
+
+
+@pytest.mark.parametrize("tf_str", REFERENCE_ARGS)
+def test_derive(dataset, tf_str):
+    name, df = dataset
+    timeframe = TF.fromString(tf_str)
+    base = _base(name, df)
+    if not Resampler.can_resample(base.timeframe, timeframe):
+        pytest.skip(f"{base.timeframe} cannot be resampled into {timeframe}")
+
+    derived = Resampler(base, Symbol("TEST")).derive(timeframe)
+    pd.testing.assert_frame_equal(
+        derived.df, _reference(name, df, timeframe), check_freq=False
+    )
+    assert derived.only_days == (timeframe.period in ("D", "W", "M", "Y"))
+
+
+@pytest.mark.parametrize("accumulate", [False, True])
+@pytest.mark.parametrize("tf_str", ["4h", "1D", "1W"])
+def test_update(dataset, tf_str, accumulate):
+    name, df = dataset
+    timeframe = TF.fromString(tf_str)
+    split = len(df) - 1500
+    resampler = Resampler(_base(name, df.iloc[:split]), Symbol("TEST"))
+    derived = resampler.derive(timeframe)
+
+    for time, bar in df.iloc[split:].iterrows():
+        # Each bar opens with a third of its volume then a tick revises it to its final state
+        opening = bar.volume / 3
+        resampler.update(
+            OhlcData(time, bar.open, bar.open, bar.open, bar.open, opening)
+        )
+        volume = bar.volume - opening if accumulate else bar.volume
+        tick = OhlcData(time, bar.open, bar.high, bar.low, bar.close, volume)
+        resampler.update(tick, accumulate=accumulate)
+
+    pd.testing.assert_frame_equal(resampler.base.df, df, check_freq=False)
+    pd.testing.assert_frame_equal(
+        derived.df, _reference(name, df, timeframe), check_freq=False
+    )
@@ -0,0 +1,312 @@
+""" Anchored VWAP, its Kernel, & the session bounds it restarts at, against pandas references """
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import lightweight_pycharts as lwc
+from lightweight_pycharts.indicators import VWAP
+from lightweight_pycharts.indicators.kernels import VWAPKernel
+from lightweight_pycharts.indicators.vwap import VWAPOptions
+from lightweight_pycharts.orm.calendars import SessionBounds, get_calendar, schedule
+from lightweight_pycharts.orm.resample import period_labels
+from lightweight_pycharts.orm.series import OhlcData
+from lightweight_pycharts.orm.types import TF
+
+UTC = lambda time: pd.Timestamp(time, tz="UTC").value  # noqa: E731
+
+# region ---------------- Data ----------------
+
+
+def _rth_times(start: str, end: str) -> pd.DatetimeIndex:
+    "1 Minute bar times of each NYSE Regular Trading Hours session between the given dates"
+    sched = schedule(
+        get_calendar("NYSE"),  # type: ignore
+        pd.Timestamp(start),
+        pd.Timestamp(end),
+        ["market_open", "market_close"],
+    )
+    sessions = [
+        pd.date_range(start, end, freq="1min", inclusive="left")
+        for start, end in zip(sched["market_open"], sched["market_close"])
+    ]
+    return sessions[0].append(sessions[1:])
+
+
+def _ohlcv(index: pd.DatetimeIndex) -> pd.DataFrame:
+    "Random OHLCV bars at the given times"
+    rng = np.random.default_rng(7)
+    close = 100 + rng.normal(size=len(index)).cumsum()
+    spread = rng.uniform(0, 1, size=len(index))
+    return pd.DataFrame(
+        {
+            "open": close + spread * rng.uniform(-1, 1, size=len(index)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(1, 1000, size=len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+def _reference(df: pd.DataFrame, anchors: pd.Series, mult: float) -> pd.DataFrame:
+    "VWAP & bands of the HLC3 with the running sums of each anchor period from a pandas groupby"
+    price = (df["high"] + df["low"] + df["close"]) / 3
+    sums = (
+        pd.DataFrame(
+            {
+                "v": df["volume"],
+                "pv": price * df["volume"],
+                "pv2": price * price * df["volume"],
+            }
+        )
+        .groupby(anchors.to_numpy())
+        .cumsum()
+    )
+    vwap = sums["pv"] / sums["v"]
+    stdev = np.sqrt(np.maximum(sums["pv2"] / sums["v"] - vwap**2, 0.0))
+    return pd.DataFrame(
+        {"vwap": vwap, "upper": vwap + mult * stdev, "lower": vwap - mult * stdev}
+    )
+
+
+def _ny_dates(index: pd.DatetimeIndex) -> pd.Series:
+    "The New York date of each time, the session of each Regular Trading Hours bar"
+    return pd.Series(index.tz_convert("America/New_York").date, index=index)
+
+
+# endregion
+
+# region ---------------- VWAPKernel ----------------
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    "Three days of 1 Hour bars, with a missing price & a missing volume"
+    df = _ohlcv(pd.date_range("2024-01-02", periods=72, freq="1h", tz="UTC"))
+    df.iloc[5, df.columns.get_loc("close")] = np.nan
+    df.iloc[30, df.columns.get_loc("volume")] = np.nan
+    return df
+
+
+def _price(df: pd.DataFrame) -> np.ndarray:
+    return ((df["high"] + df["low"] + df["close"]) / 3).to_numpy()
+
+
+def _kernel_reference(df: pd.DataFrame, anchors: np.ndarray) -> pd.DataFrame:
+    "Reference of bars where a missing price or volume carries no weight"
+    df = df.copy()
+    df.loc[df[["close", "volume"]].isna().any(axis=1), "volume"] = 0.0
+    df = df.fillna(0.0)
+    return _reference(df, pd.Series(anchors), 1.0)
+
+
+def test_kernel_set(bars):
+    anchors = bars.index.normalize().asi8
+    vwap, stdev = VWAPKernel().set(_price(bars), bars["volume"].to_numpy(), anchors)
+
+    ref = _kernel_reference(bars, anchors)
+    np.testing.assert_allclose(vwap, ref["vwap"])
+    np.testing.assert_allclose(vwap + stdev, ref["upper"])
+
+
+def test_kernel_update(bars):
+    anchors = bars.index.normalize().asi8
+    price, volume = _price(bars), bars["volume"].to_numpy()
+    ref = _kernel_reference(bars, anchors)
+
+    # History ends mid-day, the remaining bars include two anchor resets
+    kernel, split = VWAPKernel(), 10
+    kernel.set(price[:split], volume[:split], anchors[:split])
+    for i in range(split, len(bars)):
+        reset = anchors[i] != anchors[i - 1]
+        # Each bar opens with a partial volume then a tick revises it to its final state
+        kernel.update(price[i] + 1.0, volume[i] / 2, True, reset)
+        vwap, stdev = kernel.update(price[i], volume[i], False)
+        assert vwap == pytest.approx(ref["vwap"].iloc[i], nan_ok=True)
+        assert vwap + stdev == pytest.approx(ref["upper"].iloc[i], nan_ok=True)
+
+
+def test_kernel_no_volume():
+    vwap, stdev = VWAPKernel().set(
+        np.array([1.0, 2.0]), np.array([0.0, np.nan]), np.array([0, 0])
+    )
+    assert np.isnan(vwap).all() and np.isnan(stdev).all()
+    kernel = VWAPKernel()
+    assert all(np.isnan(kernel.update(1.0, 0.0, True)))
+    assert kernel.update(2.0, 5.0, False) == (2.0, 0.0)
+
+
+# endregion
+
+# region ---------------- SessionBounds ----------------
+
+
+@pytest.mark.parametrize(
+    "ext, by_date, time, expected",
+    [
+        # Mid session, before the open, & at the open of a Regular Trading Hours Session
+        (False, False, "2024-01-02 15:00", "2024-01-03 14:30"),
+        (False, False, "2024-01-03 10:00", "2024-01-03 14:30"),
+        (False, False, "2024-01-03 14:30", "2024-01-04 14:30"),
+        # Friday, across a weekend & the MLK Day holiday
+        (False, False, "2024-01-12 20:00", "2024-01-16 14:30"),
+        (False, True, "2024-01-12", "2024-01-16"),
+        # Extended hours open at 4:00 New York time
+        (True, False, "2024-01-02 15:00", "2024-01-03 09:00"),
+        (True, False, "2024-01-05 23:00", "2024-01-08 09:00"),
+        # Daylight savings time
+        (False, False, "2024-03-08 20:00", "2024-03-11 13:30"),
+    ],
+)
+def test_next_start(ext, by_date, time, expected):
+    sessions = SessionBounds(get_calendar("NYSE"), ext)
+    assert sessions.ext == ext
+    assert sessions.next_start(UTC(time), by_date) == UTC(expected)
+
+
+def test_next_start_extends_range():
+    sessions = SessionBounds(get_calendar("NYSE"))
+    assert sessions.next_start(UTC("2024-01-02 15:00")) == UTC("2024-01-03 14:30")
+    # Well beyond the padded range of the first call
+    assert sessions.next_start(UTC("2024-06-14 15:00")) == UTC("2024-06-17 13:30")
+    assert sessions.next_start(UTC("2023-06-30 15:00")) == UTC("2023-07-03 13:30")
+
+
+def test_next_start_always_open():
+    sessions = SessionBounds(get_calendar(None))
+    assert sessions.always_open
+    assert sessions.next_start(UTC("2024-01-02 15:00")) == UTC("2024-01-03")
+    assert sessions.next_start(UTC("2024-01-03")) == UTC("2024-01-04")
+
+
+# endregion
+
+# region ---------------- period_labels ----------------
+
+# Timeframe string: period of the session date each bar's label is the start of
+DATE_PERIODS = {"1D": "D", "1W": "W-SUN", "1M": "M", "3M": "Q", "1Y": "Y"}
+
+
+@pytest.fixture(scope="module")
+def session_bars() -> pd.DataFrame:
+    """
+    NYSE RTH 1 Minute bar times, plus bars from before the open on Jan 4th that belong to the
+    Jan 3rd session, mapped to the open & date of their session by pandas.merge_asof
+    """
+    stray = pd.date_range("2024-01-04 13:00", periods=90, freq="1min", tz="UTC")
+    times = _rth_times("2023-12-20", "2024-04-10").append(stray).sort_values()
+    sched = schedule(
+        get_calendar("NYSE"),  # type: ignore
+        pd.Timestamp("2023-12-01"),
+        pd.Timestamp("2024-04-30"),
+        ["market_open", "market_close"],
+    )
+    opens = pd.DataFrame(
+        {"open": sched["market_open"].dt.tz_convert("UTC"), "date": sched.index}
+    )
+    return pd.merge_asof(
+        pd.DataFrame({"time": times}),
+        opens.sort_values("open"),
+        left_on="time",
+        right_on="open",
+    )
+
+
+@pytest.mark.parametrize("tf_str", ["30m", "1h", "4h", *DATE_PERIODS])
+def test_period_labels(session_bars, tf_str):
+    timeframe = TF.fromString(tf_str)
+    times = pd.DatetimeIndex(session_bars["time"]).asi8
+    opens, days = SessionBounds(get_calendar("NYSE")).locate(times)
+    np.testing.assert_array_equal(opens, pd.DatetimeIndex(session_bars["open"]).asi8)
+
+    if tf_str in DATE_PERIODS:
+        dates = pd.DatetimeIndex(session_bars["date"])
+        expected = dates.to_period(DATE_PERIODS[tf_str]).start_time
+    else:
+        since_open = session_bars["time"] - session_bars["open"]
+        expected = session_bars["open"] + since_open.dt.floor(
+            tf_str.replace("m", "min")
+        )
+        expected = pd.DatetimeIndex(expected).tz_localize(None)
+    labels = period_labels(times, opens, days, timeframe)
+    np.testing.assert_array_equal(labels, expected.as_unit("ns").asi8)
+
+    # Each label's bars form a single contiguous run, as a groupby of the labels would find
+    groups = pd.Series(labels).groupby(labels).indices
+    assert all(np.all(np.diff(rows) == 1) for rows in groups.values())
+
+
+# endregion
+
+# region ---------------- VWAP Indicator ----------------
+
+
+def _with_frame(test):
+    "Run test(frame, df) against a Frame displaying NYSE RTH bars from Jan 2nd through 4th 2024"
+
+    async def _main():
+        window = lwc.Window(headless=True)
+        frame = list(window.new_tab().frames.values())[0]
+        df = _ohlcv(_rth_times("2024-01-02", "2024-01-05"))
+        try:
+            test(frame, df)
+        finally:
+            window.close()
+            await window.await_close()
+
+    asyncio.run(_main())
+
+
+def _stream(frame, df: pd.DataFrame):
+    "Apply each bar as an opening tick followed by a tick that revises it to its final state"
+    for time, bar in df.iterrows():
+        frame.main_series.update_data(
+            OhlcData(time, bar.open, bar.open, bar.open, bar.open, bar.volume / 2)
+        )
+        frame.main_series.update_data(
+            OhlcData(time, bar.open, bar.high, bar.low, bar.close, bar.volume)
+        )
+
+
+def test_vwap_across_session_opens():
+    def _test(frame, df):
+        # History ends 30 minutes before the Jan 3rd close. Updates cross the Jan 4th open
+        split = df.index.get_loc(pd.Timestamp("2024-01-03 20:30", tz="UTC"))
+        symbol = lwc.Symbol("TEST", exchange="NYSE")
+        frame.main_series.set_data(
+            df.iloc[:split].reset_index(names="time"), symbol=symbol
+        )
+        vwap = VWAP(frame, VWAPOptions(mult=2.0))
+
+        ref = _reference(df, _ny_dates(df.index), 2.0)
+        pd.testing.assert_frame_equal(vwap._data.df, ref.iloc[:split], check_freq=False)
+        _stream(frame, df.iloc[split:])
+        pd.testing.assert_frame_equal(vwap._data.df, ref, check_freq=False)
+
+    _with_frame(_test)
+
+
+def test_vwap_updates_without_set():
+    def _test(frame, df):
+        split = df.index.get_loc(pd.Timestamp("2024-01-03 20:30", tz="UTC"))
+        history = df.iloc[:split].reset_index(names="time")
+        frame.main_series.set_data(history, symbol=lwc.Symbol("TEST", exchange="NYSE"))
+        vwap = VWAP(frame)
+        vwap.clear_data()
+        assert vwap._sessions is None
+
+        # The session bounds are built from the source's data by the first update
+        updates = df.iloc[split:]
+        _stream(frame, updates)
+        ref = _reference(updates, _ny_dates(updates.index), 1.0)
+        pd.testing.assert_frame_equal(vwap._data.df, ref, check_freq=False)
+        assert vwap._sessions is not None
+
+    _with_frame(_test)
+
+
+# endregion
@@ -0,0 +1,164 @@
+""" Zero-copy WindowedSeries views & the windowed_source() wrapper of pd.Series outputs """
+
+from math import isnan
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lightweight_pycharts.indicator import windowed_source
+from lightweight_pycharts.orm.series import BarStore, WindowedSeries
+
+INDEX = pd.date_range("2024-01-02 14:30", periods=10, freq="1min", tz="UTC")
+NEXT_TIME = pd.Timestamp("2024-01-02 14:40", tz="UTC")
+
+
+@pytest.fixture
+def store() -> BarStore:
+    "Ten bars with closes 0 through 9"
+    return BarStore(pd.DataFrame({"close": np.arange(10, dtype=float)}, index=INDEX))
+
+
+# region ---------------- WindowedSeries ----------------
+
+
+def test_unbounded_indexing(store):
+    view = WindowedSeries(store, "close")
+    assert len(view) == 10
+    assert view[0] == 0.0 and view[9] == 9.0
+    assert view[-1] == 9.0 and view[-10] == 0.0
+    np.testing.assert_array_equal(view[2:5], [2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(view.values, np.arange(10.0))
+    assert view.iat[-2] == 8.0
+    with pytest.raises(IndexError):
+        _ = view[10]
+    with pytest.raises(IndexError):
+        _ = view[-11]
+
+
+def test_window_bounds(store):
+    view = WindowedSeries(store, "close", length=3)
+    assert len(view) == 3
+    assert view[0] == 7.0 and view[2] == 9.0
+    assert view[-1] == 9.0 and view[-3] == 7.0
+    np.testing.assert_array_equal(view[:], [7.0, 8.0, 9.0])
+    np.testing.assert_array_equal(view[::-1], [9.0, 8.0, 7.0])
+    np.testing.assert_array_equal(view.tail(2), [8.0, 9.0])
+    np.testing.assert_array_equal(view.tail(5), [7.0, 8.0, 9.0])
+    assert len(view.tail(0)) == 0
+    assert view.index.equals(INDEX[-3:])
+    pd.testing.assert_series_equal(
+        view.to_series(), store.df["close"].iloc[-3:], check_freq=False
+    )
+    # Indices beyond either end of the window, not just beyond the stored values, are invalid
+    for key in (3, -4, -10):
+        with pytest.raises(IndexError):
+            _ = view[key]
+
+
+def test_length_edge_cases(store):
+    longer = WindowedSeries(store, "close", length=20)
+    assert len(longer) == 10 and longer[0] == 0.0 and longer[-10] == 0.0
+
+    exact = WindowedSeries(store, "close", length=10)
+    assert len(exact) == 10 and exact[0] == 0.0
+
+    empty = WindowedSeries(store, "close", length=0)
+    assert len(empty) == 0 and len(empty.values) == 0
+    assert isnan(empty.ago(0))
+    with pytest.raises(IndexError):
+        _ = empty[0]
+    with pytest.raises(IndexError):
+        _ = empty[-1]
+
+
+def test_missing_column(store):
+    view = WindowedSeries(store, "open")
+    assert len(view) == 0 and isnan(view.ago())
+    assert len(view.index) == 0
+    with pytest.raises(IndexError):
+        _ = view[0]
+
+    # The view becomes valid once the column exists
+    store.append(NEXT_TIME, {"close": 10.0, "open": 9.5})
+    assert len(view) == 11 and view.ago(0) == 9.5 and isnan(view.ago(1))
+
+
+def test_ago(store):
+    view = WindowedSeries(store, "close", length=4)
+    assert [view.ago(n) for n in range(4)] == [9.0, 8.0, 7.0, 6.0]
+    assert view.ago() == 9.0
+    assert isnan(view.ago(4)) and isnan(view.ago(-1))
+
+
+def test_view_follows_store(store):
+    view = WindowedSeries(store, "close", length=3)
+    values = view.values
+    store.update_last({"close": 42.0})
+    assert view.ago(0) == 42.0 and values[-1] == 42.0
+
+    # Growing the store reallocates its arrays, the view reads from the new ones
+    capacity = store.capacity
+    times = pd.date_range(NEXT_TIME, periods=capacity, freq="1min")
+    for i, time in enumerate(times):
+        store.append(time, {"close": 100.0 + i})
+    assert store.capacity > capacity
+    np.testing.assert_array_equal(
+        view.values, 100.0 + np.arange(capacity - 3, capacity)
+    )
+    assert view.index[-1] == store.last_time
+
+
+# endregion
+
+# region ---------------- windowed_source ----------------
+
+
+class Output:
+    "Stand-in for an Indicator with a pd.Series output property & no zero-copy view of it"
+
+    def __init__(self, series: pd.Series):
+        self.series = series
+        self.calls = 0
+
+    def out(self) -> pd.Series:
+        self.calls += 1
+        return self.series
+
+    def __windowed_output__(self, _name: str):
+        return None
+
+
+def test_windowed_source_tracks_series():
+    src = Output(pd.Series(np.arange(10.0), index=INDEX))
+    source = windowed_source(src.out)
+    view = source()
+    np.testing.assert_array_equal(view.values, np.arange(10.0))
+
+    # Revising the last value & appending a bar are applied to the same store
+    src.series.iat[-1] = 42.0
+    assert source() is view and view.ago(0) == 42.0
+    src.series = pd.concat([src.series, pd.Series([10.0], index=[NEXT_TIME])])
+    assert source() is view
+    assert len(view) == 11 and view.ago(0) == 10.0 and view.ago(1) == 42.0
+    assert view.index[-1] == NEXT_TIME
+
+    # A series that's rewritten, rather than extended, is copied anew
+    src.series = pd.Series(np.ones(3), index=INDEX[:3])
+    rewritten = source()
+    assert rewritten is not view
+    np.testing.assert_array_equal(rewritten.values, np.ones(3))
+    assert src.calls == 4
+
+
+def test_windowed_source_prefers_owned_view(store):
+    class Owned(Output):
+        def __windowed_output__(self, name: str):
+            return WindowedSeries(store, "close") if name == "out" else None
+
+    src = Owned(pd.Series(dtype=float))
+    view = windowed_source(src.out)()
+    assert view.ago(0) == 9.0 and src.calls == 0
+
+
+# endregion